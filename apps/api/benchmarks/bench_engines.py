@@ -0,0 +1,277 @@
+"""Synthetic-load benchmarks for the planner and availability engines.
+
+Run from apps/api (offline; upstream calls go to `httpx.MockTransport`):
+
+    python -m benchmarks.bench_engines [--quick] [--only planner] [--update-baseline]
+
+Cases:
+
+- planner/N×M×K: `DefaultPlannerEngine.generate_plan_v1` on seeded requests
+  with N titles, M services and K inputs (see `benchmarks.generators`);
+  `planner-min-cost/...` adds `plan_objective: min_cost` (up to 1k titles).
+- golden/...: the golden scenarios (docs/technical/15-Golden-Scenarios.md),
+  checked against their documented outcome before being timed.
+- availability/R×P: `DefaultAvailabilityEngine.assess_tmdb_tv_watch_providers_v1`
+  on a seeded watch-provider payload with R regions of P offers each, for one
+  region and for all of them.
+- catalog/S×R×P/{v1,columnar}: assessing S series (R regions of P offers
+  each, all regions) one `assess_tmdb_tv_watch_providers_v1` call at a time
+  versus one `assess_tmdb_payloads_columnar` pass over the same payloads, as
+  the catalog refresh does. Both include decoding the JSON bodies.
+
+Each case reports throughput, p50/p99 latency and the tracemalloc peak of one
+call (measured in a separate, untimed call). Results are compared with
+`benchmarks/baseline.json`: a p50 slower than the baseline by more than
+`--tolerance`, or a peak above it by more than `--memory-tolerance`, is a
+regression and the command exits 1. Timings are machine dependent; refresh
+the baseline with `--update-baseline` when the reference machine changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import gc
+import json
+import math
+from pathlib import Path
+import time
+import tracemalloc
+from typing import Any
+
+import httpx
+
+from benchmarks import golden
+from benchmarks.generators import NOW, planner_request, watch_providers_payload
+from psma_api.engines.availability_columnar import assess_tmdb_payloads_columnar
+from psma_api.engines.availability_engine_impl import DefaultAvailabilityEngine
+from psma_api.engines.availability_v1 import assess_tmdb_tv_watch_providers_v1
+from psma_api.engines.planner_engine_impl import DefaultPlannerEngine
+
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    call: Callable[[], Awaitable[Any]]
+    iterations: int
+
+
+def _planner_cases(*, quick: bool) -> list[Case]:
+    engine = DefaultPlannerEngine()
+    sizes = [(50, 5, 10, 200), (1_000, 20, 100, 30), (20_000, 40, 400, 5)]
+    if quick:
+        sizes = [(50, 5, 10, 20), (1_000, 20, 100, 3)]
+    cases: list[Case] = []
+    for titles, services, inputs, iterations in sizes:
+        # min_cost targets household-sized requests; at 20k titles it takes seconds per plan.
+        for min_cost in (False, True) if titles <= 1_000 else (False,):
+            request = planner_request(titles=titles, services=services, inputs=inputs, seed=titles, min_cost=min_cost)
+
+            async def call(request: Any = request) -> Any:
+                return await engine.generate_plan_v1(request, now=NOW)
+
+            prefix = "planner-min-cost" if min_cost else "planner"
+            cases.append(Case(f"{prefix}/{titles}x{services}x{inputs}", call, iterations))
+    return cases
+
+
+def _golden_cases(*, quick: bool) -> list[Case]:
+    cases: list[Case] = []
+    for scenario in golden.scenarios():
+        scenario.check(scenario.run())
+
+        async def call(run: Callable[[], Any] = scenario.run) -> Any:
+            return run()
+
+        cases.append(Case(scenario.name, call, 50 if quick else 500))
+    return cases
+
+
+def _availability_cases(*, quick: bool) -> list[Case]:
+    engine = DefaultAvailabilityEngine()
+    sizes = [(10, 10, 200), (120, 60, 30)]
+    if quick:
+        sizes = [(10, 10, 20), (120, 60, 3)]
+    cases: list[Case] = []
+    for regions, providers, iterations in sizes:
+        body = watch_providers_payload(regions=regions, providers=providers, seed=regions)
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request, body=body: httpx.Response(
+                    200, content=body, headers={"content-type": "application/json"}
+                )
+            )
+        )
+        for country in ("US", "*"):
+
+            async def call(client: httpx.AsyncClient = client, country: str = country) -> Any:
+                return await engine.assess_tmdb_tv_watch_providers_v1(
+                    series_id=1, country=country, api_key="bench", client=client
+                )
+
+            label = "all" if country == "*" else country
+            cases.append(Case(f"availability/{regions}x{providers}/{label}", call, iterations))
+    return cases
+
+
+def _catalog_cases(*, quick: bool) -> list[Case]:
+    sizes = [(50, 10, 10, 20), (500, 20, 10, 3)]
+    if quick:
+        sizes = [(50, 10, 10, 3)]
+    cases: list[Case] = []
+    for series, regions, providers, iterations in sizes:
+        bodies = {
+            series_id: watch_providers_payload(regions=regions, providers=providers, seed=series_id)
+            for series_id in range(1, series + 1)
+        }
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request, bodies=bodies: httpx.Response(
+                    200,
+                    content=bodies[int(request.url.path.split("/")[3])],
+                    headers={"content-type": "application/json"},
+                )
+            )
+        )
+
+        async def v1(client: httpx.AsyncClient = client, bodies: dict[int, bytes] = bodies) -> Any:
+            return [
+                await assess_tmdb_tv_watch_providers_v1(series_id=series_id, country="*", api_key="bench", client=client)
+                for series_id in bodies
+            ]
+
+        async def columnar(bodies: dict[int, bytes] = bodies) -> Any:
+            payloads = [(series_id, json.loads(body)) for series_id, body in bodies.items()]
+            return assess_tmdb_payloads_columnar(payloads, regions=None, retrieved_at=NOW)
+
+        label = f"catalog/{series}x{regions}x{providers}"
+        cases.append(Case(f"{label}/v1", v1, iterations))
+        cases.append(Case(f"{label}/columnar", columnar, iterations))
+    return cases
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    # Nearest-rank percentile.
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def measure(case: Case) -> dict[str, float]:
+    await case.call()  # warm-up (imports, registry load, validator caches)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        await case.call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Start each case from a clean heap so one case's garbage isn't collected in the next one's timings.
+    gc.collect()
+    timings: list[float] = []
+    started = time.perf_counter()
+    for _ in range(max(1, case.iterations)):
+        t0 = time.perf_counter()
+        await case.call()
+        timings.append(time.perf_counter() - t0)
+    total = time.perf_counter() - started
+    timings.sort()
+    return {
+        "ops_per_s": round(len(timings) / total, 2),
+        "p50_ms": round(_percentile(timings, 50) * 1000, 3),
+        "p99_ms": round(_percentile(timings, 99) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+GROUPS: dict[str, Callable[..., list[Case]]] = {
+    "planner": _planner_cases,
+    "golden": _golden_cases,
+    "availability": _availability_cases,
+    "catalog": _catalog_cases,
+}
+
+
+async def run(*, quick: bool = False, only: str | None = None) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for group, build in GROUPS.items():
+        if only is not None and group != only:
+            continue
+        for case in build(quick=quick):
+            results[case.name] = await measure(case)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    *,
+    tolerance: float,
+    memory_tolerance: float,
+) -> list[str]:
+    """Regression messages for cases slower or bigger than the baseline allows."""
+
+    regressions: list[str] = []
+    for name, row in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if row["p50_ms"] > base["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {row['p50_ms']:.3f} ms > baseline {base['p50_ms']:.3f} ms")
+        if row["peak_kib"] > base["peak_kib"] * (1 + memory_tolerance):
+            regressions.append(f"{name}: peak {row['peak_kib']:.1f} KiB > baseline {base['peak_kib']:.1f} KiB")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_engines")
+    parser.add_argument("--quick", action="store_true", help="Fewer sizes and iterations (smoke run).")
+    parser.add_argument("--only", choices=sorted(GROUPS))
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed p50 slowdown (0.5 = +50%%).")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2, help="Allowed peak-memory growth.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table.")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(quick=args.quick, only=args.only))
+
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+    else:
+        print(f"{'case':<40} {'ops/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'peak KiB':>10}")
+        for name, row in results.items():
+            print(
+                f"{name:<40} {row['ops_per_s']:>10.1f} {row['p50_ms']:>10.3f} "
+                f"{row['p99_ms']:>10.3f} {row['peak_kib']:>10.1f}"
+            )
+
+    if args.update_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    regressions = compare(
+        results,
+        json.loads(args.baseline.read_text()),
+        tolerance=args.tolerance,
+        memory_tolerance=args.memory_tolerance,
+    )
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,169 @@
+"""Per-request CPU cost of FastAPI's response_model path vs ModelJSONResponse.
+
+Run from apps/api:
+
+    python -m benchmarks.bench_serialization [--requests 100] [--assessments 500] [--rounds 5]
+
+All variants are mounted on the same in-process FastAPI app and called over
+ASGI (no sockets), so routing overhead is identical and the difference is the
+serialization path:
+
+- classic: `response_model` + `JSONResponse` (validate, dump to Python, json.dumps);
+  the path every FastAPI release without the built-in `dump_json` shortcut takes.
+- default: `response_model` with the default response class (recent FastAPI
+  validates, then dumps straight to JSON bytes).
+- fast: `ModelJSONResponse` (no validation, one pydantic-core dump).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import time
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+import httpx
+
+from psma_api.models.availability import AvailabilityAssessmentsResponseV1, AvailabilityAssessmentV1
+from psma_api.models.providers import ProviderEnvelope
+from psma_api.responses import ModelJSONResponse
+
+
+def _assessments(n: int) -> AvailabilityAssessmentsResponseV1:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return AvailabilityAssessmentsResponseV1(
+        retrieved_at=now,
+        assessments=[
+            AvailabilityAssessmentV1(
+                title_id=f"tmdb:tv:{i}",
+                country="US",
+                service_id=f"service-{i % 40}",
+                provider_category="svod",
+                availability_now="true",
+                confidence="medium",
+                reason_codes=["TMDB_WATCH_PROVIDER_PRESENT", "SERVICE_ID_MAPPED"],
+                evidence=[
+                    {
+                        "source_id": "tmdb_watch_providers",
+                        "retrieved_at": now,
+                        "source_ref": f"tmdb:/tv/{i}/watch/providers",
+                        "details": {
+                            "tmdb_series_id": i,
+                            "tmdb_provider_id": i % 40,
+                            "tmdb_provider_name": f"Provider {i % 40}",
+                            "monetization_types": ["flatrate"],
+                        },
+                    }
+                ],
+            )
+            for i in range(n)
+        ],
+    )
+
+
+def _envelope(n: int) -> ProviderEnvelope:
+    return ProviderEnvelope(
+        provider="tmdb",
+        request={"url": "https://api.themoviedb.org/3/discover/tv"},
+        data={
+            "page": 1,
+            "results": [
+                {"id": i, "name": f"Show {i}", "overview": "x" * 200, "genre_ids": [18, 80], "popularity": i / 3}
+                for i in range(n)
+            ],
+        },
+    )
+
+
+def build_app(assessments: AvailabilityAssessmentsResponseV1, envelope: ProviderEnvelope) -> FastAPI:
+    app = FastAPI()
+
+    @app.get(
+        "/classic/assessments",
+        response_model=AvailabilityAssessmentsResponseV1,
+        response_model_exclude_none=True,
+        response_class=JSONResponse,
+    )
+    async def classic_assessments() -> Any:
+        return assessments
+
+    @app.get("/default/assessments", response_model=AvailabilityAssessmentsResponseV1, response_model_exclude_none=True)
+    async def default_assessments() -> Any:
+        return assessments
+
+    @app.get("/fast/assessments", response_model=AvailabilityAssessmentsResponseV1, response_model_exclude_none=True)
+    async def fast_assessments() -> Any:
+        return ModelJSONResponse(assessments, exclude_none=True)
+
+    @app.get("/classic/envelope", response_model=ProviderEnvelope, response_class=JSONResponse)
+    async def classic_envelope() -> Any:
+        return envelope
+
+    @app.get("/default/envelope", response_model=ProviderEnvelope)
+    async def default_envelope() -> Any:
+        return envelope
+
+    @app.get("/fast/envelope", response_model=ProviderEnvelope)
+    async def fast_envelope() -> Any:
+        return ModelJSONResponse(envelope)
+
+    return app
+
+
+VARIANTS = ("classic", "default", "fast")
+
+
+async def _cpu_per_request(client: httpx.AsyncClient, path: str, requests: int) -> tuple[float, int]:
+    resp = await client.get(path)  # warm-up
+    size = len(resp.content)
+    start = time.process_time()
+    for _ in range(requests):
+        await client.get(path)
+    return (time.process_time() - start) / requests, size
+
+
+async def run(*, requests: int, assessments: int, rounds: int = 5) -> list[dict[str, Any]]:
+    app = build_app(_assessments(assessments), _envelope(assessments))
+    rows: list[dict[str, Any]] = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for name in ("assessments", "envelope"):
+            # Interleave the variants and keep the best round of each to damp noise.
+            best = {variant: float("inf") for variant in VARIANTS}
+            size = 0
+            for _ in range(max(1, rounds)):
+                for variant in VARIANTS:
+                    seconds, size = await _cpu_per_request(client, f"/{variant}/{name}", requests)
+                    best[variant] = min(best[variant], seconds)
+            row: dict[str, Any] = {"payload": name, "bytes": size}
+            row.update({f"{variant}_ms": round(best[variant] * 1000, 3) for variant in VARIANTS})
+            for baseline in ("classic", "default"):
+                row[f"saving_vs_{baseline}_pct"] = round(100 * (1 - best["fast"] / best[baseline]), 1)
+            rows.append(row)
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_serialization")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--assessments", type=int, default=500, help="Items per payload.")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(run(requests=args.requests, assessments=args.assessments, rounds=args.rounds))
+    print(
+        f"{'payload':<12} {'bytes':>8} {'classic ms':>11} {'default ms':>11} {'fast ms':>8} "
+        f"{'vs classic':>11} {'vs default':>11}"
+    )
+    for row in rows:
+        print(
+            f"{row['payload']:<12} {row['bytes']:>8} {row['classic_ms']:>11.3f} {row['default_ms']:>11.3f} "
+            f"{row['fast_ms']:>8.3f} {row['saving_vs_classic_pct']:>10.1f}% {row['saving_vs_default_pct']:>10.1f}%"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+"""Seeded synthetic inputs for the engine benchmarks.
+
+Every generator takes a `seed` and returns the same data for the same
+arguments, so benchmark runs (and their stored baseline) are comparable.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+import random
+from typing import Any
+
+from psma_api.models.planning import PlanRequestV1
+from psma_api.service_registry import tmdb_provider_id_to_service
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+_CONFIDENCE = ("high", "high", "medium", "low")
+_CATEGORIES = ("svod", "svod", "svod", "avod", "live_bundle")
+
+
+def planner_request(
+    *,
+    titles: int,
+    services: int,
+    inputs: int,
+    seed: int = 0,
+    min_cost: bool = False,
+    horizon_days: int = 180,
+) -> PlanRequestV1:
+    """N titles x M services x K inputs.
+
+    Each title is offered by 1-3 services; about a third only open in the
+    future and some close within the horizon, so the planner has windows to
+    merge. Inputs cover min_contract_days / estimated_watch_days /
+    monthly_price per service first, then title-scoped estimated_watch_days,
+    until `inputs` entries exist.
+    """
+
+    rng = random.Random(seed)
+    service_ids = [f"service-{i:03d}" for i in range(services)]
+    assessments: list[dict[str, Any]] = []
+    for t in range(titles):
+        for service_id in rng.sample(service_ids, min(services, rng.randint(1, 3))):
+            a: dict[str, Any] = {
+                "title_id": f"tmdb:tv:{t}",
+                "country": "US",
+                "service_id": service_id,
+                "provider_category": rng.choice(_CATEGORIES),
+                "availability_now": "true",
+                "confidence": rng.choice(_CONFIDENCE),
+                "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+                "evidence": [
+                    {
+                        "source_id": "tmdb_watch_providers",
+                        "retrieved_at": (NOW - timedelta(hours=rng.randint(0, 72))).isoformat(),
+                    }
+                ],
+            }
+            roll = rng.random()
+            if roll < 0.3:
+                start = NOW + timedelta(days=rng.randint(1, horizon_days))
+                a["availability_now"] = "false"
+                a["availability_window"] = {"start": start.isoformat()}
+            elif roll < 0.5:
+                a["availability_window"] = {"end": (NOW + timedelta(days=rng.randint(5, horizon_days))).isoformat()}
+            assessments.append(a)
+
+    planning_inputs: list[dict[str, Any]] = []
+    if min_cost:
+        planning_inputs.append({"key": "plan_objective", "value": "min_cost"})
+    per_service = [
+        (key, service_id)
+        for service_id in service_ids
+        for key in ("min_contract_days", "estimated_watch_days", "monthly_price")
+    ]
+    values = {"min_contract_days": lambda: 30, "estimated_watch_days": lambda: rng.randint(3, 40)}
+    for i in range(inputs):
+        if i < len(per_service):
+            key, service_id = per_service[i]
+            value = values[key]() if key in values else rng.choice([6.99, 9.99, 15.49, 17.99])
+            planning_inputs.append({"key": key, "service_id": service_id, "value": value})
+        else:
+            planning_inputs.append(
+                {
+                    "key": "estimated_watch_days",
+                    "title_ids": [f"tmdb:tv:{rng.randrange(max(1, titles))}"],
+                    "value": rng.randint(1, 30),
+                }
+            )
+
+    return PlanRequestV1.model_validate(
+        {
+            "country": "US",
+            "horizon_days": horizon_days,
+            "assessments": assessments,
+            "inputs": planning_inputs,
+        }
+    )
+
+
+def watch_providers_payload(*, regions: int, providers: int, seed: int = 0) -> bytes:
+    """A TMDB `/tv/{id}/watch/providers` body with `regions` regions of up to `providers` offers.
+
+    Provider ids are drawn from the service registry (mapped) plus ids outside
+    it (unmapped), across every monetization bucket.
+    """
+
+    rng = random.Random(seed)
+    known = sorted(tmdb_provider_id_to_service())
+    pool = known + [100_000 + i for i in range(max(providers, len(known)))]
+    codes = sorted({f"{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(regions - 1)} | {"US"})
+    results: dict[str, Any] = {}
+    for code in codes:
+        region: dict[str, Any] = {"link": f"https://www.themoviedb.org/tv/1/watch?locale={code}"}
+        for provider_id in rng.sample(pool, min(providers, len(pool))):
+            bucket = rng.choice(("flatrate", "flatrate", "free", "ads", "rent", "buy"))
+            region.setdefault(bucket, []).append(
+                {
+                    "provider_id": provider_id,
+                    "provider_name": f"Provider {provider_id}",
+                    "logo_path": f"/{provider_id}.jpg",
+                    "display_priority": rng.randint(0, 100),
+                }
+            )
+        results[code] = region
+    return json.dumps({"id": 1, "results": results}).encode("utf-8")
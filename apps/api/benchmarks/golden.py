@@ -0,0 +1,151 @@
+"""The planner-facing golden scenarios (docs/technical/15-Golden-Scenarios.md) as a fixed corpus.
+
+Each scenario builds its input and checks the documented expectation, so a
+benchmark never times a corpus that has stopped meaning what the doc says.
+Scenario 5 (release-pattern advice) and 7 (tenant isolation) have no planner
+behavior yet and are not part of the corpus.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from psma_api.engines.planner_delta import PlanState, plan_delta
+from psma_api.engines.planner_v1 import plan_v1
+from psma_api.models.planning import PlanDeltaRequestV1, PlanDeltaResponseV1, PlanRequestV1, PlanResponseV1
+
+
+# The day before every scenario's January 1.
+NOW = datetime(2025, 12, 31, tzinfo=timezone.utc)
+
+
+def _day(month: int, day: int) -> datetime:
+    return datetime(2026, month, day, tzinfo=timezone.utc)
+
+
+def _assessment(title_id: str, service_id: str, *, start: datetime, end: datetime | None, **extra: Any) -> dict:
+    return {
+        "title_id": title_id,
+        "country": "US",
+        "service_id": service_id,
+        "provider_category": "svod",
+        "availability_now": "false",
+        "availability_window": {"start": start.isoformat(), "end": end.isoformat() if end else None},
+        "confidence": "high",
+        "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+        "evidence": [{"source_id": "tmdb_watch_providers", "retrieved_at": "2025-12-30T00:00:00Z"}],
+        **extra,
+    }
+
+
+def _request(assessments: list[dict], *, inputs: list[dict] | None = None) -> PlanRequestV1:
+    services = sorted({a["service_id"] for a in assessments})
+    return PlanRequestV1.model_validate(
+        {
+            "country": "US",
+            "horizon_days": 120,
+            "assessments": assessments,
+            "inputs": [{"key": "min_contract_days", "service_id": s, "value": 30} for s in services] + (inputs or []),
+        }
+    )
+
+
+def _events(resp: PlanResponseV1 | PlanDeltaResponseV1, attr: str = "events") -> list[tuple[str, str, datetime]]:
+    return [(e.action, e.service_id, e.effective_at) for e in getattr(resp, attr)]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    run: Callable[[], Any]
+    check: Callable[[Any], None]
+
+
+def _one_show_one_service() -> Scenario:
+    request = _request([_assessment("show-a", "x", start=_day(1, 1), end=_day(2, 1))])
+
+    def check(resp: PlanResponseV1) -> None:
+        # Subscribe on Jan 1, unsubscribe after Feb 1 plus the 1-day buffer.
+        assert _events(resp) == [("subscribe", "x", _day(1, 1)), ("unsubscribe", "x", _day(2, 2))], resp.events
+        assert resp.events[0].title_ids == ["show-a"]
+
+    return Scenario("golden/1-one-show-one-service", lambda: plan_v1(request, now=NOW), check)
+
+
+def _overlapping_windows() -> Scenario:
+    request = _request(
+        [
+            _assessment("show-a", "x", start=_day(1, 1), end=_day(2, 1)),
+            _assessment("show-b", "x", start=_day(1, 15), end=_day(3, 1)),
+        ]
+    )
+
+    def check(resp: PlanResponseV1) -> None:
+        assert _events(resp) == [("subscribe", "x", _day(1, 1)), ("unsubscribe", "x", _day(3, 2))], resp.events
+        assert resp.events[0].title_ids == ["show-a", "show-b"]
+
+    return Scenario("golden/2-overlapping-windows", lambda: plan_v1(request, now=NOW), check)
+
+
+def _unknown_end() -> Scenario:
+    request = _request([_assessment("show-a", "x", start=_day(1, 1), end=None)])
+
+    def check(resp: PlanResponseV1) -> None:
+        assert _events(resp) == [("subscribe", "x", _day(1, 1))], resp.events
+        assert [q.key for q in resp.questions or []] == ["estimated_watch_days"]
+
+    return Scenario("golden/3-unknown-end", lambda: plan_v1(request, now=NOW), check)
+
+
+def _provider_conflict() -> Scenario:
+    request = _request(
+        [
+            _assessment("show-a", "x", start=_day(1, 1), end=_day(2, 1), confidence="medium"),
+            _assessment("show-a", "y", start=_day(1, 1), end=_day(2, 1)),
+        ],
+        inputs=[{"key": "plan_objective", "value": "min_cost"}],
+    )
+
+    def check(resp: PlanResponseV1) -> None:
+        # No prices: the ADR-0004 tie-breaker (confidence first) picks y and flags the alternative.
+        assert {e.service_id for e in resp.events} == {"y"}, resp.events
+        assert "alternative_services_available" in (resp.events[0].assumptions or [])
+        assert sorted(q.service_id or "" for q in resp.questions or [] if q.key == "monthly_price") == ["x", "y"]
+
+    return Scenario("golden/4-provider-conflict", lambda: plan_v1(request, now=NOW), check)
+
+
+def _refresh_delta() -> Scenario:
+    request = _request([_assessment("show-a", "x", start=_day(1, 10), end=_day(2, 1))])
+    base = PlanState.from_request(request, now=NOW)
+    # A refresh moves availability a week earlier.
+    delta = PlanDeltaRequestV1.model_validate(
+        {"plan_token": "base", "upsert_assessments": [_assessment("show-a", "x", start=_day(1, 3), end=_day(2, 1))]}
+    )
+
+    def check(resp: PlanDeltaResponseV1) -> None:
+        assert resp.affected_service_ids == ["x"]
+        # Both ends move: the unsubscribe is min_contract_days after the new start.
+        removed = [("subscribe", "x", _day(1, 10)), ("unsubscribe", "x", _day(2, 9))]
+        added = [("subscribe", "x", _day(1, 3)), ("unsubscribe", "x", _day(2, 2))]
+        assert _events(resp, "events_removed") == removed, resp.events_removed
+        assert _events(resp, "events_added") == added, resp.events_added
+
+    return Scenario(
+        "golden/6-refresh-delta",
+        lambda: plan_delta(base, delta, token="next", base_token="base")[1],
+        check,
+    )
+
+
+def scenarios() -> list[Scenario]:
+    return [_one_show_one_service(), _overlapping_windows(), _unknown_end(), _provider_conflict(), _refresh_delta()]
+
+
+def check_all() -> None:
+    for scenario in scenarios():
+        scenario.check(scenario.run())
+
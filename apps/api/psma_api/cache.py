@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+import logging
+import time
+from typing import Generic, TypeVar
+
+
+logger = logging.getLogger("psma_api.cache")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    stored_at: float
+
+
+class StaleWhileRevalidateCache(Generic[K, V]):
+    """In-process LRU cache with a TTL and a stale-while-revalidate window.
+
+    - Within `ttl_seconds` an entry is fresh and served as-is.
+    - Within `ttl_seconds + stale_seconds` it is served immediately while a
+      single background task refreshes it.
+    - Past that window the caller waits for a fresh load.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = max(0.0, ttl_seconds)
+        self._stale = max(0.0, stale_seconds)
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._refreshing: dict[K, asyncio.Task[None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key: K) -> V | None:
+        """Return the stored value regardless of age (no refresh, no LRU bump)."""
+
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = _Entry(value=value, stored_at=self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.stored_at
+            if age < self._ttl:
+                self._entries.move_to_end(key)
+                return entry.value
+            if age < self._ttl + self._stale:
+                self._entries.move_to_end(key)
+                self._schedule_refresh(key, loader)
+                return entry.value
+
+        value = await loader()
+        self.set(key, value)
+        return value
+
+    def _schedule_refresh(self, key: K, loader: Callable[[], Awaitable[V]]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                self.set(key, await loader())
+            except Exception:
+                # Keep serving the stale entry; the next hit will try again.
+                logger.warning("cache_refresh_failed", exc_info=True)
+            finally:
+                self._refreshing.pop(key, None)
+
+        # Hold a reference so the task is not garbage collected mid-flight.
+        self._refreshing[key] = asyncio.get_running_loop().create_task(refresh())
+
+
+class ExpiringCache(Generic[K, V]):
+    """In-process LRU cache where each entry carries its own expiry time.
+
+    Used when data has a natural invalidation point (e.g. the next episode's
+    air time) rather than a fixed TTL. `clock` returns epoch seconds so expiry
+    can be compared with wall-clock timestamps.
+    """
+
+    def __init__(self, *, max_entries: int = 10_000, clock: Callable[[], float] = time.time) -> None:
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, *, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SizedLRUCache(Generic[K, V]):
+    """In-process LRU cache bounded by entry count and by total size.
+
+    Callers pass each value's size (bytes, estimated) to `set`; least recently
+    used entries are evicted until both bounds hold. A value larger than
+    `max_bytes` on its own is not stored.
+    """
+
+    def __init__(self, *, max_entries: int = 10_000, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max(0, max_bytes)
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: K, value: V, *, size: int) -> None:
+        prior = self._entries.pop(key, None)
+        if prior is not None:
+            self._bytes -= prior[1]
+        if size > self._max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self._bytes += size
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
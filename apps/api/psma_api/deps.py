@@ -1,18 +1,39 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import logging
 import time
 
 import httpx
 from fastapi import Request
 
+from psma_api.cache import ExpiringCache, SizedLRUCache, StaleWhileRevalidateCache
+from psma_api.engines.availability_engine_cached import (
+    AvailabilityCacheKey,
+    CachedAvailabilityEngine,
+    UpstreamStatus,
+)
+from psma_api.engines.availability_diff import SnapshotTokenStore
 from psma_api.engines.availability_engine_impl import DefaultAvailabilityEngine
+from psma_api.engines.availability_orchestrator import AvailabilityOrchestrator
+from psma_api.engines.planner_delta import PlanStateStore
+from psma_api.engines.planner_engine_cached import CachedPlannerEngine
 from psma_api.engines.planner_engine_impl import DefaultPlannerEngine
+from psma_api.engines.planner_engine_pool import ProcessPoolPlannerEngine
+from psma_api.engines.planner_v1 import PlannerPolicy
+from psma_api.engines.planning_hints_tvmaze import PlanningHintsEngine
 from psma_api.ports.availability_engine import AvailabilityEngine
+from psma_api.models.availability import AvailabilityAssessmentsResultV1, PlanningHintsV1
+from psma_api.models.planning import PlanResponseV1
 from psma_api.ports.planner_engine import PlannerEngine
 
 from psma_api.settings import settings
+from psma_api.transports.circuit_breaker import CircuitBreakerTransport
+from psma_api.transports.coalescing import CoalescingTransport
+from psma_api.transports.http_cache import CachingTransport, SqliteHttpCacheStorage
+from psma_api.transports.rate_limit import RateLimitTransport
 
 
 logger = logging.getLogger("psma_api.http")
@@ -65,6 +86,36 @@ def build_http_client(*, transport: httpx.AsyncBaseTransport | None = None) -> h
 
     if transport is None:
         transport = httpx.AsyncHTTPTransport(retries=2)
+    # Wrapping order (outermost first):
+    #   coalescing -> HTTP cache -> circuit breaker -> rate limit -> network.
+    # Coalescing sits outside the cache so concurrent misses still make one call;
+    # the limiter sits inside it so cache hits never spend upstream tokens, and
+    # the breaker sits above the limiter so an open circuit never queues.
+    if settings.http_rate_limits:
+        transport = RateLimitTransport(
+            transport,
+            rates=settings.http_rate_limits,
+            max_concurrency=settings.http_max_concurrency_per_host,
+            max_retries=settings.http_rate_limit_max_retries,
+            max_retry_wait_seconds=settings.http_rate_limit_max_wait_seconds,
+        )
+    if settings.http_circuit_breaker_enabled:
+        transport = CircuitBreakerTransport(
+            transport,
+            failure_ratio=settings.http_circuit_failure_ratio,
+            window=settings.http_circuit_window,
+            min_calls=settings.http_circuit_min_calls,
+            open_seconds=settings.http_circuit_open_seconds,
+        )
+    if settings.http_cache_enabled:
+        storage = SqliteHttpCacheStorage(
+            settings.http_cache_path,
+            max_entries=settings.http_cache_max_entries,
+            max_bytes=settings.http_cache_max_bytes,
+        )
+        transport = CachingTransport(transport, storage)
+    if settings.http_coalesce_requests:
+        transport = CoalescingTransport(transport)
 
     return httpx.AsyncClient(
         timeout=timeout,
@@ -89,17 +140,123 @@ async def get_http_client(request: Request) -> AsyncIterator[httpx.AsyncClient]:
         yield client
 
 
-def get_availability_engine() -> AvailabilityEngine:
+def build_availability_cache() -> StaleWhileRevalidateCache[AvailabilityCacheKey, AvailabilityAssessmentsResultV1]:
+    return StaleWhileRevalidateCache(
+        ttl_seconds=settings.availability_cache_ttl_seconds,
+        stale_seconds=settings.availability_cache_stale_seconds,
+        max_entries=settings.availability_cache_max_entries,
+    )
+
+
+def build_availability_upstream_status() -> UpstreamStatus:
+    return UpstreamStatus(unavailable_seconds=settings.http_circuit_open_seconds)
+
+
+def build_planning_hints_cache() -> ExpiringCache[int, PlanningHintsV1]:
+    return ExpiringCache(max_entries=settings.planning_hints_cache_max_entries)
+
+
+def build_snapshot_token_store() -> SnapshotTokenStore:
+    return SnapshotTokenStore(max_entries=settings.availability_snapshot_tokens_max_entries)
+
+
+def get_snapshot_token_store(request: Request) -> SnapshotTokenStore:
+    store = getattr(request.app.state, "availability_snapshots", None)
+    if isinstance(store, SnapshotTokenStore):
+        return store
+    # Outside the lifespan only "since == current token" can be answered.
+    return SnapshotTokenStore(max_entries=1)
+
+
+def build_plan_cache() -> SizedLRUCache[str, PlanResponseV1]:
+    return SizedLRUCache(max_entries=settings.plan_cache_max_entries, max_bytes=settings.plan_cache_max_bytes)
+
+
+def build_plan_state_store() -> PlanStateStore:
+    return PlanStateStore(max_entries=settings.plan_tokens_max_entries)
+
+
+def get_plan_state_store(request: Request) -> PlanStateStore:
+    store = getattr(request.app.state, "plan_states", None)
+    if isinstance(store, PlanStateStore):
+        return store
+    # Outside the lifespan tokens only live for the request that issued them.
+    return PlanStateStore(max_entries=1)
+
+
+def build_planner_pool() -> ProcessPoolExecutor:
+    # "spawn" rather than fork: the parent runs an event loop and threads.
+    return ProcessPoolExecutor(
+        max_workers=settings.planner_process_pool_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def get_availability_engine(request: Request) -> AvailabilityEngine:
     # Kept intentionally simple for MVP. In the future, this can be swapped via:
     # - configuration (import path)
     # - entrypoints/plugin discovery
     # - a worker process using the same contract
-    return DefaultAvailabilityEngine()
+    vod: AvailabilityEngine = DefaultAvailabilityEngine()
+
+    # The cache lives on app state (created in the lifespan) so it is shared
+    # across requests and tied to the long-lived HTTP client used for refreshes.
+    # It wraps each source engine rather than the orchestrator, so a partial
+    # (deadline-missed) merge is never cached.
+    # The circuit-open mark is shared the same way, so a failed background
+    # refresh downgrades the next request's stale hits.
+    cache = getattr(request.app.state, "availability_cache", None)
+    if isinstance(cache, StaleWhileRevalidateCache):
+        upstream = getattr(request.app.state, "availability_upstream", None)
+        if not isinstance(upstream, UpstreamStatus):
+            upstream = build_availability_upstream_status()
+        vod = CachedAvailabilityEngine(vod, cache, upstream=upstream)
+
+    # Further sources (e.g. live bundles) register here and run concurrently.
+    engine: AvailabilityEngine = AvailabilityOrchestrator(
+        [("tmdb_vod", vod)],
+        deadline_seconds=settings.availability_engine_deadline_seconds,
+    )
+
+    hints_cache = getattr(request.app.state, "planning_hints_cache", None)
+    if isinstance(hints_cache, ExpiringCache):
+        # Hints run alongside the orchestrator under the same deadline.
+        engine = PlanningHintsEngine(
+            engine,
+            hints_cache,
+            max_age_seconds=settings.planning_hints_max_age_seconds,
+            deadline_seconds=settings.availability_engine_deadline_seconds,
+        )
+    return engine
 
 
-def get_planner_engine() -> PlannerEngine:
+def get_planner_pool(request: Request) -> ProcessPoolExecutor | None:
+    pool = getattr(request.app.state, "planner_pool", None)
+    return pool if isinstance(pool, ProcessPoolExecutor) else None
+
+
+def get_planner_policy() -> PlannerPolicy:
+    return PlannerPolicy(
+        unsubscribe_buffer_days=settings.planner_unsubscribe_buffer_days,
+        merge_gap_days=settings.planner_merge_gap_days,
+        cost_exact_max_assignments=settings.planner_cost_exact_max_assignments,
+        cost_max_evaluations=settings.planner_cost_max_evaluations,
+    )
+
+
+def get_planner_engine(request: Request) -> PlannerEngine:
     # Kept intentionally simple for MVP. In the future, this can be swapped via:
     # - configuration (import path)
     # - entrypoints/plugin discovery
-    # - a worker process using the same contract
-    return DefaultPlannerEngine()
+    policy = get_planner_policy()
+    engine: PlannerEngine = DefaultPlannerEngine(policy=policy)
+    pool = get_planner_pool(request)
+    if pool is not None:
+        engine = ProcessPoolPlannerEngine(pool, min_items=settings.planner_process_pool_min_items, policy=policy)
+
+    cache = getattr(request.app.state, "plan_cache", None)
+    if isinstance(cache, SizedLRUCache):
+        engine = CachedPlannerEngine(
+            engine, cache, now_granularity_seconds=settings.plan_cache_now_granularity_seconds
+        )
+    return engine
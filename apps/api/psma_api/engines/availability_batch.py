@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+import logging
+
+import httpx
+
+from psma_api.models.availability import (
+    AvailabilityBatchErrorV1,
+    AvailabilityBatchItemV1,
+    AvailabilityBatchProjectionItemV1,
+    AvailabilityBatchProjectionResponseV1,
+    AvailabilityBatchResponseV1,
+)
+from psma_api.ports.availability_engine import AvailabilityEngine
+
+
+logger = logging.getLogger("psma_api.engines.availability")
+
+
+async def assess_tmdb_tv_batch_v1(
+    *,
+    engine: AvailabilityEngine,
+    series_ids: list[int],
+    country: str | None,
+    api_key: str,
+    client: httpx.AsyncClient,
+    concurrency: int,
+    include_evidence: bool = True,
+) -> AvailabilityBatchResponseV1 | AvailabilityBatchProjectionResponseV1:
+    """Assess many TMDB series concurrently (bounded), one result per series.
+
+    Failures are reported per series; the batch itself never fails. Duplicate
+    ids are assessed once and results keep the order of first appearance.
+    With `include_evidence=False` the items carry evidence-free projections.
+    """
+
+    item_type = AvailabilityBatchItemV1 if include_evidence else AvailabilityBatchProjectionItemV1
+
+    unique_ids = list(dict.fromkeys(series_ids))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def assess_one(series_id: int) -> AvailabilityBatchItemV1 | AvailabilityBatchProjectionItemV1:
+        async with semaphore:
+            try:
+                resp = await engine.assess_tmdb_tv_watch_providers_v1(
+                    series_id=series_id,
+                    country=country,
+                    api_key=api_key,
+                    client=client,
+                    include_evidence=include_evidence,
+                )
+            except httpx.HTTPStatusError as exc:
+                error = AvailabilityBatchErrorV1(
+                    message="TMDB returned an error",
+                    upstream_status=exc.response.status_code,
+                )
+            except httpx.RequestError as exc:
+                error = AvailabilityBatchErrorV1(message="TMDB request failed", error=str(exc))
+            except Exception:
+                logger.exception("availability_batch_item_failed", extra={"series_id": series_id})
+                error = AvailabilityBatchErrorV1(message="Availability assessment failed")
+            else:
+                return item_type(series_id=series_id, status="ok", assessments=resp.assessments)
+
+        return item_type(series_id=series_id, status="error", error=error)
+
+    results = await asyncio.gather(*(assess_one(sid) for sid in unique_ids))
+    if include_evidence:
+        return AvailabilityBatchResponseV1(retrieved_at=datetime.now(timezone.utc), results=list(results))
+    return AvailabilityBatchProjectionResponseV1(retrieved_at=datetime.now(timezone.utc), results=list(results))
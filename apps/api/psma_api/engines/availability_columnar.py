@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from psma_api.engines.availability_v1 import _infer_category_from_monetization
+from psma_api.models.availability import AvailabilityAssessmentV1
+from psma_api.service_registry import ServiceRegistryEntry, tmdb_provider_id_to_service
+
+
+# Bucket order matches availability_v1._extract_tmdb_offerings.
+MONETIZATION_BUCKETS: tuple[str, ...] = ("flatrate", "free", "ads", "rent", "buy")
+_BIT_BY_BUCKET: dict[str, int] = {bucket: 1 << i for i, bucket in enumerate(MONETIZATION_BUCKETS)}
+_MASK_COUNT = 1 << len(MONETIZATION_BUCKETS)
+
+# Lookup tables indexed by monetization bitmask (computed once at import).
+_TYPES_BY_MASK: tuple[tuple[str, ...], ...] = tuple(
+    tuple(sorted(b for b in MONETIZATION_BUCKETS if mask & _BIT_BY_BUCKET[b])) for mask in range(_MASK_COUNT)
+)
+_CATEGORY_BY_MASK: tuple[str, ...] = tuple(
+    _infer_category_from_monetization(set(types)) for types in _TYPES_BY_MASK
+)
+
+_ASSESSMENTS = TypeAdapter(list[AvailabilityAssessmentV1])
+# Rows validated per pydantic-core call; bounds the intermediate dicts kept alive.
+_VALIDATE_BATCH = 4096
+
+
+class WatchProviderColumns:
+    """Columnar view of many TMDB watch-provider payloads.
+
+    One row per (series, region, provider); monetization buckets are OR-ed into
+    a bitmask. Regions and provider names are dictionary-encoded.
+    """
+
+    def __init__(self) -> None:
+        self.series = array("q")
+        self.region = array("H")
+        self.provider = array("q")
+        self.mask = array("B")
+        self.name = array("I")
+        self.regions: list[str] = []
+        self.names: list[str | None] = []
+        self._region_index: dict[str, int] = {}
+        self._name_index: dict[str | None, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    def _code(self, table: list, index: dict, value: Any) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(table)
+            table.append(value)
+        return code
+
+    def ingest(self, series_id: int, payload: Any, regions: tuple[str, ...] | None) -> None:
+        """Append one `/tv/{id}/watch/providers` payload (`regions=None` = all)."""
+
+        results = payload.get("results") if isinstance(payload, dict) else None
+        if not isinstance(results, dict):
+            return
+        wanted = sorted(k for k in results if isinstance(k, str)) if regions is None else regions
+
+        for region in wanted:
+            region_result = results.get(region)
+            if not isinstance(region_result, dict):
+                continue
+            region_code = self._code(self.regions, self._region_index, region)
+            row_by_provider: dict[int, int] = {}
+            for bucket in MONETIZATION_BUCKETS:
+                items = region_result.get(bucket)
+                if not isinstance(items, list):
+                    continue
+                bit = _BIT_BY_BUCKET[bucket]
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
+                    provider_id = item.get("provider_id")
+                    if not isinstance(provider_id, int):
+                        continue
+                    row = row_by_provider.get(provider_id)
+                    if row is not None:
+                        self.mask[row] |= bit
+                        continue
+                    name = item.get("provider_name")
+                    row_by_provider[provider_id] = len(self.series)
+                    self.series.append(series_id)
+                    self.region.append(region_code)
+                    self.provider.append(provider_id)
+                    self.mask.append(bit)
+                    self.name.append(
+                        self._code(self.names, self._name_index, name if isinstance(name, str) else None)
+                    )
+
+
+def assess_columns(
+    columns: WatchProviderColumns,
+    *,
+    retrieved_at: datetime,
+    mapping: Mapping[int, ServiceRegistryEntry] | None = None,
+) -> dict[int, list[AvailabilityAssessmentV1]]:
+    """Assess every row; same output as `assess_tmdb_tv_watch_providers_v1`.
+
+    Service id, category and reason codes are resolved once per distinct
+    (provider id, bitmask) pair, so the per-row loop only assembles plain
+    dicts, which are validated in batches by pydantic-core; that is faster
+    than `model_construct` per row (see the `catalog` cases in
+    `benchmarks/bench_engines.py`).
+    """
+
+    if mapping is None:
+        mapping = tmdb_provider_id_to_service()
+
+    # Per (provider, mask): (service_id, category, reason codes).
+    resolved: dict[tuple[int, int], tuple[str, str, list[str]]] = {}
+    # Per series: (title_id, source_ref).
+    refs: dict[int, tuple[str, str]] = {}
+    series, providers, masks = columns.series, columns.provider, columns.mask
+    regions, names = columns.region, columns.name
+
+    out: dict[int, list[AvailabilityAssessmentV1]] = {}
+    rows: list[dict[str, Any]] = []
+
+    def flush(first_row: int) -> None:
+        for series_id, assessment in zip(series[first_row:], _ASSESSMENTS.validate_python(rows)):
+            out.setdefault(series_id, []).append(assessment)
+        rows.clear()
+
+    for row in range(len(columns)):
+        if len(rows) == _VALIDATE_BATCH:
+            flush(row - _VALIDATE_BATCH)
+        series_id = series[row]
+        provider_id = providers[row]
+        mask = masks[row]
+
+        resolution = resolved.get((provider_id, mask))
+        if resolution is None:
+            entry = mapping.get(provider_id)
+            if entry is not None:
+                resolution = (entry.service_id, entry.category, ["TMDB_WATCH_PROVIDER_PRESENT", "SERVICE_ID_MAPPED"])
+            else:
+                category = _CATEGORY_BY_MASK[mask]
+                codes = ["TMDB_WATCH_PROVIDER_PRESENT", "SERVICE_ID_UNKNOWN"]
+                if category != "unknown":
+                    codes.append("CATEGORY_INFERRED")
+                resolution = (f"unknown-tmdb-provider-{provider_id}", category, codes)
+            resolved[(provider_id, mask)] = resolution
+        ref = refs.get(series_id)
+        if ref is None:
+            ref = refs[series_id] = (f"tmdb:tv:{series_id}", f"tmdb:/tv/{series_id}/watch/providers")
+
+        rows.append(
+            {
+                "title_id": ref[0],
+                "country": columns.regions[regions[row]],
+                "service_id": resolution[0],
+                "provider_category": resolution[1],
+                "availability_now": "true",
+                "confidence": "medium",
+                "reason_codes": resolution[2],
+                "evidence": [
+                    {
+                        "source_id": "tmdb_watch_providers",
+                        "retrieved_at": retrieved_at,
+                        "source_ref": ref[1],
+                        "details": {
+                            "tmdb_series_id": series_id,
+                            "tmdb_provider_id": provider_id,
+                            "tmdb_provider_name": columns.names[names[row]],
+                            "monetization_types": list(_TYPES_BY_MASK[mask]),
+                        },
+                    }
+                ],
+            }
+        )
+
+    flush(len(columns) - len(rows))
+    return out
+
+
+def assess_tmdb_payloads_columnar(
+    payloads: Iterable[tuple[int, Any]],
+    *,
+    regions: tuple[str, ...] | None,
+    retrieved_at: datetime,
+) -> dict[int, list[AvailabilityAssessmentV1]]:
+    """Ingest many (series_id, payload) pairs and assess them in one pass."""
+
+    columns = WatchProviderColumns()
+    for series_id, payload in payloads:
+        columns.ingest(series_id, payload, regions)
+    return assess_columns(columns, retrieved_at=retrieved_at)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+import hashlib
+import json
+from typing import Any
+
+from psma_api.models.availability import (
+    AssessmentKeyV1,
+    AvailabilityAssessmentsResponseV1,
+    AvailabilityAssessmentV1,
+    AvailabilityDiffResponseV1,
+)
+
+
+AssessmentKey = tuple[str, str, str]
+
+
+def assessment_key(a: AvailabilityAssessmentV1) -> AssessmentKey:
+    """Identity of an assessment: one per (title, country, service)."""
+
+    return (a.title_id, a.country, a.service_id)
+
+
+def _canonical(a: AvailabilityAssessmentV1) -> dict[str, Any]:
+    data = a.model_dump(mode="json", exclude_none=True)
+    # Volatile fields change on every fetch without the availability changing.
+    for ev in data.get("evidence", []):
+        ev.pop("retrieved_at", None)
+    data["reason_codes"] = sorted(data.get("reason_codes", []))
+    return data
+
+
+def assessment_hash(a: AvailabilityAssessmentV1) -> str:
+    """Stable content hash of an assessment, ignoring retrieval timestamps."""
+
+    payload = json.dumps(_canonical(a), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class AssessmentDiff:
+    added: list[AvailabilityAssessmentV1] = field(default_factory=list)
+    changed: list[AvailabilityAssessmentV1] = field(default_factory=list)
+    removed: list[AssessmentKey] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+
+def diff_assessments(
+    previous: Mapping[AssessmentKey, str],
+    current: Iterable[AvailabilityAssessmentV1],
+) -> AssessmentDiff:
+    """Diff current assessments against previous `{key: content_hash}`.
+
+    Output lists are sorted by key so the result is deterministic.
+    """
+
+    diff = AssessmentDiff()
+    seen: set[AssessmentKey] = set()
+    for a in sorted(current, key=assessment_key):
+        key = assessment_key(a)
+        seen.add(key)
+        prior = previous.get(key)
+        if prior is None:
+            diff.added.append(a)
+        elif prior != assessment_hash(a):
+            diff.changed.append(a)
+    diff.removed = sorted(k for k in previous if k not in seen)
+    return diff
+
+
+def snapshot_token(scope: str, hashes: Mapping[AssessmentKey, str]) -> str:
+    """Content-derived token for a snapshot: same scope + content -> same token.
+
+    Because the token depends only on content, a client whose token matches the
+    current one is up to date even if the server forgot the snapshot.
+    """
+
+    digest = hashlib.sha256(scope.encode("utf-8"))
+    for key in sorted(hashes):
+        digest.update(json.dumps([*key, hashes[key]], ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class SnapshotTokenStore:
+    """Bounded LRU of snapshot token -> (scope, `{key: content_hash}`) for diffing.
+
+    A token only resolves within the scope (series and regions) it was issued
+    for; presented against any other scope it is treated as unknown.
+    """
+
+    def __init__(self, *, max_entries: int = 10_000) -> None:
+        self._max_entries = max(1, max_entries)
+        self._snapshots: OrderedDict[str, tuple[str, dict[AssessmentKey, str]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def get(self, token: str, *, scope: str) -> dict[AssessmentKey, str] | None:
+        entry = self._snapshots.get(token)
+        if entry is None or entry[0] != scope:
+            return None
+        self._snapshots.move_to_end(token)
+        return entry[1]
+
+    def put(self, token: str, hashes: dict[AssessmentKey, str], *, scope: str) -> None:
+        self._snapshots[token] = (scope, hashes)
+        self._snapshots.move_to_end(token)
+        while len(self._snapshots) > self._max_entries:
+            self._snapshots.popitem(last=False)
+
+
+def diff_against_snapshot(
+    resp: AvailabilityAssessmentsResponseV1,
+    *,
+    scope: str,
+    since: str | None,
+    store: SnapshotTokenStore,
+) -> AvailabilityDiffResponseV1:
+    """Diff a fresh response against the snapshot named by `since`.
+
+    Unknown (or missing) tokens, and tokens issued for another scope, produce
+    a full resync: every assessment is reported as added so the client can
+    replace its local copy.
+    """
+
+    hashes = {assessment_key(a): assessment_hash(a) for a in resp.assessments}
+    token = snapshot_token(scope, hashes)
+    store.put(token, hashes, scope=scope)
+
+    if since == token:
+        return AvailabilityDiffResponseV1(
+            retrieved_at=resp.retrieved_at, snapshot_token=token, since=since, full_resync=False
+        )
+
+    previous = store.get(since, scope=scope) if since else None
+    if previous is None:
+        return AvailabilityDiffResponseV1(
+            retrieved_at=resp.retrieved_at,
+            snapshot_token=token,
+            since=since,
+            full_resync=True,
+            added=sorted(resp.assessments, key=assessment_key),
+        )
+
+    diff = diff_assessments(previous, resp.assessments)
+    return AvailabilityDiffResponseV1(
+        retrieved_at=resp.retrieved_at,
+        snapshot_token=token,
+        since=since,
+        full_resync=False,
+        added=diff.added,
+        changed=diff.changed,
+        removed=[AssessmentKeyV1(title_id=t, country=c, service_id=s) for t, c, s in diff.removed],
+    )
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import time
+
+import httpx
+
+from psma_api.cache import StaleWhileRevalidateCache
+from psma_api.engines.availability_v1 import region_key
+from psma_api.models.availability import AvailabilityAssessmentsResultV1
+from psma_api.ports.availability_engine import AvailabilityEngine
+from psma_api.transports.circuit_breaker import CircuitOpenError
+
+
+logger = logging.getLogger("psma_api.engines.availability")
+
+AvailabilityCacheKey = tuple[int, str, bool]
+
+LAST_KNOWN_GOOD_REASON_CODE = "UPSTREAM_UNAVAILABLE_LAST_KNOWN_GOOD"
+
+
+def _as_last_known_good(resp: AvailabilityAssessmentsResultV1) -> AvailabilityAssessmentsResultV1:
+    assessments = [
+        a.model_copy(
+            update={
+                "confidence": "low",
+                "reason_codes": [*(a.reason_codes or []), LAST_KNOWN_GOOD_REASON_CODE],
+            }
+        )
+        for a in resp.assessments
+    ]
+    # retrieved_at stays the original fetch time so callers can judge staleness.
+    return resp.model_copy(update={"assessments": assessments})
+
+
+class UpstreamStatus:
+    """When the upstream circuit was last seen open, shared across requests.
+
+    Routes build a fresh engine per request, so this lives on app state (next
+    to the availability cache) rather than on the engine; background refreshes
+    that outlive their request still report into it.
+    """
+
+    def __init__(self, *, unavailable_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self._unavailable_seconds = unavailable_seconds
+        self._clock = clock
+        self._circuit_open_at: float | None = None
+
+    @property
+    def unavailable(self) -> bool:
+        opened = self._circuit_open_at
+        return opened is not None and self._clock() - opened < self._unavailable_seconds
+
+    def mark_circuit_open(self) -> None:
+        self._circuit_open_at = self._clock()
+
+    def mark_ok(self) -> None:
+        self._circuit_open_at = None
+
+
+class CachedAvailabilityEngine:
+    """Serve availability assessments from an in-process stale-while-revalidate cache.
+
+    TMDB watch-provider data changes at most daily, so repeat lookups for the
+    same (series_id, regions, include_evidence) are answered without an
+    upstream round trip.
+
+    While the upstream circuit is open, cached responses (of any age) are
+    served with `confidence="low"` and a dedicated reason code. The circuit
+    counts as open (in the shared `upstream` status) for its
+    `unavailable_seconds` after any load (including a stale-while-revalidate
+    background refresh) is rejected with `CircuitOpenError`, and closed again
+    as soon as a load succeeds.
+    """
+
+    def __init__(
+        self,
+        inner: AvailabilityEngine,
+        cache: StaleWhileRevalidateCache[AvailabilityCacheKey, AvailabilityAssessmentsResultV1],
+        *,
+        upstream: UpstreamStatus | None = None,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._upstream = upstream if upstream is not None else UpstreamStatus()
+
+    @property
+    def upstream_unavailable(self) -> bool:
+        return self._upstream.unavailable
+
+    async def assess_tmdb_tv_watch_providers_v1(
+        self,
+        *,
+        series_id: int,
+        country: str | None,
+        api_key: str,
+        client: httpx.AsyncClient,
+        include_evidence: bool = True,
+    ) -> AvailabilityAssessmentsResultV1:
+        loaded = False
+
+        async def load() -> AvailabilityAssessmentsResultV1:
+            nonlocal loaded
+            try:
+                value = await self._inner.assess_tmdb_tv_watch_providers_v1(
+                    series_id=series_id,
+                    country=country,
+                    api_key=api_key,
+                    client=client,
+                    include_evidence=include_evidence,
+                )
+            except CircuitOpenError:
+                self._upstream.mark_circuit_open()
+                raise
+            self._upstream.mark_ok()
+            loaded = True
+            return value
+
+        key = (series_id, region_key(country), include_evidence)
+        try:
+            value = await self._cache.get_or_load(key, load)
+        except CircuitOpenError:
+            last_known_good = self._cache.peek(key)
+            if last_known_good is None:
+                raise
+            value = last_known_good
+        else:
+            if loaded or not self.upstream_unavailable:
+                return value
+        logger.warning("availability_last_known_good_served", extra={"series_id": series_id})
+        return _as_last_known_good(value)
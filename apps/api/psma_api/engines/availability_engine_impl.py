@@ -3,7 +3,7 @@ from __future__ import annotations
 import httpx
 
 from psma_api.engines.availability_v1 import assess_tmdb_tv_watch_providers_v1
-from psma_api.models.availability import AvailabilityAssessmentsResponseV1
+from psma_api.models.availability import AvailabilityAssessmentsResultV1
 
 
 class DefaultAvailabilityEngine:
@@ -14,10 +14,12 @@ class DefaultAvailabilityEngine:
         country: str | None,
         api_key: str,
         client: httpx.AsyncClient,
-    ) -> AvailabilityAssessmentsResponseV1:
+        include_evidence: bool = True,
+    ) -> AvailabilityAssessmentsResultV1:
         return await assess_tmdb_tv_watch_providers_v1(
             series_id=series_id,
             country=country,
             api_key=api_key,
             client=client,
+            include_evidence=include_evidence,
         )
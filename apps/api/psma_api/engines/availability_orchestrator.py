@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+import logging
+
+import httpx
+
+from psma_api.engines.availability_diff import AssessmentKey, assessment_key
+from psma_api.models.availability import (
+    AvailabilityAssessmentProjectionV1,
+    AvailabilityAssessmentsProjectionResponseV1,
+    AvailabilityAssessmentsResponseV1,
+    AvailabilityAssessmentsResultV1,
+    AvailabilityAssessmentV1,
+)
+from psma_api.ports.availability_engine import AvailabilityEngine
+
+
+logger = logging.getLogger("psma_api.engines.availability")
+
+
+def _merge(results: Sequence[AvailabilityAssessmentsResultV1]) -> AvailabilityAssessmentsResultV1:
+    """Merge responses in engine registration order.
+
+    The first engine to report a (title, country, service) key owns its
+    verdict; later engines contribute extra reason codes and evidence. Order
+    depends only on registration order, never on which engine finished first.
+    Evidence-free (projection) results merge into a projection response.
+    """
+
+    merged: dict[AssessmentKey, AvailabilityAssessmentV1 | AvailabilityAssessmentProjectionV1] = {}
+    for resp in results:
+        for a in resp.assessments:
+            key = assessment_key(a)
+            prior = merged.get(key)
+            if prior is None:
+                merged[key] = a
+                continue
+            prior_codes = prior.reason_codes or []
+            update: dict[str, object] = {
+                "reason_codes": [*prior_codes, *(c for c in a.reason_codes or [] if c not in prior_codes)]
+            }
+            if prior.evidence is not None:
+                update["evidence"] = [*prior.evidence, *(a.evidence or [])]
+            merged[key] = prior.model_copy(update=update)
+    # The oldest fetch bounds the freshness of the merged view.
+    retrieved_at = min(r.retrieved_at for r in results)
+    if any(isinstance(r, AvailabilityAssessmentsProjectionResponseV1) for r in results):
+        return AvailabilityAssessmentsProjectionResponseV1(
+            retrieved_at=retrieved_at,
+            assessments=[
+                AvailabilityAssessmentProjectionV1.model_validate(a.model_dump(exclude={"evidence"}))
+                if isinstance(a, AvailabilityAssessmentV1)
+                else a
+                for a in merged.values()
+            ],
+        )
+    return AvailabilityAssessmentsResponseV1(retrieved_at=retrieved_at, assessments=list(merged.values()))
+
+
+class AvailabilityOrchestrator:
+    """Fan out to several availability engines concurrently and merge the results.
+
+    All engines share one deadline. Engines that miss it (or fail) are dropped
+    with a warning and the remaining results are returned; the call only fails
+    when no engine produced a result.
+    """
+
+    def __init__(self, engines: Sequence[tuple[str, AvailabilityEngine]], *, deadline_seconds: float) -> None:
+        if not engines:
+            raise ValueError("at least one engine is required")
+        self._engines = list(engines)
+        self._deadline_seconds = deadline_seconds
+
+    async def assess_tmdb_tv_watch_providers_v1(
+        self,
+        *,
+        series_id: int,
+        country: str | None,
+        api_key: str,
+        client: httpx.AsyncClient,
+        include_evidence: bool = True,
+    ) -> AvailabilityAssessmentsResultV1:
+        tasks = {
+            name: asyncio.ensure_future(
+                engine.assess_tmdb_tv_watch_providers_v1(
+                    series_id=series_id,
+                    country=country,
+                    api_key=api_key,
+                    client=client,
+                    include_evidence=include_evidence,
+                )
+            )
+            for name, engine in self._engines
+        }
+        try:
+            _, pending = await asyncio.wait(tasks.values(), timeout=self._deadline_seconds)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        # Let cancelled engines unwind before their (shared) client is reused.
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results: list[AvailabilityAssessmentsResultV1] = []
+        errors: list[BaseException] = []
+        for name, task in tasks.items():
+            if task in pending:
+                logger.warning(
+                    "availability_engine_deadline_exceeded",
+                    extra={"engine": name, "series_id": series_id, "deadline_seconds": self._deadline_seconds},
+                )
+                continue
+            exc = task.exception()
+            if exc is not None:
+                logger.warning(
+                    "availability_engine_failed",
+                    extra={"engine": name, "series_id": series_id, "error": repr(exc)},
+                )
+                errors.append(exc)
+                continue
+            results.append(task.result())
+
+        if results:
+            return _merge(results)
+        if errors:
+            raise errors[0]
+        raise httpx.TimeoutException(f"no availability engine finished within {self._deadline_seconds}s")
@@ -6,7 +6,13 @@ from typing import Any
 
 import httpx
 
-from psma_api.models.availability import AvailabilityAssessmentV1, AvailabilityAssessmentsResponseV1
+from psma_api.models.availability import (
+    AvailabilityAssessmentProjectionV1,
+    AvailabilityAssessmentsProjectionResponseV1,
+    AvailabilityAssessmentsResponseV1,
+    AvailabilityAssessmentsResultV1,
+    AvailabilityAssessmentV1,
+)
 from psma_api.service_registry import ServiceCategory, tmdb_provider_id_to_service
 
 
@@ -17,10 +23,32 @@ class TmdbOffering:
     monetization_types: tuple[str, ...]
 
 
+ALL_REGIONS = "*"
+
+
 def _iso_country(country: str | None) -> str:
     return (country or "US").upper()
 
 
+def parse_regions(country: str | None) -> tuple[str, ...] | None:
+    """Parse a `country` parameter into regions.
+
+    Accepts a single code ("US"), a comma-separated list ("US,CA") or "*" for
+    every region TMDB returns (-> None). Codes are upper-cased, de-duplicated
+    and sorted so equivalent requests normalize to the same value.
+    """
+
+    if country is not None and country.strip() == ALL_REGIONS:
+        return None
+    parts = {p.strip().upper() for p in (country or "").split(",") if p.strip()}
+    return tuple(sorted(parts)) if parts else (_iso_country(None),)
+
+
+def region_key(country: str | None) -> str:
+    regions = parse_regions(country)
+    return ALL_REGIONS if regions is None else ",".join(regions)
+
+
 def _infer_category_from_monetization(monetization_types: set[str]) -> ServiceCategory:
     if "flatrate" in monetization_types or "subscription" in monetization_types:
         return "svod"
@@ -70,76 +98,110 @@ def _extract_tmdb_offerings(region_result: Any) -> list[TmdbOffering]:
     return offerings
 
 
+async def fetch_tmdb_tv_watch_providers(client: httpx.AsyncClient, *, series_id: int, api_key: str) -> Any:
+    """GET the raw `/tv/{id}/watch/providers` payload (raises on HTTP errors)."""
+
+    url = f"https://api.themoviedb.org/3/tv/{series_id}/watch/providers"
+    resp = await client.get(url, params={"api_key": api_key})
+    resp.raise_for_status()
+    return resp.json()
+
+
 async def assess_tmdb_tv_watch_providers_v1(
     *,
     series_id: int,
     country: str | None,
     api_key: str,
     client: httpx.AsyncClient,
-) -> AvailabilityAssessmentsResponseV1:
+    include_evidence: bool = True,
+) -> AvailabilityAssessmentsResultV1:
     """Assess best-effort on-demand availability for a TMDB TV series.
 
     This uses TMDB's watch-provider snapshot API. It does not attempt to infer
     true start/end windows beyond "available now".
-    """
 
-    region = _iso_country(country)
-    url = f"https://api.themoviedb.org/3/tv/{series_id}/watch/providers"
+    `country` may name several regions ("US,CA") or "*" for all of them; TMDB
+    returns every region in one payload, so this is still a single upstream call.
 
-    resp = await client.get(url, params={"api_key": api_key})
-    resp.raise_for_status()
-    payload: Any = resp.json()
+    With `include_evidence=False` no evidence objects are built at all and the
+    result is an `AvailabilityAssessmentsProjectionResponseV1`, whose
+    assessments simply have no `evidence`.
+    """
+
+    regions = parse_regions(country)
+    payload = await fetch_tmdb_tv_watch_providers(client, series_id=series_id, api_key=api_key)
 
     results: Any = payload.get("results") if isinstance(payload, dict) else None
-    region_result: Any = results.get(region) if isinstance(results, dict) else None
+    if not isinstance(results, dict):
+        results = {}
+    if regions is None:
+        regions = tuple(sorted(k for k in results if isinstance(k, str)))
 
-    offerings = _extract_tmdb_offerings(region_result)
     mapping = tmdb_provider_id_to_service()
 
     now = datetime.now(timezone.utc)
     title_id = f"tmdb:tv:{series_id}"
 
     assessments: list[AvailabilityAssessmentV1] = []
-    for off in offerings:
-        reason_codes: list[str] = ["TMDB_WATCH_PROVIDER_PRESENT"]
-
-        entry = mapping.get(off.provider_id)
-        if entry is not None:
-            service_id = entry.service_id
-            provider_category: ServiceCategory = entry.category
-            reason_codes.append("SERVICE_ID_MAPPED")
-        else:
-            service_id = f"unknown-tmdb-provider-{off.provider_id}"
-            provider_category = _infer_category_from_monetization(set(off.monetization_types))
-            reason_codes.append("SERVICE_ID_UNKNOWN")
-            if provider_category != "unknown":
-                reason_codes.append("CATEGORY_INFERRED")
-
-        details: dict[str, Any] = {
-            "tmdb_series_id": series_id,
-            "tmdb_provider_id": off.provider_id,
-            "tmdb_provider_name": off.provider_name,
-            "monetization_types": list(off.monetization_types),
-        }
-
-        assessments.append(
-            AvailabilityAssessmentV1(
-                title_id=title_id,
-                country=region,
-                service_id=service_id,
-                provider_category=provider_category,  # type: ignore[arg-type]
-                availability_now="true",
-                confidence="medium",
-                reason_codes=reason_codes,
-                evidence=[
-                    {
-                        "source_id": "tmdb_watch_providers",
-                        "retrieved_at": now,
-                        "source_ref": f"tmdb:/tv/{series_id}/watch/providers",
-                        "details": details,
-                    }
-                ],
+    projections: list[AvailabilityAssessmentProjectionV1] = []
+    for region in regions:
+        offerings = _extract_tmdb_offerings(results.get(region))
+        for off in offerings:
+            reason_codes: list[str] = ["TMDB_WATCH_PROVIDER_PRESENT"]
+
+            entry = mapping.get(off.provider_id)
+            if entry is not None:
+                service_id = entry.service_id
+                provider_category: ServiceCategory = entry.category
+                reason_codes.append("SERVICE_ID_MAPPED")
+            else:
+                service_id = f"unknown-tmdb-provider-{off.provider_id}"
+                provider_category = _infer_category_from_monetization(set(off.monetization_types))
+                reason_codes.append("SERVICE_ID_UNKNOWN")
+                if provider_category != "unknown":
+                    reason_codes.append("CATEGORY_INFERRED")
+
+            if not include_evidence:
+                projections.append(
+                    AvailabilityAssessmentProjectionV1(
+                        title_id=title_id,
+                        country=region,
+                        service_id=service_id,
+                        provider_category=provider_category,  # type: ignore[arg-type]
+                        availability_now="true",
+                        confidence="medium",
+                        reason_codes=reason_codes,
+                    )
+                )
+                continue
+
+            details: dict[str, Any] = {
+                "tmdb_series_id": series_id,
+                "tmdb_provider_id": off.provider_id,
+                "tmdb_provider_name": off.provider_name,
+                "monetization_types": list(off.monetization_types),
+            }
+
+            assessments.append(
+                AvailabilityAssessmentV1(
+                    title_id=title_id,
+                    country=region,
+                    service_id=service_id,
+                    provider_category=provider_category,  # type: ignore[arg-type]
+                    availability_now="true",
+                    confidence="medium",
+                    reason_codes=reason_codes,
+                    evidence=[
+                        {
+                            "source_id": "tmdb_watch_providers",
+                            "retrieved_at": now,
+                            "source_ref": f"tmdb:/tv/{series_id}/watch/providers",
+                            "details": details,
+                        }
+                    ],
+                )
             )
-        )
 
+    if not include_evidence:
+        return AvailabilityAssessmentsProjectionResponseV1(retrieved_at=now, assessments=projections)
     return AvailabilityAssessmentsResponseV1(retrieved_at=now, assessments=assessments)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor
+from datetime import datetime
+import json
+
+from pydantic import ValidationError
+
+from psma_api.engines.planner_v1 import DEFAULT_POLICY, PlannerPolicy, plan_v1
+from psma_api.models.planning import PlanRequestV1
+
+
+def plan_ndjson_line(line: bytes, now: datetime, policy: PlannerPolicy) -> tuple[bool, bytes]:
+    """Validate and plan one NDJSON record; returns (ok, plan or error JSON).
+
+    Runs in an executor, so parsing, validation, planning and the response
+    dump all happen off the event loop.
+    """
+
+    try:
+        request = PlanRequestV1.model_validate_json(line)
+    except ValidationError as exc:
+        return False, exc.json(include_url=False, include_input=False).encode("utf-8")
+    return True, plan_v1(request, now=now, policy=policy).model_dump_json(exclude_none=True).encode("utf-8")
+
+
+async def ndjson_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    """Split a byte stream into (line number, record) pairs, skipping blank lines."""
+
+    buf = bytearray()
+    lineno = 0
+    async for chunk in chunks:
+        buf.extend(chunk)
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            lineno += 1
+            record = bytes(buf[start:end]).strip()
+            start = end + 1
+            if record:
+                yield lineno, record
+        del buf[:start]
+    if buf.strip():
+        yield lineno + 1, bytes(buf).strip()
+
+
+def _line(lineno: int, ok: bool, body: bytes) -> bytes:
+    if ok:
+        return b'{"type":"plan","line":%d,"plan":%s}\n' % (lineno, body)
+    return b'{"type":"error","line":%d,"errors":%s}\n' % (lineno, body)
+
+
+async def stream_bulk_plans(
+    records: AsyncIterable[tuple[int, bytes]],
+    *,
+    now: datetime,
+    executor: Executor | None,
+    max_in_flight: int,
+    policy: PlannerPolicy = DEFAULT_POLICY,
+) -> AsyncIterator[bytes]:
+    """Plan NDJSON records and yield NDJSON result lines as each finishes.
+
+    Up to `max_in_flight` records are planned concurrently on `executor` (the
+    loop's default thread pool when None, so planning never runs on the event
+    loop) and results are emitted in completion order (each line carries the
+    input `line` number). Records are pulled only while the window has room.
+
+    Line types: `plan`, `error` (per invalid record), `summary` (last).
+    """
+
+    counts = {"plans": 0, "errors": 0}
+
+    def emit(lineno: int, ok: bool, body: bytes) -> bytes:
+        counts["plans" if ok else "errors"] += 1
+        return _line(lineno, ok, body)
+
+    loop = asyncio.get_running_loop()
+    pending: dict[asyncio.Future[tuple[bool, bytes]], int] = {}
+    source = aiter(records)
+    # Reading the next record races the plans in flight, so a slow request body
+    # never holds back results that are already done.
+    reading: asyncio.Future[tuple[int, bytes]] | None = None
+    exhausted = False
+    try:
+        while True:
+            if reading is None and not exhausted and len(pending) < max_in_flight:
+                reading = asyncio.ensure_future(anext(source))
+            waiting: set[asyncio.Future[object]] = set(pending)
+            if reading is not None:
+                waiting.add(reading)
+            if not waiting:
+                break
+            finished, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            for future in finished:
+                if future in pending:
+                    yield emit(pending.pop(future), *future.result())
+            if reading is not None and reading in finished:
+                try:
+                    lineno, record = reading.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending[loop.run_in_executor(executor, plan_ndjson_line, record, now, policy)] = lineno
+                reading = None
+    finally:
+        # Client went away (or we are done): drop records not yet started.
+        if reading is not None:
+            reading.cancel()
+        for future in pending:
+            future.cancel()
+
+    yield (json.dumps({"type": "summary", **counts}, separators=(",", ":")) + "\n").encode("utf-8")
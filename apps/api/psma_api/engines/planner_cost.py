@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+import math
+
+
+# A title's required interval on a service: (start, end) in seconds since now; end None = open-ended.
+Span = tuple[float, float | None]
+
+_EPS = 1e-9
+
+
+class _Costs:
+    """Memoized per-service cost of a set of spans, with a deterministic work budget."""
+
+    def __init__(self, service_cost: Callable[[str, frozenset[Span]], float], max_evaluations: int) -> None:
+        self._service_cost = service_cost
+        self._memo: dict[tuple[str, frozenset[Span]], float] = {}
+        self.remaining = max_evaluations
+
+    def __call__(self, service_id: str, load: Counter[Span]) -> float:
+        if not load:
+            return 0.0
+        key = (service_id, frozenset(load))
+        cost = self._memo.get(key)
+        if cost is None:
+            self.remaining -= 1
+            cost = self._memo[key] = self._service_cost(service_id, key[1])
+        return cost
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining <= 0
+
+
+def _components(candidates: Mapping[str, Sequence[tuple[str, Span]]]) -> list[list[str]]:
+    """Group titles that (transitively) share a candidate service; each group is solved on its own."""
+
+    parent: dict[str, str] = {}
+
+    def find(s: str) -> str:
+        while parent.setdefault(s, s) != s:
+            parent[s] = parent[parent[s]]
+            s = parent[s]
+        return s
+
+    for options in candidates.values():
+        first = find(options[0][0])
+        for service_id, _ in options[1:]:
+            root = find(service_id)
+            if root != first:
+                parent[max(root, first)] = min(root, first)
+                first = min(root, first)
+
+    groups: dict[str, list[str]] = {}
+    for title_id in sorted(candidates):
+        groups.setdefault(find(candidates[title_id][0][0]), []).append(title_id)
+    return [groups[root] for root in sorted(groups)]
+
+
+def _solve_exact(
+    titles: list[str],
+    candidates: Mapping[str, Sequence[tuple[str, Span]]],
+    costs: _Costs,
+) -> dict[str, str]:
+    # Enumerate every assignment; the first cheapest one in candidate
+    # preference order wins. No pruning: a service's cost is not monotone in
+    # its spans (a new span can bridge two billing blocks into one).
+    services = sorted({s for t in titles for s, _ in candidates[t]})
+    loads: dict[str, Counter[Span]] = {s: Counter() for s in services}
+    chosen: list[str] = []
+    best: list[str] = []
+    best_cost = math.inf
+
+    def walk(i: int) -> None:
+        nonlocal best, best_cost
+        if i == len(titles):
+            total = sum(costs(s, loads[s]) for s in services)
+            if total < best_cost - _EPS:
+                best, best_cost = list(chosen), total
+            return
+        for service_id, span in candidates[titles[i]]:
+            loads[service_id][span] += 1
+            chosen.append(service_id)
+            walk(i + 1)
+            chosen.pop()
+            loads[service_id][span] -= 1
+            if not loads[service_id][span]:
+                del loads[service_id][span]
+
+    walk(0)
+    return dict(zip(titles, best))
+
+
+def _solve_greedy(
+    titles: list[str],
+    candidates: Mapping[str, Sequence[tuple[str, Span]]],
+    costs: _Costs,
+) -> dict[str, str]:
+    """Cheapest-insertion start, then local search until no move helps or the budget runs out.
+
+    Moves: re-home one title, or close a service by re-homing all of its
+    titles. Only strict improvements are taken, so ties keep the earlier
+    (preferred) choice and the result is deterministic.
+    """
+
+    loads: dict[str, Counter[Span]] = {s: Counter() for t in titles for s, _ in candidates[t]}
+    span_on = {t: dict(candidates[t]) for t in titles}
+    assignment: dict[str, str] = {}
+
+    def add(title_id: str, service_id: str) -> None:
+        assignment[title_id] = service_id
+        loads[service_id][span_on[title_id][service_id]] += 1
+
+    def remove(title_id: str) -> str:
+        service_id = assignment.pop(title_id)
+        load = loads[service_id]
+        span = span_on[title_id][service_id]
+        load[span] -= 1
+        if not load[span]:
+            del load[span]
+        return service_id
+
+    def added_cost(title_id: str, service_id: str) -> float:
+        load = loads[service_id]
+        span = span_on[title_id][service_id]
+        if span in load:
+            return 0.0
+        before = costs(service_id, load)
+        load[span] += 1
+        after = costs(service_id, load)
+        del load[span]
+        return after - before
+
+    def cheapest(title_id: str, *, exclude: str | None = None) -> str | None:
+        best: str | None = None
+        best_cost = math.inf
+        for service_id, _ in candidates[title_id]:
+            if service_id == exclude:
+                continue
+            cost = added_cost(title_id, service_id)
+            if cost < best_cost - _EPS:
+                best, best_cost = service_id, cost
+        return best
+
+    # Most constrained titles first, so flexible ones can join their services.
+    for title_id in sorted(titles, key=lambda t: (len(candidates[t]), t)):
+        service_id = cheapest(title_id)
+        assert service_id is not None
+        add(title_id, service_id)
+
+    improved = True
+    while improved and not costs.exhausted:
+        improved = False
+        for title_id in titles:
+            if costs.exhausted:
+                break
+            current = assignment[title_id]
+            before = costs(current, loads[current])
+            remove(title_id)
+            saved = before - costs(current, loads[current])
+            target = cheapest(title_id, exclude=current)
+            if target is not None and added_cost(title_id, target) < saved - _EPS:
+                add(title_id, target)
+                improved = True
+            else:
+                add(title_id, current)
+
+        for service_id in sorted(loads):
+            if costs.exhausted:
+                break
+            moving = [t for t in titles if assignment[t] == service_id]
+            if not moving or any(len(candidates[t]) < 2 for t in moving):
+                continue
+            touched = {s for t in moving for s, _ in candidates[t]}
+            before = sum(costs(s, loads[s]) for s in touched)
+            for t in moving:
+                remove(t)
+            for t in moving:
+                target = cheapest(t, exclude=service_id)
+                assert target is not None
+                add(t, target)
+            if sum(costs(s, loads[s]) for s in touched) < before - _EPS:
+                improved = True
+                continue
+            for t in moving:
+                remove(t)
+                add(t, service_id)
+    return assignment
+
+
+def assign_min_cost(
+    candidates: Mapping[str, Sequence[tuple[str, Span]]],
+    service_cost: Callable[[str, frozenset[Span]], float],
+    *,
+    exact_max_assignments: int,
+    max_evaluations: int,
+) -> tuple[dict[str, str], bool]:
+    """Pick one service per title so the summed `service_cost` is minimal.
+
+    `candidates` maps each title to its (service_id, span) options in
+    preference order (ties resolve to earlier options). Independent groups of
+    titles are solved separately: exactly when a group has at most
+    `exact_max_assignments` combinations, otherwise greedily with local search.
+    `max_evaluations` caps the number of `service_cost` calls per heuristic
+    group; it bounds latency like a time budget would, but the result does not
+    depend on machine load.
+
+    Returns the assignment and whether every group was solved exactly.
+    """
+
+    assignment: dict[str, str] = {}
+    exact = True
+    for titles in _components(candidates):
+        combinations = 1
+        for t in titles:
+            combinations *= len(candidates[t])
+            if combinations > exact_max_assignments:
+                break
+        costs = _Costs(service_cost, max_evaluations)
+        if combinations <= exact_max_assignments:
+            assignment.update(_solve_exact(titles, candidates, costs))
+        else:
+            exact = False
+            assignment.update(_solve_greedy(titles, candidates, costs))
+    return assignment, exact
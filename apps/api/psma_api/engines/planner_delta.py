@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+
+from psma_api.engines.planner_v1 import (
+    DEFAULT_POLICY,
+    OBJECTIVE_MIN_COST,
+    PlannerPolicy,
+    PlanningInputIndex,
+    ServiceSelection,
+    plan_service_v1,
+    select_services_by_cost,
+)
+from psma_api.models.availability import AvailabilityAssessmentV1
+from psma_api.models.planning import (
+    PlanDeltaRequestV1,
+    PlanDeltaResponseV1,
+    PlanEventV1,
+    PlanQuestionV1,
+    PlanRequestV1,
+    PlanningInputV1,
+)
+
+
+InputKey = tuple[str, str | None, tuple[str, ...]]
+
+
+def input_key(key: str, service_id: str | None, title_ids: list[str] | None) -> InputKey:
+    return (key, service_id, tuple(title_ids or ()))
+
+
+@dataclass
+class _ServiceState:
+    # One assessment per title (the country is fixed per plan).
+    assessments: dict[str, AvailabilityAssessmentV1] = field(default_factory=dict)
+    inputs: dict[InputKey, PlanningInputV1] = field(default_factory=dict)
+    # Planned lazily and shared by every state holding this (unchanged) bucket.
+    result: tuple[list[PlanEventV1], list[PlanQuestionV1]] | None = None
+
+    def copy(self) -> _ServiceState:
+        return _ServiceState(assessments=dict(self.assessments), inputs=dict(self.inputs))
+
+
+@dataclass(frozen=True)
+class PlanState:
+    """What a plan was generated from, bucketed by service.
+
+    States are never mutated: a delta copies only the buckets it touches, so
+    older tokens stay valid and an update costs time proportional to the
+    services it changes.
+    """
+
+    country: str
+    horizon_days: int
+    now: datetime
+    permanent: frozenset[str]
+    services: dict[str, _ServiceState]
+    # Inputs without a service_id (title-scoped across services, or plan-wide).
+    global_inputs: dict[InputKey, PlanningInputV1]
+    # min_cost selections per policy; not carried over by `replace()`.
+    _selections: dict[PlannerPolicy, dict[str, ServiceSelection]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_request(cls, request: PlanRequestV1, *, now: datetime) -> PlanState:
+        services: dict[str, _ServiceState] = {}
+        global_inputs: dict[InputKey, PlanningInputV1] = {}
+        for a in request.assessments:
+            if a.country != request.country:
+                continue
+            services.setdefault(a.service_id, _ServiceState()).assessments[a.title_id] = a
+        for inp in request.inputs or []:
+            key = input_key(inp.key, inp.service_id, inp.title_ids)
+            if inp.service_id is None:
+                target = global_inputs
+            else:
+                target = services.setdefault(inp.service_id, _ServiceState()).inputs
+            # Last wins: re-insert so the order matches the request.
+            target.pop(key, None)
+            target[key] = inp
+        return cls(
+            country=request.country,
+            horizon_days=request.horizon_days,
+            now=now if now.tzinfo is not None else now.replace(tzinfo=timezone.utc),
+            permanent=frozenset(s.strip() for s in request.permanent_service_ids if s.strip()),
+            services=services,
+            global_inputs=global_inputs,
+        )
+
+    @property
+    def minimizes_cost(self) -> bool:
+        objective = PlanningInputIndex(self.global_inputs.values()).service_value(key="plan_objective", service_id=None)
+        return isinstance(objective, str) and objective.strip() == OBJECTIVE_MIN_COST
+
+    def _cost_selection(self, service_id: str, *, policy: PlannerPolicy) -> ServiceSelection:
+        selections = self._selections.get(policy)
+        if selections is None:
+            inputs = [*self.global_inputs.values(), *(inp for b in self.services.values() for inp in b.inputs.values())]
+            selections = self._selections[policy] = select_services_by_cost(
+                {service_id: list(b.assessments.values()) for service_id, b in self.services.items()},
+                now=self.now,
+                horizon_days=self.horizon_days,
+                inputs=PlanningInputIndex(inputs),
+                permanent=self.permanent,
+                policy=policy,
+            )
+        return selections.get(service_id) or ServiceSelection([])
+
+    def plan_service(self, service_id: str, *, policy: PlannerPolicy) -> tuple[list[PlanEventV1], list[PlanQuestionV1]]:
+        bucket = self.services.get(service_id)
+        if bucket is None or service_id in self.permanent:
+            return [], []
+        if self.minimizes_cost:
+            # Any change can move titles between services, so plan from the
+            # whole state's selection instead of the bucket's cached result.
+            selection = self._cost_selection(service_id, policy=policy)
+            events, questions = plan_service_v1(
+                service_id,
+                selection.assessments,
+                now=self.now,
+                horizon_days=self.horizon_days,
+                inputs=PlanningInputIndex([*bucket.inputs.values(), *self.global_inputs.values()]),
+                policy=policy,
+                extra_assumptions=selection.subscribe_assumptions,
+            )
+            return events, [*questions, *selection.questions]
+        if bucket.result is None:
+            inputs = PlanningInputIndex([*bucket.inputs.values(), *self.global_inputs.values()])
+            bucket.result = plan_service_v1(
+                service_id,
+                list(bucket.assessments.values()),
+                now=self.now,
+                horizon_days=self.horizon_days,
+                inputs=inputs,
+                policy=policy,
+            )
+        return bucket.result
+
+
+def apply_plan_delta(state: PlanState, delta: PlanDeltaRequestV1) -> tuple[PlanState, list[str]]:
+    """Apply a delta's changes to `state`; returns the new state and affected services."""
+
+    services = dict(state.services)
+    touched: dict[str, _ServiceState] = {}
+    affected: set[str] = set()
+
+    def bucket(service_id: str) -> _ServiceState:
+        if service_id not in touched:
+            prior = services.get(service_id)
+            touched[service_id] = services[service_id] = prior.copy() if prior is not None else _ServiceState()
+        affected.add(service_id)
+        return touched[service_id]
+
+    for key in delta.remove_assessments:
+        if key.country == state.country and key.service_id in services:
+            bucket(key.service_id).assessments.pop(key.title_id, None)
+    for a in delta.upsert_assessments:
+        if a.country == state.country:
+            bucket(a.service_id).assessments[a.title_id] = a
+
+    global_inputs = state.global_inputs
+    changed_titles: set[str] = set()
+
+    def inputs_for(service_id: str | None, title_ids: list[str] | None) -> dict[InputKey, PlanningInputV1]:
+        nonlocal global_inputs
+        if service_id is not None:
+            return bucket(service_id).inputs
+        if global_inputs is state.global_inputs:
+            global_inputs = dict(global_inputs)
+        changed_titles.update(title_ids or ())
+        return global_inputs
+
+    for k in delta.remove_inputs:
+        inputs_for(k.service_id, k.title_ids).pop(input_key(k.key, k.service_id, k.title_ids), None)
+    for inp in delta.upsert_inputs:
+        target = inputs_for(inp.service_id, inp.title_ids)
+        key = input_key(inp.key, inp.service_id, inp.title_ids)
+        # Re-insert so a replaced input also moves to the end (last wins).
+        target.pop(key, None)
+        target[key] = inp
+
+    if changed_titles:
+        # Cross-service inputs only affect services carrying one of their titles.
+        for service_id, prior in state.services.items():
+            if service_id not in touched and not changed_titles.isdisjoint(prior.assessments):
+                bucket(service_id)
+
+    permanent = state.permanent
+    if delta.permanent_service_ids is not None:
+        permanent = frozenset(s.strip() for s in delta.permanent_service_ids if s.strip())
+        affected |= (permanent ^ state.permanent) & services.keys()
+
+    new_state = replace(state, permanent=permanent, services=services, global_inputs=global_inputs)
+    if (state.minimizes_cost or new_state.minimizes_cost) and (affected or global_inputs is not state.global_inputs):
+        # Cost-minimizing plans are chosen jointly: any change may move titles anywhere.
+        affected |= services.keys()
+    return new_state, sorted(affected)
+
+
+def diff_plans(
+    before: PlanState,
+    after: PlanState,
+    service_ids: list[str],
+    *,
+    policy: PlannerPolicy = DEFAULT_POLICY,
+) -> tuple[list[PlanEventV1], list[PlanEventV1], list[PlanQuestionV1], list[str]]:
+    """Event/question deltas for `service_ids`: (added, removed, questions added, question ids removed)."""
+
+    events_added: list[PlanEventV1] = []
+    events_removed: list[PlanEventV1] = []
+    questions_added: list[PlanQuestionV1] = []
+    questions_removed: list[str] = []
+    for service_id in service_ids:
+        old_events, old_questions = before.plan_service(service_id, policy=policy)
+        new_events, new_questions = after.plan_service(service_id, policy=policy)
+        events_removed.extend(e for e in old_events if e not in new_events)
+        events_added.extend(e for e in new_events if e not in old_events)
+
+        old_by_id = {q.id: q for q in old_questions}
+        new_by_id = {q.id: q for q in new_questions}
+        questions_removed.extend(qid for qid in sorted(old_by_id) if qid not in new_by_id)
+        questions_added.extend(new_by_id[qid] for qid in sorted(new_by_id) if old_by_id.get(qid) != new_by_id[qid])
+    return events_added, events_removed, questions_added, questions_removed
+
+
+class PlanStateStore:
+    """Bounded LRU of plan token -> `PlanState` for the delta route."""
+
+    def __init__(self, *, max_entries: int = 1_000) -> None:
+        self._max_entries = max(1, max_entries)
+        self._states: OrderedDict[str, PlanState] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, token: str) -> PlanState | None:
+        state = self._states.get(token)
+        if state is not None:
+            self._states.move_to_end(token)
+        return state
+
+    def put(self, token: str, state: PlanState) -> None:
+        self._states[token] = state
+        self._states.move_to_end(token)
+        while len(self._states) > self._max_entries:
+            self._states.popitem(last=False)
+
+
+def plan_delta(
+    base: PlanState,
+    delta: PlanDeltaRequestV1,
+    *,
+    token: str,
+    base_token: str | None,
+    policy: PlannerPolicy = DEFAULT_POLICY,
+) -> tuple[PlanState, PlanDeltaResponseV1]:
+    state, affected = apply_plan_delta(base, delta)
+    added, removed, questions_added, questions_removed = diff_plans(base, state, affected, policy=policy)
+    return state, PlanDeltaResponseV1(
+        generated_at=base.now,
+        plan_token=token,
+        base_plan_token=base_token,
+        affected_service_ids=affected,
+        events_added=added,
+        events_removed=removed,
+        questions_added=questions_added,
+        questions_removed=questions_removed,
+    )
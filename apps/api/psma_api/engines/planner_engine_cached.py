@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import hashlib
+import json
+import math
+
+import pydantic_core
+
+from psma_api.cache import SizedLRUCache
+from psma_api.engines.planner_v1 import OBJECTIVE_MIN_COST, latest_retrieved_at
+from psma_api.models.planning import PlanRequestV1, PlanResponseV1
+from psma_api.ports.planner_engine import PlannerEngine
+
+
+def quantize_now(now: datetime, *, granularity_seconds: float) -> datetime:
+    """Round `now` down to a multiple of `granularity_seconds` (UTC)."""
+
+    if granularity_seconds <= 0:
+        return now
+    ts = math.floor(now.timestamp() / granularity_seconds) * granularity_seconds
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def _json(value: object) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def plan_request_key(request: PlanRequestV1, *, now: datetime) -> str:
+    """Canonical hash of everything the planner reads from `request`, plus `now`.
+
+    Normalization keeps equal plans on equal keys:
+    - assessments are sorted, other-country ones dropped, and `evidence` is
+      ignored (its `retrieved_at` changes on every fetch). The min_cost
+      objective breaks ties on evidence freshness, so with that objective each
+      assessment's latest `retrieved_at` stays in the key;
+    - inputs are resolved with the planner's last-wins rule per scope, so
+      reordering or repeating them does not change the key, and provenance
+      fields (source_id, collected_at, notes) are ignored;
+    - permanent services are a sorted set.
+    """
+
+    digest = hashlib.sha256()
+    permanent = sorted({s.strip() for s in request.permanent_service_ids if s.strip()})
+    digest.update(_json([request.country, request.horizon_days, permanent, now.isoformat()]).encode("utf-8"))
+
+    # Same scoping as `PlanningInputIndex`: service-wide unless title-scoped.
+    resolved: dict[tuple[str, str | None, str | None], object] = {}
+    for inp in request.inputs or []:
+        for title_id in inp.title_ids or [None]:
+            resolved[(inp.key, inp.service_id, title_id)] = inp.value
+    objective = resolved.get(("plan_objective", None, None))
+    min_cost = isinstance(objective, str) and objective.strip() == OBJECTIVE_MIN_COST
+
+    assessments = sorted(
+        pydantic_core.to_json(a, exclude={"evidence"}) + (b"@%r" % latest_retrieved_at(a) if min_cost else b"")
+        for a in request.assessments
+        if a.country == request.country
+    )
+    for blob in assessments:
+        digest.update(blob)
+        digest.update(b"\n")
+
+    for entry in sorted(_json([*k, v]) for k, v in resolved.items()):
+        digest.update(entry.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class CachedPlannerEngine(PlannerEngine):
+    """Memoize plans by `plan_request_key`.
+
+    The planner is deterministic apart from `now`, so `now` is rounded down to
+    `now_granularity_seconds` and becomes part of the key: identical requests
+    within the same window are answered with one hash and one lookup (and get
+    the same `generated_at`).
+    """
+
+    def __init__(
+        self,
+        inner: PlannerEngine,
+        cache: SizedLRUCache[str, PlanResponseV1],
+        *,
+        now_granularity_seconds: float = 60.0,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._granularity = now_granularity_seconds
+
+    async def generate_plan_v1(
+        self, request: PlanRequestV1, *, now: datetime | None = None, request_json: bytes | None = None
+    ) -> PlanResponseV1:
+        now = quantize_now(now or datetime.now(timezone.utc), granularity_seconds=self._granularity)
+        key = plan_request_key(request, now=now)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        resp = await self._inner.generate_plan_v1(request, now=now, request_json=request_json)
+        self._cache.set(key, resp, size=len(pydantic_core.to_json(resp)))
+        return resp
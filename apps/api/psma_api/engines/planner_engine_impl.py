@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from psma_api.engines.planner_v1 import generate_plan_v1
+from datetime import datetime
+
+from psma_api.engines.planner_v1 import DEFAULT_POLICY, PlannerPolicy, generate_plan_v1
 from psma_api.models.planning import PlanRequestV1, PlanResponseV1
 from psma_api.ports.planner_engine import PlannerEngine
 
 
 class DefaultPlannerEngine(PlannerEngine):
-    async def generate_plan_v1(self, request: PlanRequestV1) -> PlanResponseV1:
-        return await generate_plan_v1(request)
+    def __init__(self, *, policy: PlannerPolicy = DEFAULT_POLICY) -> None:
+        self._policy = policy
+
+    async def generate_plan_v1(
+        self, request: PlanRequestV1, *, now: datetime | None = None, request_json: bytes | None = None
+    ) -> PlanResponseV1:
+        return await generate_plan_v1(request, now=now, policy=self._policy)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+
+from psma_api.engines.planner_v1 import DEFAULT_POLICY, PlannerPolicy, plan_v1
+from psma_api.models.planning import PlanRequestV1, PlanResponseV1
+from psma_api.ports.planner_engine import PlannerEngine
+
+
+def request_size(request: PlanRequestV1) -> int:
+    return len(request.assessments) + len(request.inputs)
+
+
+def _plan_in_worker(request_json: bytes, now: datetime, policy: PlannerPolicy) -> bytes:
+    # Runs in a pool process: parse, plan and dump there. Given the raw request
+    # body, the event loop only pays for handing over bytes and one response parse.
+    request = PlanRequestV1.model_validate_json(request_json)
+    return plan_v1(request, now=now, policy=policy).model_dump_json().encode()
+
+
+class ProcessPoolPlannerEngine(PlannerEngine):
+    """Run large plans in a process pool so they don't block the event loop.
+
+    Requests with fewer than `min_items` assessments + inputs are planned
+    inline: below that, planning blocks the loop for less than the offload
+    costs it. Pass the body as received (`request_json`); without it the
+    request is re-dumped on the loop, which for large requests costs nearly as
+    much as planning it. The pool is owned by the caller (created and shut down
+    in the lifespan).
+    """
+
+    def __init__(self, executor: Executor, *, min_items: int, policy: PlannerPolicy = DEFAULT_POLICY) -> None:
+        self._executor = executor
+        self._min_items = min_items
+        self._policy = policy
+
+    async def generate_plan_v1(
+        self, request: PlanRequestV1, *, now: datetime | None = None, request_json: bytes | None = None
+    ) -> PlanResponseV1:
+        now = now or datetime.now(timezone.utc)
+        if request_size(request) < self._min_items:
+            return plan_v1(request, now=now, policy=self._policy)
+
+        if request_json is None:
+            request_json = request.model_dump_json().encode()
+        loop = asyncio.get_running_loop()
+        body = await loop.run_in_executor(self._executor, _plan_in_worker, request_json, now, self._policy)
+        return PlanResponseV1.model_validate_json(body)
@@ -1,15 +1,57 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 import math
 
+from psma_api.engines.planner_cost import Span, assign_min_cost
 from psma_api.models.availability import AvailabilityAssessmentV1
-from psma_api.models.planning import PlanEventV1, PlanQuestionV1, PlanRequestV1, PlanResponseV1
+from psma_api.models.planning import PlanEventV1, PlanQuestionV1, PlanRequestV1, PlanResponseV1, PlanningInputV1
 
 
-_CONF_ORDER: dict[str, int] = {"high": 0, "medium": 1, "low": 2}
-_CATEGORY_ORDER: dict[str, int] = {"svod": 0, "live_bundle": 1, "avod": 2, "tvod": 3, "unknown": 4}
+@dataclass(frozen=True)
+class PlannerPolicy:
+    """Buffers from ADR-0004 (defaults are the MVP values)."""
+
+    # Days kept after a known `availability_window.end` before unsubscribing.
+    unsubscribe_buffer_days: int = 1
+    # Required intervals closer than this are merged into one subscription.
+    merge_gap_days: int = 1
+    # `plan_objective: min_cost`: solve exactly up to this many title -> service combinations...
+    cost_exact_max_assignments: int = 4_096
+    # ...otherwise greedily, with at most this many service cost evaluations per group of titles.
+    cost_max_evaluations: int = 20_000
+
+
+DEFAULT_POLICY = PlannerPolicy()
+
+
+_DAY = 86400.0
+# `monthly_price` is billed per started 30-day period.
+_BILLING_PERIOD = 30 * _DAY
+
+_CONF_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+OBJECTIVE_MIN_COST = "min_cost"
+
+
+@dataclass(slots=True)
+class _Interval:
+    # Seconds since `now`: the sweep compares floats rather than aware datetimes.
+    start: float
+    # None = open-ended: no watch estimate and no known window end.
+    end: float | None
+    assessments: list[AvailabilityAssessmentV1]
+    estimate_used: bool = False
+    window_end_used: bool = False
+
+    def absorb(self, other: _Interval) -> None:
+        self.end = None if self.end is None or other.end is None else max(self.end, other.end)
+        self.assessments.extend(other.assessments)
+        self.estimate_used |= other.estimate_used
+        self.window_end_used |= other.window_end_used
 
 
 def _is_plannable_service(service_id: str, assessments: list[AvailabilityAssessmentV1]) -> bool:
@@ -26,30 +68,40 @@ def _is_plannable_service(service_id: str, assessments: list[AvailabilityAssessm
     return True
 
 
-def _pick_best_assessment(assessments: list[AvailabilityAssessmentV1]) -> AvailabilityAssessmentV1:
-    # Deterministic ordering: availability_now true first, then confidence, then category.
-    def key(a: AvailabilityAssessmentV1) -> tuple[int, int, int, str, str]:
-        availability_rank = 0 if a.availability_now == "true" else 1
-        conf_rank = _CONF_ORDER.get(a.confidence, 99)
-        cat_rank = _CATEGORY_ORDER.get(a.provider_category, 99)
-        return (availability_rank, conf_rank, cat_rank, a.service_id, a.title_id)
-
-    return sorted(assessments, key=key)[0]
-
-
-def _get_latest_input_value(request: PlanRequestV1, *, key: str, service_id: str) -> object | None:
-    # Deterministic: last entry wins (caller controls order).
-    for inp in reversed(request.inputs or []):
-        if inp.key != key:
-            continue
-        if inp.service_id != service_id:
-            continue
-        return inp.value
-    return None
-
-
-def _get_int_input(request: PlanRequestV1, *, key: str, service_id: str) -> int | None:
-    value = _get_latest_input_value(request, key=key, service_id=service_id)
+class PlanningInputIndex:
+    """Last-wins lookup of planner inputs, built once per request.
+
+    Service-scoped values (inputs without `title_ids`) match
+    `(key, service_id)` exactly. Title-scoped values match a title on that
+    service, or on any service when the input has no `service_id`, and take
+    precedence over the service-scoped value.
+    """
+
+    def __init__(self, inputs: Iterable[PlanningInputV1]) -> None:
+        self._service: dict[tuple[str, str | None], object] = {}
+        self._title: dict[tuple[str, str | None, str], object] = {}
+        self.has_title_scope = False
+        # Deterministic: last entry wins (caller controls order).
+        for inp in inputs:
+            if not inp.title_ids:
+                self._service[(inp.key, inp.service_id)] = inp.value
+                continue
+            self.has_title_scope = True
+            for title_id in inp.title_ids:
+                self._title[(inp.key, inp.service_id, title_id)] = inp.value
+
+    def service_value(self, *, key: str, service_id: str | None) -> object | None:
+        return self._service.get((key, service_id))
+
+    def title_value(self, *, key: str, service_id: str, title_id: str) -> object | None:
+        for scope in (service_id, None):
+            value = self._title.get((key, scope, title_id))
+            if value is not None:
+                return value
+        return self.service_value(key=key, service_id=service_id)
+
+
+def _as_int(value: object | None) -> int | None:
     if isinstance(value, bool) or value is None:
         return None
     if isinstance(value, int):
@@ -64,8 +116,7 @@ def _get_int_input(request: PlanRequestV1, *, key: str, service_id: str) -> int
     return None
 
 
-def _get_float_input(request: PlanRequestV1, *, key: str, service_id: str) -> float | None:
-    value = _get_latest_input_value(request, key=key, service_id=service_id)
+def _as_float(value: object | None) -> float | None:
     if isinstance(value, bool) or value is None:
         return None
     if isinstance(value, (int, float)):
@@ -78,119 +129,413 @@ def _get_float_input(request: PlanRequestV1, *, key: str, service_id: str) -> fl
     return None
 
 
+def _seconds_since(now: datetime, dt: datetime | None) -> float | None:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - now).total_seconds()
+
+
+def _objective(inputs: PlanningInputIndex) -> str | None:
+    value = inputs.service_value(key="plan_objective", service_id=None)
+    return value.strip() if isinstance(value, str) else None
+
+
 def _question_id(*, key: str, service_id: str) -> str:
     return f"{service_id}:{key}"
 
 
-async def generate_plan_v1(request: PlanRequestV1) -> PlanResponseV1:
-    now = datetime.now(timezone.utc)
+def _required_interval(
+    a: AvailabilityAssessmentV1,
+    *,
+    now: datetime,
+    watch_days: float | None,
+    policy: PlannerPolicy,
+) -> _Interval | None:
+    """When the title must be subscribed to on this service, or None if never."""
 
-    permanent = {s.strip() for s in request.permanent_service_ids if s.strip()}
+    window = a.availability_window
+    window_start = _seconds_since(now, window.start) if window is not None else None
+    window_end = _seconds_since(now, window.end) if window is not None else None
+    if window_end is not None and window_end <= 0:
+        return None
 
-    by_service: dict[str, list[AvailabilityAssessmentV1]] = defaultdict(list)
-    for a in request.assessments:
-        # Defensive: ignore assessments for other countries.
-        if a.country != request.country:
-            continue
-        by_service[a.service_id].append(a)
+    # Subscribe as late as possible: now if available, else when the window opens.
+    if a.availability_now == "true":
+        start = max(0.0, window_start) if window_start is not None else 0.0
+    elif window_start is not None and window_start > 0:
+        start = window_start
+    else:
+        return None
 
-    events: list[PlanEventV1] = []
-    questions: list[PlanQuestionV1] = []
+    interval = _Interval(start=start, end=None, assessments=[a])
+    if watch_days is not None and watch_days > 0:
+        interval.end = start + math.ceil(watch_days) * _DAY
+        interval.estimate_used = True
+    if window_end is not None:
+        leave_by = window_end + policy.unsubscribe_buffer_days * _DAY
+        if interval.end is None or leave_by < interval.end:
+            interval.end = leave_by
+            interval.window_end_used = True
+    return interval
+
+
+def _merge_intervals(
+    intervals: list[_Interval],
+    *,
+    min_contract_days: int,
+    merge_gap_days: int,
+) -> list[_Interval]:
+    """Sort-and-sweep merge of one service's required intervals.
+
+    Each subscription lasts at least `min_contract_days`. The next interval is
+    folded into the current one when it starts within `merge_gap_days` of its
+    end, or when bridging the gap costs no more subscribed days than paying
+    for a separate billing period would.
+    """
+
+    min_contract = min_contract_days * _DAY
+    gap = merge_gap_days * _DAY
+    merged: list[_Interval] = []
+    for iv in sorted(intervals, key=lambda iv: iv.start):
+        current = merged[-1] if merged else None
+        if current is not None:
+            if current.end is None or iv.start <= current.end + gap:
+                current.absorb(iv)
+                continue
+            if iv.end is not None:
+                separate_days = max(iv.end, iv.start + min_contract) - iv.start
+                if max(iv.end, current.end) - current.end <= separate_days:
+                    current.absorb(iv)
+                    continue
+
+        if iv.end is not None:
+            iv.end = max(iv.end, iv.start + min_contract)
+        merged.append(iv)
+    return merged
+
+
+def _missing_input_question(*, key: str, service_id: str) -> PlanQuestionV1:
+    if key == "monthly_price":
+        return PlanQuestionV1(
+            id=_question_id(key=key, service_id=service_id),
+            key=key,
+            prompt=f"What does {service_id} cost per month?",
+            required=False,
+            service_id=service_id,
+            answer_schema={"type": "number", "minimum": 0},
+            rationale="Needed to compare services when minimizing cost; unpriced services are only used as a fallback.",
+        )
+    if key == "min_contract_days":
+        return PlanQuestionV1(
+            id=_question_id(key=key, service_id=service_id),
+            key=key,
+            prompt=f"What is the minimum contract/billing period (in days) for {service_id}?",
+            required=True,
+            service_id=service_id,
+            answer_schema={"type": "integer", "minimum": 1},
+            rationale="Needed to avoid scheduling an unsubscribe earlier than allowed.",
+        )
+    return PlanQuestionV1(
+        id=_question_id(key=key, service_id=service_id),
+        key=key,
+        prompt=f"Roughly how many days will you take to watch what you want on {service_id}?",
+        required=True,
+        service_id=service_id,
+        answer_schema={"type": "number", "minimum": 0.1},
+        rationale="Needed to estimate when you can unsubscribe without missing content.",
+    )
 
-    for service_id in sorted(by_service.keys()):
-        if service_id in permanent:
-            continue
 
-        service_assessments = by_service[service_id]
-        if not _is_plannable_service(service_id, service_assessments):
+async def generate_plan_v1(
+    request: PlanRequestV1,
+    *,
+    now: datetime | None = None,
+    policy: PlannerPolicy = DEFAULT_POLICY,
+) -> PlanResponseV1:
+    return plan_v1(request, now=now or datetime.now(timezone.utc), policy=policy)
+
+
+def _service_intervals(
+    service_id: str,
+    assessments: list[AvailabilityAssessmentV1],
+    *,
+    now: datetime,
+    horizon_end: float,
+    inputs: PlanningInputIndex,
+    policy: PlannerPolicy,
+) -> list[_Interval]:
+    service_watch_days = _as_float(inputs.service_value(key="estimated_watch_days", service_id=service_id))
+    intervals: list[_Interval] = []
+    for a in assessments:
+        watch_days = service_watch_days
+        if inputs.has_title_scope:
+            watch_days = _as_float(
+                inputs.title_value(key="estimated_watch_days", service_id=service_id, title_id=a.title_id)
+            )
+        iv = _required_interval(a, now=now, watch_days=watch_days, policy=policy)
+        if iv is not None and iv.start < horizon_end:
+            intervals.append(iv)
+    return intervals
+
+
+@dataclass
+class ServiceSelection:
+    """The assessments a service is planned for, plus notes from choosing them."""
+
+    assessments: list[AvailabilityAssessmentV1]
+    subscribe_assumptions: tuple[str, ...] = ()
+    questions: list[PlanQuestionV1] = field(default_factory=list)
+
+
+def latest_retrieved_at(a: AvailabilityAssessmentV1) -> float:
+    """Epoch seconds of the freshest evidence (the ADR-0004 freshness tie-breaker)."""
+
+    return max(e.retrieved_at.replace(tzinfo=e.retrieved_at.tzinfo or timezone.utc).timestamp() for e in a.evidence)
+
+
+def select_services_by_cost(
+    by_service: dict[str, list[AvailabilityAssessmentV1]],
+    *,
+    now: datetime,
+    horizon_days: int,
+    inputs: PlanningInputIndex,
+    permanent: set[str] | frozenset[str],
+    policy: PlannerPolicy = DEFAULT_POLICY,
+) -> dict[str, ServiceSelection]:
+    """Assign each wanted title to one service so the subscriptions cost least.
+
+    A service's cost is its `monthly_price` times the started 30-day periods
+    of its merged subscriptions (as `_merge_intervals` would schedule them,
+    cut at `horizon_days`). Titles already on a permanent service are
+    dropped. Titles with a priced option are assigned by `assign_min_cost`;
+    titles offered only by unpriced services go to one of them by the ADR-0004
+    tie-breakers (confidence, then latest `retrieved_at`, then `service_id`),
+    which also order the priced options (with price before `service_id`).
+    Unpriced services get an optional `monthly_price` question.
+    """
+
+    horizon_end = int(horizon_days) * _DAY
+    covered: set[str] = set()
+    # title -> [(service_id, span, assessment)]
+    options: dict[str, list[tuple[str, Span, AvailabilityAssessmentV1]]] = defaultdict(list)
+    for service_id in sorted(by_service):
+        assessments = by_service[service_id]
+        if not assessments or not _is_plannable_service(service_id, assessments):
             continue
-        best = _pick_best_assessment(service_assessments)
-
-        # MVP behavior: if anything suggests it's available now, subscribe now.
-        any_available_now = any(a.availability_now == "true" for a in service_assessments)
-        if not any_available_now:
+        intervals = _service_intervals(
+            service_id, assessments, now=now, horizon_end=horizon_end, inputs=inputs, policy=policy
+        )
+        for iv in intervals:
+            a = iv.assessments[0]
+            if service_id in permanent:
+                covered.add(a.title_id)
+            else:
+                options[a.title_id].append((service_id, (iv.start, iv.end), a))
+
+    prices: dict[str, float] = {}
+    for service_id in {s for opts in options.values() for s, _, _ in opts}:
+        price = _as_float(inputs.service_value(key="monthly_price", service_id=service_id))
+        if price is not None and price >= 0:
+            prices[service_id] = price
+
+    def preference(option: tuple[str, Span, AvailabilityAssessmentV1]) -> tuple[int, float, float, str]:
+        service_id, _, a = option
+        return (_CONF_ORDER.get(a.confidence, 99), -latest_retrieved_at(a), prices.get(service_id, 0.0), service_id)
+
+    candidates: dict[str, list[tuple[str, Span]]] = {}
+    chosen: dict[str, str] = {}
+    for title_id, opts in options.items():
+        if title_id in covered:
             continue
+        priced = sorted((o for o in opts if o[0] in prices), key=preference)
+        if priced:
+            candidates[title_id] = [(service_id, span) for service_id, span, _ in priced]
+        else:
+            chosen[title_id] = min(opts, key=preference)[0]
 
-        title_ids = sorted({a.title_id for a in service_assessments})
-        reason_codes = sorted({code for a in service_assessments for code in a.reason_codes})
-
-        subscribe_at = now
+    def service_cost(service_id: str, spans: frozenset[Span]) -> float:
+        min_contract_days = _as_int(inputs.service_value(key="min_contract_days", service_id=service_id))
+        if min_contract_days is None or min_contract_days <= 0:
+            # Planned as one open-ended subscription (see `plan_service_v1`).
+            spans = frozenset((start, None) for start, _ in spans)
+        merged = _merge_intervals(
+            [_Interval(start=start, end=end, assessments=[]) for start, end in spans],
+            min_contract_days=min_contract_days or 0,
+            merge_gap_days=policy.merge_gap_days,
+        )
+        periods = 0
+        for iv in merged:
+            end = horizon_end if iv.end is None else min(iv.end, horizon_end)
+            periods += max(1, math.ceil((end - iv.start) / _BILLING_PERIOD - 1e-9))
+        return prices[service_id] * periods
+
+    assignment, exact = assign_min_cost(
+        candidates,
+        service_cost,
+        exact_max_assignments=policy.cost_exact_max_assignments,
+        max_evaluations=policy.cost_max_evaluations,
+    )
+    chosen.update(assignment)
+
+    contested = {service_id for t, service_id in chosen.items() if len(options[t]) > 1}
+    selections: dict[str, ServiceSelection] = {}
+    for title_id, service_id in sorted(chosen.items()):
+        selection = selections.get(service_id)
+        if selection is None:
+            assumptions = ["service_chosen_by_min_cost" if service_id in prices else "service_chosen_by_tie_breaker"]
+            if service_id in contested:
+                assumptions.append("alternative_services_available")
+            if service_id in prices and not exact:
+                assumptions.append("min_cost_heuristic_used")
+            selection = selections[service_id] = ServiceSelection([], subscribe_assumptions=tuple(assumptions))
+        selection.assessments.extend(a for s, _, a in options[title_id] if s == service_id)
+
+    for service_id in sorted({s for opts in options.values() for s, _, _ in opts} - prices.keys()):
+        selection = selections.setdefault(service_id, ServiceSelection([]))
+        selection.questions.append(_missing_input_question(key="monthly_price", service_id=service_id))
+    return selections
+
+
+def plan_service_v1(
+    service_id: str,
+    assessments: list[AvailabilityAssessmentV1],
+    *,
+    now: datetime,
+    horizon_days: int,
+    inputs: PlanningInputIndex,
+    policy: PlannerPolicy = DEFAULT_POLICY,
+    extra_assumptions: tuple[str, ...] = (),
+) -> tuple[list[PlanEventV1], list[PlanQuestionV1]]:
+    """Events and questions for one (non-permanent) service.
+
+    Services are planned independently, so callers may re-plan a subset
+    (see `planner_delta`). `assessments` must already be filtered to the
+    request country. `extra_assumptions` are added to every subscribe.
+    """
+
+    if not assessments or not _is_plannable_service(service_id, assessments):
+        return [], []
+
+    horizon_end = int(horizon_days) * _DAY
+    intervals = _service_intervals(
+        service_id, assessments, now=now, horizon_end=horizon_end, inputs=inputs, policy=policy
+    )
+    if not intervals:
+        return [], []
+
+    # Unsubscribe scheduling (optional): requires explicit inputs.
+    # Keys are intentionally open-ended: the envelope supports adding new keys later.
+    min_contract_days = _as_int(inputs.service_value(key="min_contract_days", service_id=service_id))
+    missing: list[str] = []
+    if min_contract_days is None or min_contract_days <= 0:
+        missing.append("min_contract_days")
+    if any(iv.end is None for iv in intervals):
+        missing.append("estimated_watch_days")
+    if "min_contract_days" in missing:
+        # Without it no unsubscribe is safe: one open-ended subscription.
+        for iv in intervals:
+            iv.end = None
+    # Return structured questions so the caller can gather the missing inputs.
+    questions = [_missing_input_question(key=key, service_id=service_id) for key in missing]
 
+    events: list[PlanEventV1] = []
+    merged = _merge_intervals(
+        intervals,
+        min_contract_days=min_contract_days or 0,
+        merge_gap_days=policy.merge_gap_days,
+    )
+    for iv in merged:
+        title_ids = sorted({a.title_id for a in iv.assessments})
+        reason_codes = sorted({code for a in iv.assessments for code in a.reason_codes})
         subscribe_assumptions = [
             "availability_is_best_effort_snapshot",
             "billing_cycle_assumed_day_granularity",
         ]
-
+        if iv.start > 0:
+            subscribe_assumptions.append("subscribe_at_availability_window_start")
+        subscribe_assumptions.extend(extra_assumptions)
         events.append(
             PlanEventV1(
                 action="subscribe",
                 service_id=service_id,
-                effective_at=subscribe_at,
-                reason_codes=reason_codes or best.reason_codes,
+                effective_at=now + timedelta(seconds=iv.start),
+                reason_codes=reason_codes,
                 title_ids=title_ids,
                 assumptions=subscribe_assumptions,
             )
         )
 
-        # Unsubscribe scheduling (optional): requires explicit inputs.
-        # Keys are intentionally open-ended: the envelope supports adding new keys later.
-        min_contract_days = _get_int_input(request, key="min_contract_days", service_id=service_id)
-        estimated_watch_days = _get_float_input(request, key="estimated_watch_days", service_id=service_id)
+        # Only emit within the requested planning horizon.
+        if iv.end is None or iv.end > horizon_end:
+            continue
+        unsubscribe_assumptions = ["unsubscribe_based_on_user_inputs", "min_contract_days_used"]
+        if iv.estimate_used:
+            unsubscribe_assumptions.append("estimated_watch_days_used")
+        if iv.window_end_used:
+            unsubscribe_assumptions.extend(["availability_window_end_used", "unsubscribe_buffer_applied"])
+        events.append(
+            PlanEventV1(
+                action="unsubscribe",
+                service_id=service_id,
+                effective_at=now + timedelta(seconds=iv.end),
+                reason_codes=sorted({*reason_codes, "UNSUBSCRIBE_SCHEDULED"}),
+                title_ids=title_ids,
+                assumptions=unsubscribe_assumptions,
+            )
+        )
+    return events, questions
 
-        missing: list[str] = []
-        if min_contract_days is None or min_contract_days <= 0:
-            missing.append("min_contract_days")
-        if estimated_watch_days is None or estimated_watch_days <= 0:
-            missing.append("estimated_watch_days")
-
-        if not missing:
-            total_days = max(int(min_contract_days), int(math.ceil(float(estimated_watch_days))))
-            unsubscribe_at = subscribe_at + timedelta(days=total_days)
-
-            # Only emit within the requested planning horizon.
-            if unsubscribe_at <= now + timedelta(days=int(request.horizon_days)):
-                unsubscribe_reason_codes = sorted(set(reason_codes + ["UNSUBSCRIBE_SCHEDULED"]))
-                events.append(
-                    PlanEventV1(
-                        action="unsubscribe",
-                        service_id=service_id,
-                        effective_at=unsubscribe_at,
-                        reason_codes=unsubscribe_reason_codes,
-                        title_ids=title_ids,
-                        assumptions=[
-                            "unsubscribe_based_on_user_inputs",
-                            "min_contract_days_used",
-                            "estimated_watch_days_used",
-                        ],
-                    )
-                )
-        else:
-            # Return structured questions so the caller can gather the missing inputs.
-            for miss in missing:
-                if miss == "min_contract_days":
-                    questions.append(
-                        PlanQuestionV1(
-                            id=_question_id(key=miss, service_id=service_id),
-                            key=miss,
-                            prompt=f"What is the minimum contract/billing period (in days) for {service_id}?",
-                            required=True,
-                            service_id=service_id,
-                            answer_schema={"type": "integer", "minimum": 1},
-                            rationale="Needed to avoid scheduling an unsubscribe earlier than allowed.",
-                        )
-                    )
-                elif miss == "estimated_watch_days":
-                    questions.append(
-                        PlanQuestionV1(
-                            id=_question_id(key=miss, service_id=service_id),
-                            key=miss,
-                            prompt=f"Roughly how many days will you take to watch what you want on {service_id}?",
-                            required=True,
-                            service_id=service_id,
-                            answer_schema={"type": "number", "minimum": 0.1},
-                            rationale="Needed to estimate when you can unsubscribe without missing content.",
-                        )
-                    )
+
+def plan_v1(request: PlanRequestV1, *, now: datetime, policy: PlannerPolicy = DEFAULT_POLICY) -> PlanResponseV1:
+    """Synchronous, CPU-only planner core (deterministic for a given `now`).
+
+    Per service: build the interval each title must be subscribed for (from
+    `availability_window` and `estimated_watch_days`), merge them with
+    `_merge_intervals`, and emit a subscribe/unsubscribe pair per merged
+    interval within `horizon_days`. Unsubscribes are only scheduled once
+    `min_contract_days` is known and every title has an end.
+
+    With the input `plan_objective: min_cost`, each title is first assigned
+    to a single service by `select_services_by_cost`.
+    """
+
+    permanent = {s.strip() for s in request.permanent_service_ids if s.strip()}
+    inputs = PlanningInputIndex(request.inputs or [])
+
+    by_service: dict[str, list[AvailabilityAssessmentV1]] = defaultdict(list)
+    for a in request.assessments:
+        # Defensive: ignore assessments for other countries.
+        if a.country != request.country:
+            continue
+        by_service[a.service_id].append(a)
+
+    if _objective(inputs) == OBJECTIVE_MIN_COST:
+        selections = select_services_by_cost(
+            by_service, now=now, horizon_days=request.horizon_days, inputs=inputs, permanent=permanent, policy=policy
+        )
+    else:
+        selections = {service_id: ServiceSelection(assessments) for service_id, assessments in by_service.items()}
+
+    events: list[PlanEventV1] = []
+    questions: list[PlanQuestionV1] = []
+
+    for service_id in sorted(selections.keys()):
+        if service_id in permanent:
+            continue
+        selection = selections[service_id]
+        service_events, service_questions = plan_service_v1(
+            service_id,
+            selection.assessments,
+            now=now,
+            horizon_days=request.horizon_days,
+            inputs=inputs,
+            policy=policy,
+            extra_assumptions=selection.subscribe_assumptions,
+        )
+        events.extend(service_events)
+        questions.extend([*service_questions, *selection.questions])
 
     # De-duplicate questions deterministically.
     by_qid: dict[str, PlanQuestionV1] = {}
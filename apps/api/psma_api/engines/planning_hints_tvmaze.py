@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+import logging
+import statistics
+from typing import Any
+
+import httpx
+
+from psma_api.cache import ExpiringCache
+from psma_api.models.availability import AvailabilityAssessmentsResultV1, CadenceV1, PlanningHintsV1
+from psma_api.ports.availability_engine import AvailabilityEngine
+
+
+logger = logging.getLogger("psma_api.engines.planning_hints")
+
+TMDB_BASE_URL = "https://api.themoviedb.org/3"
+TVMAZE_BASE_URL = "https://api.tvmaze.com"
+
+# Consecutive-episode gaps (days) that count as a weekly release.
+_WEEKLY_GAP_DAYS = (5.0, 9.0)
+
+
+def _parse_airstamp(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _embedded_airstamp(show: dict[str, Any], name: str) -> datetime | None:
+    episode = (show.get("_embedded") or {}).get(name)
+    return _parse_airstamp(episode.get("airstamp")) if isinstance(episode, dict) else None
+
+
+def _infer_cadence(show: dict[str, Any], *, has_next: bool) -> CadenceV1:
+    if show.get("status") == "Ended" and not has_next:
+        return "ended"
+
+    episodes = (show.get("_embedded") or {}).get("episodes")
+    if not isinstance(episodes, list):
+        return "unknown"
+    dated = [
+        (ep.get("season"), stamp)
+        for ep in episodes
+        if isinstance(ep, dict) and (stamp := _parse_airstamp(ep.get("airstamp"))) is not None
+    ]
+    if not dated:
+        return "unknown"
+
+    # Judge the most recent season: release patterns change across seasons.
+    latest_season = max((s for s, _ in dated if isinstance(s, int)), default=None)
+    stamps = sorted(stamp for s, stamp in dated if s == latest_season)
+    if len(stamps) < 2:
+        return "unknown"
+
+    _, same_day = Counter(stamp.date() for stamp in stamps).most_common(1)[0]
+    if same_day * 2 >= len(stamps):
+        return "batch"
+
+    gaps = [(b - a).total_seconds() / 86400 for a, b in zip(stamps, stamps[1:])]
+    low, high = _WEEKLY_GAP_DAYS
+    if low <= statistics.median(gaps) <= high:
+        return "weekly"
+    return "unknown"
+
+
+def derive_planning_hints(show: dict[str, Any]) -> PlanningHintsV1:
+    """Derive cadence and next/last air times from a TVmaze show with embeds.
+
+    Expects `_embedded.episodes`, `_embedded.nextepisode` and
+    `_embedded.previousepisode` (any of them may be missing).
+    """
+
+    next_air_time = _embedded_airstamp(show, "nextepisode")
+    last_air_time = _embedded_airstamp(show, "previousepisode")
+    return PlanningHintsV1(
+        cadence=_infer_cadence(show, has_next=next_air_time is not None),
+        next_air_time=next_air_time,
+        last_air_time=last_air_time,
+    )
+
+
+async def fetch_tvmaze_show_for_tmdb_series(
+    client: httpx.AsyncClient,
+    *,
+    series_id: int,
+    api_key: str,
+) -> dict[str, Any] | None:
+    """Resolve a TMDB series to its TVmaze show (with episode embeds), or None."""
+
+    resp = await client.get(f"{TMDB_BASE_URL}/tv/{series_id}/external_ids", params={"api_key": api_key})
+    resp.raise_for_status()
+    external_ids: Any = resp.json()
+    if not isinstance(external_ids, dict):
+        return None
+
+    lookups = [("thetvdb", external_ids.get("tvdb_id")), ("imdb", external_ids.get("imdb_id"))]
+    show_id: int | None = None
+    for param, value in lookups:
+        if not value:
+            continue
+        resp = await client.get(f"{TVMAZE_BASE_URL}/lookup/shows", params={param: value})
+        if resp.status_code == 404:
+            continue
+        resp.raise_for_status()
+        found: Any = resp.json()
+        if isinstance(found, dict) and isinstance(found.get("id"), int):
+            show_id = found["id"]
+            break
+    if show_id is None:
+        return None
+
+    resp = await client.get(
+        f"{TVMAZE_BASE_URL}/shows/{show_id}",
+        params=[("embed[]", "episodes"), ("embed[]", "nextepisode"), ("embed[]", "previousepisode")],
+    )
+    resp.raise_for_status()
+    show: Any = resp.json()
+    return show if isinstance(show, dict) else None
+
+
+class PlanningHintsEngine:
+    """Attach TVmaze-derived `planning_hints` to another engine's assessments.
+
+    Hints are fetched concurrently with the inner engine and cached per series
+    until the next episode airs (the moment they go stale), capped at
+    `max_age_seconds`. Hint lookups are best-effort: failures (HTTP errors,
+    non-JSON bodies, unexpected shapes) and lookups that miss `deadline_seconds`
+    are logged and the assessments are returned without hints. Pass the
+    orchestrator's deadline so hints never hold a response past it.
+    """
+
+    def __init__(
+        self,
+        inner: AvailabilityEngine,
+        cache: ExpiringCache[int, PlanningHintsV1],
+        *,
+        max_age_seconds: float = 86400.0,
+        deadline_seconds: float | None = None,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._max_age = timedelta(seconds=max_age_seconds)
+        self._deadline_seconds = deadline_seconds
+
+    async def _hints(self, *, series_id: int, api_key: str, client: httpx.AsyncClient) -> PlanningHintsV1:
+        cached = self._cache.get(series_id)
+        if cached is not None:
+            return cached
+
+        now = datetime.now(timezone.utc)
+        try:
+            show = await asyncio.wait_for(
+                fetch_tvmaze_show_for_tmdb_series(client, series_id=series_id, api_key=api_key),
+                timeout=self._deadline_seconds,
+            )
+            hints = derive_planning_hints(show) if show is not None else PlanningHintsV1()
+        except TimeoutError:
+            logger.warning(
+                "planning_hints_deadline_exceeded",
+                extra={"series_id": series_id, "deadline_seconds": self._deadline_seconds},
+            )
+            return PlanningHintsV1()
+        # ValueError: a body that is not JSON; AttributeError: `_embedded` (or an embed) that is not an object.
+        except (httpx.HTTPError, ValueError, AttributeError) as exc:
+            logger.warning("planning_hints_failed", extra={"series_id": series_id, "error": repr(exc)})
+            return PlanningHintsV1()
+
+        expires_at = now + self._max_age
+        if hints.next_air_time is not None and now < hints.next_air_time < expires_at:
+            expires_at = hints.next_air_time
+        self._cache.set(series_id, hints, expires_at=expires_at.timestamp())
+        return hints
+
+    async def assess_tmdb_tv_watch_providers_v1(
+        self,
+        *,
+        series_id: int,
+        country: str | None,
+        api_key: str,
+        client: httpx.AsyncClient,
+        include_evidence: bool = True,
+    ) -> AvailabilityAssessmentsResultV1:
+        resp, hints = await asyncio.gather(
+            self._inner.assess_tmdb_tv_watch_providers_v1(
+                series_id=series_id,
+                country=country,
+                api_key=api_key,
+                client=client,
+                include_evidence=include_evidence,
+            ),
+            self._hints(series_id=series_id, api_key=api_key, client=client),
+        )
+        if hints == PlanningHintsV1():
+            return resp
+        return resp.model_copy(
+            update={"assessments": [a.model_copy(update={"planning_hints": hints}) for a in resp.assessments]}
+        )
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    path_prefix: str
+    cache_control: str
+
+
+def cache_control(*, max_age_seconds: int, private: bool = False) -> str:
+    scope = "private" if private else "public"
+    return f"{scope}, max-age={max_age_seconds}" if max_age_seconds > 0 else f"{scope}, no-cache"
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag: a hash of the exact bytes sent.
+
+    Timestamps are part of the representation, so a body whose `retrieved_at`
+    or `generated_at` moved gets a new tag. Cached availability keeps its
+    original `retrieved_at` and cached plans a rounded `generated_at`, so
+    those revalidate; provider envelopes are stamped at serve time and in
+    practice never match.
+    """
+
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2).
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == wanted for tag in if_none_match.split(","))
+
+
+class ETagMiddleware:
+    """Add `ETag`/`Cache-Control` to JSON responses and answer `If-None-Match`.
+
+    Only successful, single-chunk `application/json` responses get a (strong)
+    ETag, see `etag_for`; streamed bodies (NDJSON, raw passthrough) are forwarded untouched apart
+    from `Cache-Control`. 304s are only sent for GET/HEAD; other methods (e.g.
+    plan generation) just carry the ETag.
+    """
+
+    def __init__(self, app: ASGIApp, *, rules: Sequence[CacheRule]) -> None:
+        self.app = app
+        self.rules = tuple(rules)
+
+    def _rule_for(self, path: str) -> CacheRule | None:
+        for rule in self.rules:
+            if path.startswith(rule.path_prefix):
+                return rule
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        rule = self._rule_for(scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        conditional = scope["method"] in ("GET", "HEAD")
+        if_none_match = Headers(scope=scope).get("if-none-match") if conditional else None
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if message["status"] != 200 or not content_type.startswith("application/json"):
+                    passthrough = True
+                    await send(message)
+                    return
+                if "cache-control" not in headers:
+                    MutableHeaders(raw=message["headers"]).append("Cache-Control", rule.cache_control)
+                start = message
+                return
+
+            assert start is not None
+            if message.get("more_body", False):
+                # Streaming body: cannot hash it up front.
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            etag = headers.get("etag") or etag_for(body)
+            headers["ETag"] = etag
+            if if_none_match is not None and _etag_matches(if_none_match, etag):
+                not_modified = [
+                    (k, v) for k, v in start["headers"] if k.lower() not in (b"content-length", b"content-type")
+                ]
+                await send({"type": "http.response.start", "status": 304, "headers": not_modified})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -9,6 +9,11 @@ from typing import Any
 
 from psma_api.logging_context import request_id_var
 
+try:  # Optional: faster JSON log lines when orjson is installed.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:  # noqa: A003
@@ -39,6 +44,8 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
 
+        if orjson is not None:
+            return orjson.dumps(payload, default=str).decode("utf-8")
         return json.dumps(payload, ensure_ascii=False)
 
 
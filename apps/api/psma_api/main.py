@@ -10,9 +10,20 @@ from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import Response
 
-from psma_api.deps import build_http_client
+from psma_api.deps import (
+    build_availability_cache,
+    build_availability_upstream_status,
+    build_http_client,
+    build_plan_cache,
+    build_plan_state_store,
+    build_planner_pool,
+    build_planning_hints_cache,
+    build_snapshot_token_store,
+)
+from psma_api.http_caching import CacheRule, ETagMiddleware, cache_control
 from psma_api.logging_config import setup_logging
 from psma_api.logging_context import request_id_var
+from psma_api.service_registry import ServiceRegistryReloader
 from psma_api.settings import settings
 from psma_api.routes.providers_tmdb import router as providers_tmdb_router
 from psma_api.routes.providers_tvmaze import router as providers_tvmaze_router
@@ -27,12 +38,37 @@ logger = logging.getLogger("psma_api")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Build the registry indexes before serving so no request pays for the file read.
+    registry_reloader = ServiceRegistryReloader(poll_seconds=settings.service_registry_reload_seconds)
+    registry_reloader.load()
+    registry_reloader.start()
     client = build_http_client()
     app.state.http_client = client
+    if settings.availability_cache_enabled:
+        app.state.availability_cache = build_availability_cache()
+        app.state.availability_upstream = build_availability_upstream_status()
+    if settings.planning_hints_enabled:
+        app.state.planning_hints_cache = build_planning_hints_cache()
+    app.state.availability_snapshots = build_snapshot_token_store()
+    app.state.plan_states = build_plan_state_store()
+    if settings.plan_cache_enabled:
+        app.state.plan_cache = build_plan_cache()
+    planner_pool = build_planner_pool() if settings.planner_process_pool_workers > 0 else None
+    app.state.planner_pool = planner_pool
     try:
         yield
     finally:
+        app.state.availability_cache = None
+        app.state.availability_upstream = None
+        app.state.planning_hints_cache = None
+        app.state.availability_snapshots = None
+        app.state.plan_states = None
+        app.state.plan_cache = None
+        app.state.planner_pool = None
+        if planner_pool is not None:
+            planner_pool.shutdown(wait=False, cancel_futures=True)
         await client.aclose()
+        await registry_reloader.stop()
 
 
 app = FastAPI(
@@ -50,6 +86,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
+)
+
+_availability_cache_control = cache_control(max_age_seconds=settings.response_max_age_availability_seconds)
+app.add_middleware(
+    ETagMiddleware,
+    rules=[
+        CacheRule("/availability/", _availability_cache_control),
+        CacheRule("/engines/availability/", _availability_cache_control),
+        CacheRule("/providers/", cache_control(max_age_seconds=settings.response_max_age_providers_seconds)),
+        # Plans are built from the caller's own inputs.
+        CacheRule("/plan/", cache_control(max_age_seconds=settings.response_max_age_plan_seconds, private=True)),
+    ],
 )
 
 app.include_router(providers_tvmaze_router)
@@ -56,3 +56,114 @@ class AvailabilityAssessmentsResponseV1(BaseModel):
     assessments: list[AvailabilityAssessmentV1]
 
     model_config = {"extra": "forbid"}
+
+
+class AvailabilityAssessmentProjectionV1(BaseModel):
+    """An assessment reduced to the requested `fields` (or without evidence).
+
+    Returned instead of `AvailabilityAssessmentV1` when a route is called with
+    `fields` or `include_evidence=false`; every field is optional and only the
+    requested ones are present. Engines asked for `include_evidence=False`
+    produce these (without evidence) rather than evidence-less v1 assessments.
+    """
+
+    title_id: str | None = None
+    country: str | None = None
+    service_id: str | None = None
+    provider_category: ProviderCategoryV1 | None = None
+    availability_now: AvailabilityNowV1 | None = None
+    confidence: ConfidenceV1 | None = None
+    reason_codes: list[str] | None = None
+    evidence: list[EvidenceV1] | None = None
+    availability_window: AvailabilityWindowV1 | None = None
+    planning_hints: PlanningHintsV1 | None = None
+
+    model_config = {"extra": "forbid"}
+
+
+class AvailabilityAssessmentsProjectionResponseV1(BaseModel):
+    retrieved_at: datetime
+    assessments: list[AvailabilityAssessmentProjectionV1]
+
+    model_config = {"extra": "forbid"}
+
+
+# What availability engines return: the v1 response, or the evidence-free
+# projection when called with `include_evidence=False`.
+AvailabilityAssessmentsResultV1 = AvailabilityAssessmentsResponseV1 | AvailabilityAssessmentsProjectionResponseV1
+
+
+class AvailabilityBatchRequestV1(BaseModel):
+    series_ids: list[int] = Field(..., min_length=1, max_length=500, description="TMDB TV series ids.")
+    country: str | None = Field(
+        default=None,
+        description="ISO 3166-1 alpha-2 country code, comma-separated list, or '*' for all regions (defaults to US).",
+    )
+    fields: list[str] | None = Field(
+        default=None, description="Only return these assessment fields (e.g. service_id, availability_now)."
+    )
+    include_evidence: bool = Field(default=True, description="Set false to skip building evidence entirely.")
+
+    model_config = {"extra": "forbid"}
+
+
+class AvailabilityBatchErrorV1(BaseModel):
+    message: str
+    upstream_status: int | None = None
+    error: str | None = None
+
+    model_config = {"extra": "forbid"}
+
+
+class AvailabilityBatchItemV1(BaseModel):
+    series_id: int
+    status: Literal["ok", "error"]
+    assessments: list[AvailabilityAssessmentV1] | None = None
+    error: AvailabilityBatchErrorV1 | None = None
+
+    model_config = {"extra": "forbid"}
+
+
+class AvailabilityBatchResponseV1(BaseModel):
+    retrieved_at: datetime
+    results: list[AvailabilityBatchItemV1]
+
+    model_config = {"extra": "forbid"}
+
+
+class AvailabilityBatchProjectionItemV1(BaseModel):
+    series_id: int
+    status: Literal["ok", "error"]
+    assessments: list[AvailabilityAssessmentProjectionV1] | None = None
+    error: AvailabilityBatchErrorV1 | None = None
+
+    model_config = {"extra": "forbid"}
+
+
+class AvailabilityBatchProjectionResponseV1(BaseModel):
+    retrieved_at: datetime
+    results: list[AvailabilityBatchProjectionItemV1]
+
+    model_config = {"extra": "forbid"}
+
+
+class AssessmentKeyV1(BaseModel):
+    title_id: str
+    country: str
+    service_id: str
+
+    model_config = {"extra": "forbid"}
+
+
+class AvailabilityDiffResponseV1(BaseModel):
+    retrieved_at: datetime
+    snapshot_token: str = Field(..., description="Pass as `since` on the next poll.")
+    since: str | None = Field(default=None, description="The token this diff is relative to, if any.")
+    full_resync: bool = Field(
+        ..., description="True when `since` was missing or unknown: `added` then holds the full snapshot."
+    )
+    added: list[AvailabilityAssessmentV1] = Field(default_factory=list)
+    changed: list[AvailabilityAssessmentV1] = Field(default_factory=list)
+    removed: list[AssessmentKeyV1] = Field(default_factory=list)
+
+    model_config = {"extra": "forbid"}
@@ -5,7 +5,7 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
-from psma_api.models.availability import AvailabilityAssessmentV1
+from psma_api.models.availability import AssessmentKeyV1, AvailabilityAssessmentV1
 
 
 PlanActionV1 = Literal["subscribe", "unsubscribe"]
@@ -76,3 +76,49 @@ class PlanResponseV1(BaseModel):
     questions: list[PlanQuestionV1] | None = None
 
     model_config = {"extra": "forbid"}
+
+
+class PlanningInputKeyV1(BaseModel):
+    """Identity of a planner input: inputs with the same key and scope replace each other."""
+
+    key: str = Field(..., min_length=1)
+    service_id: str | None = Field(default=None, min_length=1)
+    title_ids: list[str] | None = None
+
+    model_config = {"extra": "forbid"}
+
+
+class PlanDeltaRequestV1(BaseModel):
+    plan_token: str | None = Field(
+        default=None, description="Token from a previous delta response (the server remembers that plan's inputs)."
+    )
+    previous: PlanRequestV1 | None = Field(
+        default=None, description="The request the previous plan was generated from (when no plan_token is held)."
+    )
+    previous_generated_at: datetime | None = Field(
+        default=None, description="generated_at of the previous plan; events are compared as of this time."
+    )
+    upsert_assessments: list[AvailabilityAssessmentV1] = Field(
+        default_factory=list, description="Added or replaced assessments (matched by title_id, country, service_id)."
+    )
+    remove_assessments: list[AssessmentKeyV1] = Field(default_factory=list)
+    upsert_inputs: list[PlanningInputV1] = Field(
+        default_factory=list, description="Added or replaced inputs (matched by key, service_id, title_ids)."
+    )
+    remove_inputs: list[PlanningInputKeyV1] = Field(default_factory=list)
+    permanent_service_ids: list[str] | None = Field(default=None, description="Replaces the permanent services.")
+
+    model_config = {"extra": "forbid"}
+
+
+class PlanDeltaResponseV1(BaseModel):
+    generated_at: datetime = Field(..., description="The base plan's generated_at; both sides are planned as of it.")
+    plan_token: str = Field(..., description="Token for the updated plan; send it with the next delta.")
+    base_plan_token: str | None = None
+    affected_service_ids: list[str]
+    events_added: list[PlanEventV1] = Field(default_factory=list)
+    events_removed: list[PlanEventV1] = Field(default_factory=list)
+    questions_added: list[PlanQuestionV1] = Field(default_factory=list)
+    questions_removed: list[str] = Field(default_factory=list, description="Ids of questions no longer asked.")
+
+    model_config = {"extra": "forbid"}
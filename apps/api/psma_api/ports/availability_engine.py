@@ -5,7 +5,7 @@ from typing import Protocol
 
 import httpx
 
-from psma_api.models.availability import AvailabilityAssessmentsResponseV1
+from psma_api.models.availability import AvailabilityAssessmentsResultV1
 
 
 class AvailabilityEngine(Protocol):
@@ -16,5 +16,6 @@ class AvailabilityEngine(Protocol):
         country: str | None,
         api_key: str,
         client: httpx.AsyncClient,
-    ) -> Awaitable[AvailabilityAssessmentsResponseV1]:
+        include_evidence: bool = True,
+    ) -> Awaitable[AvailabilityAssessmentsResultV1]:
         ...
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Protocol
 
 from psma_api.models.planning import PlanRequestV1, PlanResponseV1
 
 
 class PlannerEngine(Protocol):
-    async def generate_plan_v1(self, request: PlanRequestV1) -> PlanResponseV1: ...
+    # `request_json` is the request body as received, when the caller has it;
+    # engines that ship the request elsewhere send it instead of re-dumping.
+    async def generate_plan_v1(
+        self, request: PlanRequestV1, *, now: datetime | None = None, request_json: bytes | None = None
+    ) -> PlanResponseV1: ...
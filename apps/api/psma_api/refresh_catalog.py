@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import json
+import logging
+from pathlib import Path
+import sys
+from typing import Any, TextIO
+
+import httpx
+
+from psma_api.deps import build_http_client
+from psma_api.engines.availability_columnar import assess_tmdb_payloads_columnar
+from psma_api.engines.availability_diff import AssessmentKey, assessment_key, diff_assessments
+from psma_api.engines.availability_v1 import fetch_tmdb_tv_watch_providers, parse_regions, region_key
+from psma_api.models.availability import AvailabilityAssessmentV1
+from psma_api.settings import settings
+from psma_api.snapshot_store import AvailabilitySnapshotStore
+
+
+logger = logging.getLogger("psma_api.refresh")
+
+# apps/api/psma_api/refresh_catalog.py -> apps/api/.cache/...
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[1] / ".cache" / "availability-snapshots.sqlite3"
+
+
+@dataclass
+class RefreshSummary:
+    run_id: str
+    series_total: int
+    series_skipped: int = 0
+    series_ok: int = 0
+    series_failed: int = 0
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+
+
+def _change_event(
+    *,
+    run_id: str,
+    series_id: int,
+    change: str,
+    key: AssessmentKey,
+    assessment: AvailabilityAssessmentV1 | None = None,
+) -> dict[str, Any]:
+    title_id, country, service_id = key
+    event: dict[str, Any] = {
+        "event": "AvailabilityChanged",
+        "run_id": run_id,
+        "change": change,
+        "series_id": series_id,
+        "key": {"title_id": title_id, "country": country, "service_id": service_id},
+    }
+    if assessment is not None:
+        event["assessment"] = assessment.model_dump(mode="json", exclude_none=True)
+    return event
+
+
+async def _fetch_payloads(
+    *,
+    series_ids: list[int],
+    api_key: str,
+    client: httpx.AsyncClient,
+    concurrency: int,
+) -> tuple[list[tuple[int, Any]], list[int]]:
+    """Fetch raw watch-provider payloads; returns (ok pairs in input order, failed ids).
+
+    HTTP errors and bodies that are not JSON both count as failed series.
+    """
+
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(series_id: int) -> Any:
+        async with sem:
+            return await fetch_tmdb_tv_watch_providers(client, series_id=series_id, api_key=api_key)
+
+    results = await asyncio.gather(*(one(sid) for sid in series_ids), return_exceptions=True)
+    ok: list[tuple[int, Any]] = []
+    failed: list[int] = []
+    for series_id, result in zip(series_ids, results):
+        if isinstance(result, (httpx.HTTPError, ValueError)):
+            failed.append(series_id)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            ok.append((series_id, result))
+    return ok, failed
+
+
+async def refresh_catalog(
+    *,
+    series_ids: Iterable[int],
+    country: str | None,
+    store: AvailabilitySnapshotStore,
+    client: httpx.AsyncClient,
+    api_key: str,
+    concurrency: int = 8,
+    chunk_size: int = 200,
+    resume: bool = True,
+    on_change: Callable[[dict[str, Any]], None] = lambda event: None,
+) -> RefreshSummary:
+    """Refresh stored assessments for many series and emit only what changed.
+
+    Series are processed in chunks; each series' changes and its progress
+    marker are committed together, so an interrupted run can be resumed
+    (`resume=True`) without re-fetching series that already finished.
+
+    Each chunk's raw payloads are assessed together by the columnar engine
+    rather than one series at a time.
+    """
+
+    regions = parse_regions(country)
+    ids = list(dict.fromkeys(series_ids))
+    run_id, done = store.start_or_resume_run(country=region_key(country), resume=resume)
+    summary = RefreshSummary(run_id=run_id, series_total=len(ids))
+
+    pending = [sid for sid in ids if sid not in done]
+    summary.series_skipped = len(ids) - len(pending)
+
+    for start in range(0, len(pending), max(1, chunk_size)):
+        chunk = pending[start : start + chunk_size]
+        fetched, failed = await _fetch_payloads(
+            series_ids=chunk, api_key=api_key, client=client, concurrency=concurrency
+        )
+        for series_id in failed:
+            summary.series_failed += 1
+            store.mark_failed(run_id, series_id)
+            logger.warning("refresh_series_failed", extra={"series_id": series_id})
+
+        assessed = assess_tmdb_payloads_columnar(
+            fetched, regions=regions, retrieved_at=datetime.now(timezone.utc)
+        )
+        for series_id, _ in fetched:
+            diff = diff_assessments(
+                store.hashes_for_series(series_id, regions),
+                assessed.get(series_id, []),
+            )
+            store.apply_series(
+                run_id=run_id,
+                series_id=series_id,
+                upserts=diff.added + diff.changed,
+                removed=diff.removed,
+            )
+            summary.series_ok += 1
+            summary.added += len(diff.added)
+            summary.changed += len(diff.changed)
+            summary.removed += len(diff.removed)
+
+            for change, assessments in (("added", diff.added), ("changed", diff.changed)):
+                for a in assessments:
+                    on_change(
+                        _change_event(
+                            run_id=run_id,
+                            series_id=series_id,
+                            change=change,
+                            key=assessment_key(a),
+                            assessment=a,
+                        )
+                    )
+            for key in diff.removed:
+                on_change(_change_event(run_id=run_id, series_id=series_id, change="removed", key=key))
+
+    store.finish_run(run_id)
+    return summary
+
+
+def _read_series_ids(source: TextIO) -> list[int]:
+    ids: list[int] = []
+    for line in source:
+        line = line.split("#", 1)[0].strip()
+        if line:
+            ids.append(int(line))
+    return ids
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m psma_api.refresh_catalog",
+        description="Refresh TMDB availability snapshots and emit AvailabilityChanged events as NDJSON.",
+    )
+    parser.add_argument("series_ids", help="File with one TMDB series id per line ('-' for stdin).")
+    parser.add_argument("--country", default="US", help="Region code, comma-separated list, or '*' (default: US).")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="SQLite snapshot database path.")
+    parser.add_argument("--out", default="-", help="Where to write change events (default: stdout).")
+    parser.add_argument("--concurrency", type=int, default=settings.availability_batch_concurrency)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--no-resume", action="store_true", help="Start a new run even if one is unfinished.")
+    args = parser.parse_args(argv)
+
+    if not settings.tmdb_api_key:
+        print("PSMA_TMDB_API_KEY is not configured.", file=sys.stderr)
+        return 2
+
+    if args.series_ids == "-":
+        series_ids = _read_series_ids(sys.stdin)
+    else:
+        with Path(args.series_ids).open(encoding="utf-8") as f:
+            series_ids = _read_series_ids(f)
+
+    out = sys.stdout if args.out == "-" else Path(args.out).open("a", encoding="utf-8")
+    store = AvailabilitySnapshotStore(args.db)
+
+    def write_event(event: dict[str, Any]) -> None:
+        out.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    async def run() -> RefreshSummary:
+        async with build_http_client() as client:
+            return await refresh_catalog(
+                series_ids=series_ids,
+                country=args.country,
+                store=store,
+                client=client,
+                api_key=settings.tmdb_api_key or "",
+                concurrency=args.concurrency,
+                chunk_size=args.chunk_size,
+                resume=not args.no_resume,
+                on_change=write_event,
+            )
+
+    try:
+        summary = asyncio.run(run())
+    finally:
+        store.close()
+        if out is not sys.stdout:
+            out.close()
+
+    print(json.dumps(summary.__dict__), file=sys.stderr)
+    return 1 if summary.series_failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
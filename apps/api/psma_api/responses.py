@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+import pydantic_core
+from starlette.background import BackgroundTask
+from starlette.requests import ClientDisconnect
+from starlette.responses import Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from psma_api.models.providers import Attribution, ProviderEnvelope
+from psma_api.transports import STREAM_EXTENSION
+
+
+class ModelJSONResponse(Response):
+    """JSON response for an already-validated pydantic model.
+
+    Returning a `Response` makes FastAPI skip its `response_model` pass (dump,
+    re-validate, dump again, `json.dumps`); the model is encoded once by
+    pydantic-core straight to bytes. Routes keep `response_model=` for the
+    OpenAPI schema and pass the same `exclude_none` they declare there.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: BaseModel,
+        *,
+        exclude_none: bool = False,
+        include: Any = None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._exclude_none = exclude_none
+        self._include = include
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content, include=self._include, exclude_none=self._exclude_none)
+
+
+class RequestStreamingResponse(StreamingResponse):
+    """Streaming response whose body is produced while the request body is still arriving.
+
+    `StreamingResponse` (below ASGI 2.4) reads `receive` concurrently to spot
+    disconnects, which swallows any request body the endpoint has not read yet.
+    This one leaves `receive` to the body iterator (e.g. one built on
+    `request.stream()`); a gone client still surfaces as `ClientDisconnect`
+    from either the request stream or the send.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+        if self.background is not None:
+            await self.background()
+
+
+async def send_upstream_stream(client: httpx.AsyncClient, url: str, params: dict[str, Any]) -> httpx.Response:
+    """GET `url` without buffering the body.
+
+    The request carries `STREAM_EXTENSION`, so the coalescing and caching
+    transports pass it through instead of reading the body first. Error
+    responses are read and raised as `httpx.HTTPStatusError` so callers keep
+    their usual error mapping; successful responses are left open for
+    `envelope_passthrough_response` to stream and close.
+    """
+
+    request = client.build_request("GET", url, params=params, extensions={STREAM_EXTENSION: True})
+    resp = await client.send(request, stream=True)
+    if resp.is_error:
+        try:
+            await resp.aread()
+        finally:
+            await resp.aclose()
+        resp.raise_for_status()
+    return resp
+
+
+def envelope_passthrough_response(
+    resp: httpx.Response,
+    *,
+    provider: str,
+    attribution: Attribution | None,
+    request: dict[str, Any],
+) -> StreamingResponse:
+    """Stream an upstream JSON body as `ProviderEnvelope.data` without decoding it.
+
+    The envelope is serialized once without `data`, and the upstream bytes are
+    spliced in between its prefix and closing brace. The result is the same
+    JSON shape as the validated route, minus the parse/validate/dump cycle.
+    """
+
+    head = ProviderEnvelope(provider=provider, attribution=attribution, request=request, data=None)
+    prefix = head.model_dump_json(exclude={"data"}).encode("utf-8")[:-1] + b',"data":'
+
+    async def body() -> AsyncIterator[bytes]:
+        yield prefix
+        empty = True
+        async for chunk in resp.aiter_bytes():
+            if chunk:
+                empty = False
+                yield chunk
+        yield b"null}" if empty else b"}"
+
+    return StreamingResponse(
+        body(),
+        media_type="application/json",
+        background=BackgroundTask(resp.aclose),
+    )
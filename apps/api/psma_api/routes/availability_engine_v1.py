@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from psma_api.deps import get_http_client
 from psma_api.engines.availability_v1 import assess_tmdb_tv_watch_providers_v1
 from psma_api.models.availability import AvailabilityAssessmentsResponseV1
+from psma_api.responses import ModelJSONResponse
 from psma_api.routes.providers_tmdb import require_tmdb_key
 
 
@@ -26,7 +27,7 @@ async def assess_tmdb_tv(
     client: httpx.AsyncClient = Depends(get_http_client),
 ) -> Any:
     try:
-        return await assess_tmdb_tv_watch_providers_v1(
+        resp = await assess_tmdb_tv_watch_providers_v1(
             series_id=series_id,
             country=country,
             api_key=api_key,
@@ -46,3 +47,4 @@ async def assess_tmdb_tv(
             status_code=502,
             detail={"message": "TMDB request failed", "error": str(exc)},
         ) from exc
+    return ModelJSONResponse(resp, exclude_none=True)
@@ -1,27 +1,125 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException
 
-from psma_api.deps import get_availability_engine, get_http_client
-from psma_api.models.availability import AvailabilityAssessmentsResponseV1
+from psma_api.deps import get_availability_engine, get_http_client, get_snapshot_token_store
+from psma_api.engines.availability_batch import assess_tmdb_tv_batch_v1
+from psma_api.engines.availability_diff import SnapshotTokenStore, diff_against_snapshot
+from psma_api.engines.availability_v1 import region_key
+from psma_api.models.availability import (
+    AvailabilityAssessmentProjectionV1,
+    AvailabilityAssessmentsProjectionResponseV1,
+    AvailabilityAssessmentsResponseV1,
+    AvailabilityAssessmentsResultV1,
+    AvailabilityAssessmentV1,
+    AvailabilityBatchProjectionItemV1,
+    AvailabilityBatchProjectionResponseV1,
+    AvailabilityBatchRequestV1,
+    AvailabilityBatchResponseV1,
+    AvailabilityDiffResponseV1,
+)
 from psma_api.ports.availability_engine import AvailabilityEngine
+from psma_api.responses import ModelJSONResponse
 from psma_api.routes.providers_tmdb import require_tmdb_key
+from psma_api.settings import settings
 
 
 router = APIRouter(prefix="/availability/v1", tags=["availability"])
 
 
+def _projection(fields: list[str] | None, include_evidence: bool) -> tuple[set[str] | None, bool]:
+    """Validate a field projection; returns (fields to keep, whether evidence is needed)."""
+
+    if fields is None:
+        return None, include_evidence
+    keep = {f.strip() for f in fields if f.strip()}
+    unknown = sorted(keep - set(AvailabilityAssessmentV1.model_fields))
+    if unknown or not keep:
+        raise HTTPException(
+            status_code=422,
+            detail={"message": "Unknown assessment fields", "fields": unknown},
+        )
+    if "evidence" in keep and not include_evidence:
+        raise HTTPException(
+            status_code=422,
+            detail={"message": "fields includes evidence but include_evidence is false"},
+        )
+    return keep, "evidence" in keep
+
+
+def _assessment_include(keep: set[str] | None, include_evidence: bool) -> set[str]:
+    include = keep if keep is not None else set(AvailabilityAssessmentV1.model_fields)
+    return include if include_evidence else include - {"evidence"}
+
+
+def _project(
+    assessments: Sequence[AvailabilityAssessmentV1 | AvailabilityAssessmentProjectionV1], include: set[str]
+) -> list[AvailabilityAssessmentProjectionV1]:
+    return [AvailabilityAssessmentProjectionV1.model_validate({f: getattr(a, f) for f in include}) for a in assessments]
+
+
+@router.post(
+    "/tmdb/tv:batch",
+    response_model=AvailabilityBatchResponseV1 | AvailabilityBatchProjectionResponseV1,
+    response_model_exclude_none=True,
+)
+async def availability_for_tmdb_tv_batch(
+    request: AvailabilityBatchRequestV1,
+    api_key: str = Depends(require_tmdb_key),
+    client: httpx.AsyncClient = Depends(get_http_client),
+    engine: AvailabilityEngine = Depends(get_availability_engine),
+) -> Any:
+    """Assess a whole watchlist in one call.
+
+    Series are assessed concurrently (capped by `PSMA_AVAILABILITY_BATCH_CONCURRENCY`).
+    Upstream failures are reported per series and never fail the batch.
+
+    `fields` / `include_evidence` project assessments as on the single-series route
+    (the response is then an `AvailabilityBatchProjectionResponseV1`).
+    """
+
+    keep, include_evidence = _projection(request.fields, request.include_evidence)
+    batch = await assess_tmdb_tv_batch_v1(
+        engine=engine,
+        series_ids=request.series_ids,
+        country=request.country,
+        api_key=api_key,
+        client=client,
+        concurrency=settings.availability_batch_concurrency,
+        include_evidence=include_evidence,
+    )
+    if keep is None and include_evidence:
+        return ModelJSONResponse(batch, exclude_none=True)
+    include = _assessment_include(keep, include_evidence)
+    projected = AvailabilityBatchProjectionResponseV1(
+        retrieved_at=batch.retrieved_at,
+        results=[
+            AvailabilityBatchProjectionItemV1(
+                series_id=item.series_id,
+                status=item.status,
+                assessments=_project(item.assessments, include) if item.assessments is not None else None,
+                error=item.error,
+            )
+            for item in batch.results
+        ],
+    )
+    return ModelJSONResponse(projected, exclude_none=True)
+
+
 @router.get(
     "/tmdb/tv/{series_id}",
-    response_model=AvailabilityAssessmentsResponseV1,
+    response_model=AvailabilityAssessmentsResponseV1 | AvailabilityAssessmentsProjectionResponseV1,
     response_model_exclude_none=True,
 )
 async def availability_for_tmdb_tv(
     series_id: int,
     country: str | None = None,
+    fields: str | None = None,
+    include_evidence: bool = True,
     api_key: str = Depends(require_tmdb_key),
     client: httpx.AsyncClient = Depends(get_http_client),
     engine: AvailabilityEngine = Depends(get_availability_engine),
@@ -30,14 +128,82 @@ async def availability_for_tmdb_tv(
 
     The FE should call this route instead of engine-specific routes.
     Internally, this delegates to the configured availability engine.
+
+    `country` accepts a single code, a comma-separated list ("US,CA") or "*"
+    for every region; all regions come from one upstream fetch.
+
+    `fields=service_id,availability_now,confidence` returns only those
+    assessment fields; without `evidence` in the list (or with
+    `include_evidence=false`) the engine never builds evidence objects;
+    asking for `evidence` with `include_evidence=false` is a 422.
+    Projected calls return an `AvailabilityAssessmentsProjectionResponseV1`.
     """
 
+    keep, include_evidence = _projection(fields.split(",") if fields is not None else None, include_evidence)
+    resp = await _assess(
+        engine,
+        series_id=series_id,
+        country=country,
+        api_key=api_key,
+        client=client,
+        include_evidence=include_evidence,
+    )
+    if keep is None and include_evidence:
+        return ModelJSONResponse(resp, exclude_none=True)
+    projected = AvailabilityAssessmentsProjectionResponseV1(
+        retrieved_at=resp.retrieved_at,
+        assessments=_project(resp.assessments, _assessment_include(keep, include_evidence)),
+    )
+    return ModelJSONResponse(projected, exclude_none=True)
+
+
+@router.get(
+    "/tmdb/tv/{series_id}/diff",
+    response_model=AvailabilityDiffResponseV1,
+    response_model_exclude_none=True,
+)
+async def availability_diff_for_tmdb_tv(
+    series_id: int,
+    country: str | None = None,
+    since: str | None = None,
+    api_key: str = Depends(require_tmdb_key),
+    client: httpx.AsyncClient = Depends(get_http_client),
+    engine: AvailabilityEngine = Depends(get_availability_engine),
+    store: SnapshotTokenStore = Depends(get_snapshot_token_store),
+) -> Any:
+    """Only what changed since the snapshot token `since`.
+
+    Assessments are compared by a content hash that ignores retrieval
+    timestamps. Omit `since` (or send an expired token) to get a full resync
+    plus a token for the next poll.
+    """
+
+    resp = await _assess(engine, series_id=series_id, country=country, api_key=api_key, client=client)
+    diff = diff_against_snapshot(
+        resp,
+        scope=f"tmdb:tv:{series_id}:{region_key(country)}",
+        since=since,
+        store=store,
+    )
+    return ModelJSONResponse(diff, exclude_none=True)
+
+
+async def _assess(
+    engine: AvailabilityEngine,
+    *,
+    series_id: int,
+    country: str | None,
+    api_key: str,
+    client: httpx.AsyncClient,
+    include_evidence: bool = True,
+) -> AvailabilityAssessmentsResultV1:
     try:
         return await engine.assess_tmdb_tv_watch_providers_v1(
             series_id=series_id,
             country=country,
             api_key=api_key,
             client=client,
+            include_evidence=include_evidence,
         )
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
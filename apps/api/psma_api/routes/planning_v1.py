@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from typing import Any
+import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
-from psma_api.deps import get_planner_engine
-from psma_api.models.planning import PlanRequestV1, PlanResponseV1
+from psma_api.deps import get_plan_state_store, get_planner_engine, get_planner_policy, get_planner_pool
+from psma_api.engines.planner_bulk import ndjson_records, stream_bulk_plans
+from psma_api.engines.planner_delta import PlanState, PlanStateStore, plan_delta
+from psma_api.engines.planner_v1 import PlannerPolicy
+from psma_api.models.planning import PlanDeltaRequestV1, PlanDeltaResponseV1, PlanRequestV1, PlanResponseV1
 from psma_api.ports.planner_engine import PlannerEngine
+from psma_api.responses import ModelJSONResponse, RequestStreamingResponse
+from psma_api.settings import settings
 
 
 router = APIRouter(prefix="/plan/v1", tags=["planning"])
@@ -19,6 +28,85 @@ router = APIRouter(prefix="/plan/v1", tags=["planning"])
 )
 async def generate_plan(
     request: PlanRequestV1,
+    http_request: Request,
     engine: PlannerEngine = Depends(get_planner_engine),
 ) -> Any:
-    return await engine.generate_plan_v1(request)
+    # The body was already read (and is cached) to validate `request`; a pooled
+    # engine ships these bytes to its worker instead of re-serializing the model.
+    request_json = await http_request.body()
+    return ModelJSONResponse(await engine.generate_plan_v1(request, request_json=request_json), exclude_none=True)
+
+
+@router.post(
+    "/generate:bulk",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def generate_plans_bulk(
+    request: Request,
+    pool: ProcessPoolExecutor | None = Depends(get_planner_pool),
+    policy: PlannerPolicy = Depends(get_planner_policy),
+) -> StreamingResponse:
+    """Plan many households from an NDJSON body of `PlanRequestV1` records.
+
+    Streams NDJSON back as plans finish (completion order, not input order):
+    `{"type":"plan","line":N,"plan":{...}}` per valid record,
+    `{"type":"error","line":N,"errors":[...]}` per invalid one, and a final
+    `{"type":"summary","plans":..,"errors":..}`. All plans share one
+    `generated_at`. The body is read as it arrives, so planning starts with
+    the first record and memory stays bounded by the in-flight window.
+    Records run across the planner process pool when it is enabled
+    (`PSMA_PLANNER_PROCESS_POOL_WORKERS`), otherwise on the default thread pool.
+    """
+
+    # Two records per worker keeps every worker busy without queueing them all.
+    max_in_flight = 2 * max(1, settings.planner_process_pool_workers)
+    lines = stream_bulk_plans(
+        ndjson_records(request.stream()),
+        now=datetime.now(timezone.utc),
+        executor=pool,
+        max_in_flight=max_in_flight,
+        policy=policy,
+    )
+    return RequestStreamingResponse(lines, media_type="application/x-ndjson")
+
+
+@router.post(
+    "/delta",
+    response_model=PlanDeltaResponseV1,
+    response_model_exclude_none=True,
+)
+async def plan_delta_v1(
+    request: PlanDeltaRequestV1,
+    store: PlanStateStore = Depends(get_plan_state_store),
+    policy: PlannerPolicy = Depends(get_planner_policy),
+) -> Any:
+    """Re-plan only the services touched by the given changes.
+
+    Send either `plan_token` (from a previous delta response) or `previous`
+    (the request the current plan was generated from). Both the old and the
+    new plan are computed as of the base plan's `generated_at`, so the delta
+    reflects the changes rather than the passage of time.
+    """
+
+    if (request.plan_token is None) == (request.previous is None):
+        raise HTTPException(
+            status_code=422,
+            detail={"message": "Send exactly one of plan_token or previous"},
+        )
+
+    if request.plan_token is not None:
+        base = store.get(request.plan_token)
+        if base is None:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Unknown or expired plan_token; resend the previous request"},
+            )
+    else:
+        assert request.previous is not None
+        base = PlanState.from_request(request.previous, now=request.previous_generated_at or datetime.now(timezone.utc))
+
+    token = uuid.uuid4().hex
+    state, delta = plan_delta(base, request, token=token, base_token=request.plan_token, policy=policy)
+    store.put(token, state)
+    return ModelJSONResponse(delta, exclude_none=True)
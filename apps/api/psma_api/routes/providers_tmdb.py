@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+import json
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette.responses import StreamingResponse
 
 from psma_api.deps import get_http_client
+from psma_api.engines.availability_v1 import parse_regions
 from psma_api.models.providers import Attribution, ProviderEnvelope
+from psma_api.responses import ModelJSONResponse, envelope_passthrough_response, send_upstream_stream
 from psma_api.settings import settings
 
 router = APIRouter(prefix="/providers/tmdb", tags=["providers"])
 
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 
+# TMDB refuses discover pages beyond 500.
+TMDB_MAX_DISCOVER_PAGES = 500
+
 TMDB_ATTRIBUTION = Attribution(
     required=True,
     text="Watch provider data requires attribution to JustWatch per TMDB docs.",
@@ -46,14 +55,136 @@ def _monetization_types_param(monetization_types: str | None) -> str | None:
     return "|".join(parts)
 
 
+def _ndjson(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+async def _get_tmdb_json(client: httpx.AsyncClient, url: str, params: dict[str, Any]) -> Any:
+    try:
+        resp = await client.get(url, params=params)
+        resp.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        raise HTTPException(
+            status_code=502,
+            detail={
+                "message": "TMDB returned an error",
+                "upstream_status": exc.response.status_code,
+                "upstream_body": exc.response.text,
+            },
+        ) from exc
+    except httpx.RequestError as exc:
+        raise HTTPException(
+            status_code=502,
+            detail={"message": "TMDB request failed", "error": str(exc)},
+        ) from exc
+    return resp.json()
+
+
+async def _stream_discover_pages(
+    *,
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, Any],
+    max_pages: int,
+    attribution: Attribution | None,
+    request: dict[str, Any],
+) -> StreamingResponse:
+    """Crawl discover pages 1..N concurrently and stream shows as NDJSON.
+
+    Page 1 is fetched up front (so upstream errors still map to a 502 and we
+    learn `total_pages`); the remaining pages are fetched with bounded
+    concurrency and emitted as they arrive. Shows are de-duplicated by id,
+    since TMDB pagination can shift while a crawl is in progress.
+
+    Line types: `meta` (first), `item`, `error` (per failed page), `summary` (last).
+    """
+
+    first: Any = await _get_tmdb_json(client, url, {**params, "page": 1})
+    total_pages = first.get("total_pages") if isinstance(first, dict) else None
+    if not isinstance(total_pages, int) or total_pages < 1:
+        total_pages = 1
+    last_page = min(total_pages, max_pages, TMDB_MAX_DISCOVER_PAGES)
+    semaphore = asyncio.Semaphore(max(1, settings.tmdb_discover_concurrency))
+
+    async def fetch(page: int) -> tuple[int, Any, dict[str, Any] | None]:
+        async with semaphore:
+            try:
+                resp = await client.get(url, params={**params, "page": page})
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                return page, None, {"message": "TMDB returned an error", "upstream_status": exc.response.status_code}
+            except httpx.RequestError as exc:
+                return page, None, {"message": "TMDB request failed", "error": str(exc)}
+            try:
+                payload = resp.json()
+            except ValueError:
+                # Truncated or non-JSON body (e.g. an HTML error page served with 200).
+                return page, None, {"message": "TMDB returned invalid JSON", "upstream_status": resp.status_code}
+            return page, payload, None
+
+    async def lines() -> AsyncIterator[bytes]:
+        seen: set[Any] = set()
+        counts = {"pages_fetched": 0, "items": 0, "duplicates": 0, "errors": 0}
+
+        def emit_page(page: int, payload: Any) -> list[bytes]:
+            out: list[bytes] = []
+            counts["pages_fetched"] += 1
+            results = payload.get("results") if isinstance(payload, dict) else None
+            for show in results if isinstance(results, list) else []:
+                show_id = show.get("id") if isinstance(show, dict) else None
+                if show_id is not None:
+                    if show_id in seen:
+                        counts["duplicates"] += 1
+                        continue
+                    seen.add(show_id)
+                counts["items"] += 1
+                out.append(_ndjson({"type": "item", "page": page, "data": show}))
+            return out
+
+        yield _ndjson(
+            {
+                "type": "meta",
+                "provider": "tmdb",
+                "attribution": attribution.model_dump() if attribution else None,
+                "request": request,
+                "total_pages": total_pages,
+                "total_results": first.get("total_results") if isinstance(first, dict) else None,
+                "pages_requested": last_page,
+            }
+        )
+        for line in emit_page(1, first):
+            yield line
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, last_page + 1)]
+        try:
+            for done in asyncio.as_completed(tasks):
+                page, payload, error = await done
+                if error is not None:
+                    # Partial failure: report the page and keep streaming the rest.
+                    counts["errors"] += 1
+                    yield _ndjson({"type": "error", "page": page, **error})
+                    continue
+                for line in emit_page(page, payload):
+                    yield line
+        finally:
+            # Client went away (or we are done): stop any pages still in flight.
+            for task in tasks:
+                task.cancel()
+
+        yield _ndjson({"type": "summary", **counts})
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get("/search/tv", response_model=ProviderEnvelope)
 async def tmdb_search_tv(
     query: str,
     language: str | None = None,
     include_adult: bool = False,
+    raw: bool = False,
     api_key: str = Depends(require_tmdb_key),
     client: httpx.AsyncClient = Depends(get_http_client),
-) -> ProviderEnvelope:
+) -> Any:
     url = f"{TMDB_BASE_URL}/search/tv"
     params: dict[str, Any] = {
         "api_key": api_key,
@@ -64,8 +195,11 @@ async def tmdb_search_tv(
         params["language"] = language
 
     try:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
+        if raw:
+            resp = await send_upstream_stream(client, url, params)
+        else:
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
             status_code=502,
@@ -81,17 +215,25 @@ async def tmdb_search_tv(
             detail={"message": "TMDB request failed", "error": str(exc)},
         ) from exc
 
+    request_info = {
+        "query": query,
+        "language": language,
+        "include_adult": include_adult,
+        "url": url,
+    }
+    if raw:
+        return envelope_passthrough_response(
+            resp, provider="tmdb", attribution=None, request=request_info
+        )
+
     data: Any = resp.json()
-    return ProviderEnvelope(
-        provider="tmdb",
-        attribution=None,
-        request={
-            "query": query,
-            "language": language,
-            "include_adult": include_adult,
-            "url": url,
-        },
-        data=data,
+    return ModelJSONResponse(
+        ProviderEnvelope(
+            provider="tmdb",
+            attribution=None,
+            request=request_info,
+            data=data,
+        )
     )
 
 
@@ -99,15 +241,21 @@ async def tmdb_search_tv(
 async def tmdb_tv_watch_providers(
     series_id: int,
     country: str | None = None,
+    raw: bool = False,
     api_key: str = Depends(require_tmdb_key),
     client: httpx.AsyncClient = Depends(get_http_client),
-) -> ProviderEnvelope:
+) -> Any:
     url = f"{TMDB_BASE_URL}/tv/{series_id}/watch/providers"
     params: dict[str, Any] = {"api_key": api_key}
 
+    # Passthrough only when no region slicing is needed.
+    passthrough = raw and country is None
     try:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
+        if passthrough:
+            resp = await send_upstream_stream(client, url, params)
+        else:
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
             status_code=502,
@@ -123,21 +271,38 @@ async def tmdb_tv_watch_providers(
             detail={"message": "TMDB request failed", "error": str(exc)},
         ) from exc
 
+    request_info = {"series_id": series_id, "country": country, "url": url}
+    if passthrough:
+        return envelope_passthrough_response(
+            resp, provider="tmdb", attribution=TMDB_ATTRIBUTION, request=request_info
+        )
+
     payload: Any = resp.json()
-    if country is not None and isinstance(payload, dict):
+    regions = parse_regions(country) if country is not None else None
+    if regions is not None and isinstance(payload, dict):
         results = payload.get("results")
         if isinstance(results, dict):
-            payload = {
-                "id": payload.get("id"),
-                "country": country,
-                "result": results.get(country),
-            }
-
-    return ProviderEnvelope(
-        provider="tmdb",
-        attribution=TMDB_ATTRIBUTION,
-        request={"series_id": series_id, "country": country, "url": url},
-        data=payload,
+            if len(regions) == 1:
+                payload = {
+                    "id": payload.get("id"),
+                    "country": country,
+                    "result": results.get(regions[0]),
+                }
+            else:
+                # Several regions from the same upstream payload (no extra calls).
+                payload = {
+                    "id": payload.get("id"),
+                    "countries": list(regions),
+                    "results": {region: results.get(region) for region in regions},
+                }
+
+    return ModelJSONResponse(
+        ProviderEnvelope(
+            provider="tmdb",
+            attribution=TMDB_ATTRIBUTION,
+            request=request_info,
+            data=payload,
+        )
     )
 
 
@@ -145,9 +310,10 @@ async def tmdb_tv_watch_providers(
 async def tmdb_watch_providers_tv(
     country: str | None = None,
     language: str | None = None,
+    raw: bool = False,
     api_key: str = Depends(require_tmdb_key),
     client: httpx.AsyncClient = Depends(get_http_client),
-) -> ProviderEnvelope:
+) -> Any:
     """List streaming providers for TV in a region.
 
     UI can call this to populate a provider selector. The returned items include
@@ -163,8 +329,11 @@ async def tmdb_watch_providers_tv(
         params["language"] = language
 
     try:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
+        if raw:
+            resp = await send_upstream_stream(client, url, params)
+        else:
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
             status_code=502,
@@ -180,12 +349,20 @@ async def tmdb_watch_providers_tv(
             detail={"message": "TMDB request failed", "error": str(exc)},
         ) from exc
 
+    request_info = {"country": country, "language": language, "url": url}
+    if raw:
+        return envelope_passthrough_response(
+            resp, provider="tmdb", attribution=None, request=request_info
+        )
+
     data: Any = resp.json()
-    return ProviderEnvelope(
-        provider="tmdb",
-        attribution=None,
-        request={"country": country, "language": language, "url": url},
-        data=data,
+    return ModelJSONResponse(
+        ProviderEnvelope(
+            provider="tmdb",
+            attribution=None,
+            request=request_info,
+            data=data,
+        )
     )
 
 
@@ -197,9 +374,10 @@ async def tmdb_discover_tv_by_provider(
     language: str | None = None,
     sort_by: str | None = None,
     page: int | None = None,
+    raw: bool = False,
     api_key: str = Depends(require_tmdb_key),
     client: httpx.AsyncClient = Depends(get_http_client),
-) -> ProviderEnvelope:
+) -> Any:
     """Discover TV shows available on a selected provider.
 
     Example: Netflix in US
@@ -229,8 +407,11 @@ async def tmdb_discover_tv_by_provider(
         params["page"] = page
 
     try:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
+        if raw:
+            resp = await send_upstream_stream(client, url, params)
+        else:
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
             status_code=502,
@@ -246,10 +427,70 @@ async def tmdb_discover_tv_by_provider(
             detail={"message": "TMDB request failed", "error": str(exc)},
         ) from exc
 
+    request_info = {
+        "watch_provider_id": watch_provider_id,
+        "country": country,
+        "monetization_types": monetization_types,
+        "language": language,
+        "sort_by": sort_by,
+        "page": page,
+        "url": url,
+    }
+    if raw:
+        return envelope_passthrough_response(
+            resp, provider="tmdb", attribution=TMDB_ATTRIBUTION, request=request_info
+        )
+
     data: Any = resp.json()
-    return ProviderEnvelope(
-        provider="tmdb",
-        # Discovery results are based on watch-provider availability; keep attribution aligned.
+    return ModelJSONResponse(
+        ProviderEnvelope(
+            provider="tmdb",
+            # Discovery results are based on watch-provider availability; keep attribution aligned.
+            attribution=TMDB_ATTRIBUTION,
+            request=request_info,
+            data=data,
+        )
+    )
+
+
+@router.get("/discover/tv/stream", response_class=StreamingResponse)
+async def tmdb_discover_tv_by_provider_stream(
+    watch_provider_id: int,
+    country: str | None = None,
+    monetization_types: str | None = "flatrate",
+    language: str | None = None,
+    sort_by: str | None = None,
+    max_pages: int = Query(default=5, ge=1, le=TMDB_MAX_DISCOVER_PAGES),
+    api_key: str = Depends(require_tmdb_key),
+    client: httpx.AsyncClient = Depends(get_http_client),
+) -> StreamingResponse:
+    """Crawl discover pages for a provider and stream shows as NDJSON.
+
+    Pages 1..`max_pages` are fetched concurrently (`PSMA_TMDB_DISCOVER_CONCURRENCY`)
+    and shows are emitted, de-duplicated by id, as each page arrives.
+    """
+
+    url = f"{TMDB_BASE_URL}/discover/tv"
+    params: dict[str, Any] = {
+        "api_key": api_key,
+        "watch_region": _normalize_watch_region(country),
+        "with_watch_providers": str(watch_provider_id),
+    }
+
+    monetization = _monetization_types_param(monetization_types)
+    if monetization:
+        params["with_watch_monetization_types"] = monetization
+
+    if language:
+        params["language"] = language
+    if sort_by:
+        params["sort_by"] = sort_by
+
+    return await _stream_discover_pages(
+        client=client,
+        url=url,
+        params=params,
+        max_pages=max_pages,
         attribution=TMDB_ATTRIBUTION,
         request={
             "watch_provider_id": watch_provider_id,
@@ -257,19 +498,19 @@ async def tmdb_discover_tv_by_provider(
             "monetization_types": monetization_types,
             "language": language,
             "sort_by": sort_by,
-            "page": page,
+            "max_pages": max_pages,
             "url": url,
         },
-        data=data,
     )
 
 
 @router.get("/genre/tv/list", response_model=ProviderEnvelope)
 async def tmdb_tv_genre_list(
     language: str | None = None,
+    raw: bool = False,
     api_key: str = Depends(require_tmdb_key),
     client: httpx.AsyncClient = Depends(get_http_client),
-) -> ProviderEnvelope:
+) -> Any:
     """List TV genres.
 
     UI can call this to populate a genre selector.
@@ -281,8 +522,11 @@ async def tmdb_tv_genre_list(
         params["language"] = language
 
     try:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
+        if raw:
+            resp = await send_upstream_stream(client, url, params)
+        else:
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
             status_code=502,
@@ -298,12 +542,20 @@ async def tmdb_tv_genre_list(
             detail={"message": "TMDB request failed", "error": str(exc)},
         ) from exc
 
+    request_info = {"language": language, "url": url}
+    if raw:
+        return envelope_passthrough_response(
+            resp, provider="tmdb", attribution=None, request=request_info
+        )
+
     data: Any = resp.json()
-    return ProviderEnvelope(
-        provider="tmdb",
-        attribution=None,
-        request={"language": language, "url": url},
-        data=data,
+    return ModelJSONResponse(
+        ProviderEnvelope(
+            provider="tmdb",
+            attribution=None,
+            request=request_info,
+            data=data,
+        )
     )
 
 
@@ -313,13 +565,14 @@ async def tmdb_discover_tv_by_genre(
     language: str | None = None,
     sort_by: str | None = None,
     page: int | None = None,
+    raw: bool = False,
     api_key: str = Depends(require_tmdb_key),
     client: httpx.AsyncClient = Depends(get_http_client),
-) -> ProviderEnvelope:
+) -> Any:
     """Discover TV shows for a given TMDB genre.
 
-    Note: TMDB discovery is paginated (typically 20 per page). For now we expose
-    a single page.
+    Note: TMDB discovery is paginated (typically 20 per page). This route
+    returns a single page; use `/discover/tv/by-genre/stream` to crawl many.
     """
 
     url = f"{TMDB_BASE_URL}/discover/tv"
@@ -335,8 +588,11 @@ async def tmdb_discover_tv_by_genre(
         params["page"] = page
 
     try:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
+        if raw:
+            resp = await send_upstream_stream(client, url, params)
+        else:
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
             status_code=502,
@@ -352,10 +608,49 @@ async def tmdb_discover_tv_by_genre(
             detail={"message": "TMDB request failed", "error": str(exc)},
         ) from exc
 
+    request_info = {"genre_id": genre_id, "language": language, "sort_by": sort_by, "page": page, "url": url}
+    if raw:
+        return envelope_passthrough_response(
+            resp, provider="tmdb", attribution=None, request=request_info
+        )
+
     data: Any = resp.json()
-    return ProviderEnvelope(
-        provider="tmdb",
+    return ModelJSONResponse(
+        ProviderEnvelope(
+            provider="tmdb",
+            attribution=None,
+            request=request_info,
+            data=data,
+        )
+    )
+
+
+@router.get("/discover/tv/by-genre/stream", response_class=StreamingResponse)
+async def tmdb_discover_tv_by_genre_stream(
+    genre_id: int,
+    language: str | None = None,
+    sort_by: str | None = None,
+    max_pages: int = Query(default=5, ge=1, le=TMDB_MAX_DISCOVER_PAGES),
+    api_key: str = Depends(require_tmdb_key),
+    client: httpx.AsyncClient = Depends(get_http_client),
+) -> StreamingResponse:
+    """Crawl discover pages for a genre and stream shows as NDJSON."""
+
+    url = f"{TMDB_BASE_URL}/discover/tv"
+    params: dict[str, Any] = {
+        "api_key": api_key,
+        "with_genres": str(genre_id),
+    }
+    if language:
+        params["language"] = language
+    if sort_by:
+        params["sort_by"] = sort_by
+
+    return await _stream_discover_pages(
+        client=client,
+        url=url,
+        params=params,
+        max_pages=max_pages,
         attribution=None,
-        request={"genre_id": genre_id, "language": language, "sort_by": sort_by, "page": page, "url": url},
-        data=data,
+        request={"genre_id": genre_id, "language": language, "sort_by": sort_by, "max_pages": max_pages, "url": url},
     )
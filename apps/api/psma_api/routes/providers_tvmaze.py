@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from psma_api.deps import get_http_client
 from psma_api.models.providers import Attribution, ProviderEnvelope
+from psma_api.responses import ModelJSONResponse, envelope_passthrough_response, send_upstream_stream
 
 router = APIRouter(prefix="/providers/tvmaze", tags=["providers"])
 
@@ -33,12 +34,17 @@ AllowedEmbed = Literal[
 @router.get("/search/shows", response_model=ProviderEnvelope)
 async def tvmaze_search_shows(
     q: str,
+    raw: bool = False,
     client: httpx.AsyncClient = Depends(get_http_client),
-) -> ProviderEnvelope:
+) -> Any:
     url = f"{TVMAZE_BASE_URL}/search/shows"
+    params = {"q": q}
     try:
-        resp = await client.get(url, params={"q": q})
-        resp.raise_for_status()
+        if raw:
+            resp = await send_upstream_stream(client, url, params)
+        else:
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
             status_code=502,
@@ -54,12 +60,20 @@ async def tvmaze_search_shows(
             detail={"message": "TVmaze request failed", "error": str(exc)},
         ) from exc
 
+    request_info = {"q": q, "url": url}
+    if raw:
+        return envelope_passthrough_response(
+            resp, provider="tvmaze", attribution=TVMAZE_ATTRIBUTION, request=request_info
+        )
+
     data: Any = resp.json()
-    return ProviderEnvelope(
-        provider="tvmaze",
-        attribution=TVMAZE_ATTRIBUTION,
-        request={"q": q, "url": url},
-        data=data,
+    return ModelJSONResponse(
+        ProviderEnvelope(
+            provider="tvmaze",
+            attribution=TVMAZE_ATTRIBUTION,
+            request=request_info,
+            data=data,
+        )
     )
 
 
@@ -67,16 +81,26 @@ async def tvmaze_search_shows(
 async def tvmaze_get_show(
     show_id: int,
     embed: AllowedEmbed | None = None,
+    raw: bool = False,
     client: httpx.AsyncClient = Depends(get_http_client),
-) -> ProviderEnvelope:
+) -> Any:
+    """Fetch a show, optionally with an embed.
+
+    `raw=true` streams the upstream body into the envelope without decoding it;
+    use it for large payloads such as `embed=episodes`.
+    """
+
     url = f"{TVMAZE_BASE_URL}/shows/{show_id}"
     params: dict[str, str] = {}
     if embed is not None:
         params["embed"] = embed
 
     try:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
+        if raw:
+            resp = await send_upstream_stream(client, url, params)
+        else:
+            resp = await client.get(url, params=params)
+            resp.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise HTTPException(
             status_code=502,
@@ -92,10 +116,18 @@ async def tvmaze_get_show(
             detail={"message": "TVmaze request failed", "error": str(exc)},
         ) from exc
 
+    request_info = {"show_id": show_id, "embed": embed, "url": url}
+    if raw:
+        return envelope_passthrough_response(
+            resp, provider="tvmaze", attribution=TVMAZE_ATTRIBUTION, request=request_info
+        )
+
     data: Any = resp.json()
-    return ProviderEnvelope(
-        provider="tvmaze",
-        attribution=TVMAZE_ATTRIBUTION,
-        request={"show_id": show_id, "embed": embed, "url": url},
-        data=data,
+    return ModelJSONResponse(
+        ProviderEnvelope(
+            provider="tvmaze",
+            attribution=TVMAZE_ATTRIBUTION,
+            request=request_info,
+            data=data,
+        )
     )
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
 import json
-from functools import lru_cache
+import logging
+import os
 from pathlib import Path
+import signal
+import threading
+from types import MappingProxyType
 from typing import Any, Literal
 
+from psma_api.settings import settings
+
+logger = logging.getLogger("psma_api.service_registry")
 
 ServiceCategory = Literal["svod", "avod", "tvod", "live_bundle", "unknown"]
 
+ExternalIdValue = int | str
+
+TMDB_WATCH_PROVIDER_ID = "tmdb_watch_provider_id"
+
 
 @dataclass(frozen=True)
 class ServiceRegistryEntry:
@@ -16,6 +29,8 @@ class ServiceRegistryEntry:
     display_name: str
     category: ServiceCategory
     tmdb_watch_provider_ids: tuple[int, ...]
+    # Every external id list from the registry file, as (id_type, values) pairs.
+    external_ids: tuple[tuple[str, tuple[ExternalIdValue, ...]], ...] = ()
 
 
 def _repo_root() -> Path:
@@ -24,56 +39,204 @@ def _repo_root() -> Path:
 
 
 def _registry_path() -> Path:
+    # The one place the registry location is resolved: the API lifespan, the
+    # reloader and the lazy loader all go through here.
+    if settings.service_registry_path:
+        return Path(settings.service_registry_path)
     return _repo_root() / "contracts" / "registry" / "service-registry.v1.json"
 
 
-@lru_cache(maxsize=1)
+def _parse_entry(item: Any) -> ServiceRegistryEntry | None:
+    if not isinstance(item, dict):
+        return None
+    service_id = item.get("service_id")
+    display_name = item.get("display_name")
+    category = item.get("category")
+    raw_external_ids: Any = item.get("external_ids")
+
+    if not isinstance(service_id, str) or not service_id:
+        return None
+    if not isinstance(display_name, str) or not display_name:
+        display_name = service_id
+    if category not in {"svod", "avod", "tvod", "live_bundle", "unknown"}:
+        category = "unknown"
+
+    external_ids: list[tuple[str, tuple[ExternalIdValue, ...]]] = []
+    if isinstance(raw_external_ids, dict):
+        for id_type in sorted(k for k in raw_external_ids if isinstance(k, str)):
+            values = raw_external_ids[id_type]
+            if not isinstance(values, list):
+                values = [values]
+            # bool is an int subclass; it is never a meaningful id.
+            kept = tuple(v for v in values if isinstance(v, (int, str)) and not isinstance(v, bool))
+            external_ids.append((id_type, kept))
+    tmdb_ids = tuple(v for v in dict(external_ids).get(TMDB_WATCH_PROVIDER_ID, ()) if isinstance(v, int))
+
+    return ServiceRegistryEntry(
+        service_id=service_id,
+        display_name=display_name,
+        category=category,  # type: ignore[arg-type]
+        tmdb_watch_provider_ids=tmdb_ids,
+        external_ids=tuple(external_ids),
+    )
+
+
+class ServiceRegistry:
+    """Immutable, indexed view of the service registry.
+
+    Indexes are built once, so lookups by service_id, by any external id type
+    and by category are O(1). Reloads build a new instance and swap it in.
+    """
+
+    def __init__(self, entries: tuple[ServiceRegistryEntry, ...], *, mtime_ns: int | None = None) -> None:
+        self.entries = entries
+        self.mtime_ns = mtime_ns
+
+        by_id: dict[str, ServiceRegistryEntry] = {}
+        by_external: dict[str, dict[ExternalIdValue, ServiceRegistryEntry]] = {}
+        by_category: dict[str, list[ServiceRegistryEntry]] = {}
+        for entry in entries:
+            by_id.setdefault(entry.service_id, entry)
+            by_category.setdefault(entry.category, []).append(entry)
+            for id_type, values in entry.external_ids:
+                index = by_external.setdefault(id_type, {})
+                for value in values:
+                    # Last entry wins, matching the original TMDB-id map.
+                    index[value] = entry
+
+        self._by_id = MappingProxyType(by_id)
+        self._by_external = {k: MappingProxyType(v) for k, v in by_external.items()}
+        self._by_category = {k: tuple(v) for k, v in by_category.items()}
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> ServiceRegistry:
+        path = Path(path)
+        mtime_ns = path.stat().st_mtime_ns
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        services = raw.get("services") if isinstance(raw, dict) else None
+        if not isinstance(services, list):
+            return cls((), mtime_ns=mtime_ns)
+        entries = tuple(e for e in (_parse_entry(item) for item in services) if e is not None)
+        return cls(entries, mtime_ns=mtime_ns)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, service_id: str) -> ServiceRegistryEntry | None:
+        return self._by_id.get(service_id)
+
+    def by_external_id(self, id_type: str, value: ExternalIdValue) -> ServiceRegistryEntry | None:
+        index = self._by_external.get(id_type)
+        return index.get(value) if index is not None else None
+
+    def external_id_map(self, id_type: str) -> Mapping[ExternalIdValue, ServiceRegistryEntry]:
+        return self._by_external.get(id_type, MappingProxyType({}))
+
+    def by_category(self, category: str) -> tuple[ServiceRegistryEntry, ...]:
+        return self._by_category.get(category, ())
+
+
+class ServiceRegistryReloader:
+    """Keep the active `ServiceRegistry` in sync with its file.
+
+    `watch()` polls the file's mtime and rebuilds the registry off the event
+    loop; SIGHUP (where supported) forces a check. The new registry replaces
+    the old one with a single reference swap, so readers never observe a
+    half-built index. An unreadable file keeps the previous registry.
+    """
+
+    def __init__(self, path: str | Path | None = None, *, poll_seconds: float = 5.0) -> None:
+        self.path = Path(path) if path else _registry_path()
+        self.poll_seconds = poll_seconds
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._signal_installed = False
+
+    def load(self) -> ServiceRegistry:
+        registry = ServiceRegistry.from_file(self.path)
+        set_service_registry(registry)
+        return registry
+
+    def _mtime_ns(self) -> int | None:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    async def reload_if_changed(self) -> bool:
+        mtime_ns = await asyncio.to_thread(self._mtime_ns)
+        if mtime_ns is None or mtime_ns == get_service_registry().mtime_ns:
+            return False
+        try:
+            registry = await asyncio.to_thread(ServiceRegistry.from_file, self.path)
+        except (OSError, ValueError) as exc:
+            logger.warning("service_registry_reload_failed", extra={"path": str(self.path), "error": repr(exc)})
+            return False
+        set_service_registry(registry)
+        logger.info("service_registry_reloaded", extra={"path": str(self.path), "services": len(registry)})
+        return True
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self._wakeup.set)
+            self._signal_installed = True
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+            # No SIGHUP on Windows; signals only work in the main thread.
+            self._signal_installed = False
+        self._task = loop.create_task(self.watch())
+
+    async def stop(self) -> None:
+        if self._signal_installed:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+            self._signal_installed = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def watch(self) -> None:
+        while True:
+            try:
+                timeout = self.poll_seconds if self.poll_seconds > 0 else None
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.reload_if_changed()
+
+
+_active: ServiceRegistry | None = None
+_active_lock = threading.Lock()
+
+
+def set_service_registry(registry: ServiceRegistry) -> None:
+    global _active
+    _active = registry
+
+
+def get_service_registry() -> ServiceRegistry:
+    """Return the active registry, loading the configured file on first use.
+
+    The API builds it in the lifespan; the lazy path serves scripts and tests.
+    """
+
+    registry = _active
+    if registry is not None:
+        return registry
+    with _active_lock:
+        if _active is None:
+            set_service_registry(ServiceRegistry.from_file(_registry_path()))
+        assert _active is not None
+        return _active
+
+
 def load_service_registry() -> tuple[ServiceRegistryEntry, ...]:
-    path = _registry_path()
-    raw = json.loads(path.read_text(encoding="utf-8"))
-    services = raw.get("services")
-    if not isinstance(services, list):
-        return tuple()
-
-    entries: list[ServiceRegistryEntry] = []
-    for item in services:
-        if not isinstance(item, dict):
-            continue
-        service_id = item.get("service_id")
-        display_name = item.get("display_name")
-        category = item.get("category")
-        external_ids: Any = item.get("external_ids")
-        tmdb_ids: list[int] = []
-        if isinstance(external_ids, dict):
-            ids = external_ids.get("tmdb_watch_provider_id")
-            if isinstance(ids, list):
-                for v in ids:
-                    if isinstance(v, int):
-                        tmdb_ids.append(v)
-
-        if not isinstance(service_id, str) or not service_id:
-            continue
-        if not isinstance(display_name, str) or not display_name:
-            display_name = service_id
-        if category not in {"svod", "avod", "tvod", "live_bundle", "unknown"}:
-            category = "unknown"
-
-        entries.append(
-            ServiceRegistryEntry(
-                service_id=service_id,
-                display_name=display_name,
-                category=category,  # type: ignore[arg-type]
-                tmdb_watch_provider_ids=tuple(tmdb_ids),
-            )
-        )
-
-    return tuple(entries)
-
-
-@lru_cache(maxsize=1)
-def tmdb_provider_id_to_service() -> dict[int, ServiceRegistryEntry]:
-    mapping: dict[int, ServiceRegistryEntry] = {}
-    for entry in load_service_registry():
-        for pid in entry.tmdb_watch_provider_ids:
-            mapping[pid] = entry
-    return mapping
+    return get_service_registry().entries
+
+
+def tmdb_provider_id_to_service() -> Mapping[int, ServiceRegistryEntry]:
+    return get_service_registry().external_id_map(TMDB_WATCH_PROVIDER_ID)  # type: ignore[return-value]
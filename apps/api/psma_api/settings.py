@@ -20,11 +20,90 @@ class Settings(BaseSettings):
 
     http_timeout_seconds: float = 10.0
     user_agent: str = "PSMA/0.0.0 (local dev)"
+    # Share one upstream call between concurrent identical GET requests.
+    http_coalesce_requests: bool = True
+    # Persistent RFC 9111 cache for upstream responses (survives restarts).
+    http_cache_enabled: bool = True
+    http_cache_path: str = str(_API_DIR / ".cache" / "http-cache.sqlite3")
+    # Least recently used entries are evicted beyond either bound.
+    http_cache_max_entries: int = 10_000
+    http_cache_max_bytes: int = 256 * 1024 * 1024
+    # Per-host upstream rate limits as "N/S" (N requests per S seconds).
+    # JSON in env, e.g. PSMA_HTTP_RATE_LIMITS='{"api.tvmaze.com": "20/10"}'.
+    http_rate_limits: dict[str, str] = {
+        "api.themoviedb.org": "40/1",
+        "api.tvmaze.com": "20/10",
+    }
+    http_max_concurrency_per_host: int = 16
+    http_rate_limit_max_retries: int = 2
+    http_rate_limit_max_wait_seconds: float = 10.0
+    # Per-host circuit breaker: open when >= ratio of the last `window` calls failed.
+    http_circuit_breaker_enabled: bool = True
+    http_circuit_failure_ratio: float = 0.5
+    http_circuit_window: int = 20
+    http_circuit_min_calls: int = 5
+    http_circuit_open_seconds: float = 30.0
+
+    # Service registry file (default: contracts/registry/service-registry.v1.json).
+    # Reloaded when its mtime changes (polled every N seconds; 0 = SIGHUP only).
+    service_registry_path: str | None = None
+    service_registry_reload_seconds: float = 5.0
+
+    # Cache-Control max-age for API responses (0 = revalidate every time via ETag).
+    response_max_age_availability_seconds: int = 300
+    response_max_age_providers_seconds: int = 3600
+    response_max_age_plan_seconds: int = 0
 
     log_level: str = "INFO"
     log_format: str = "json"  # json | text
 
     tmdb_api_key: str | None = None
+    # Max concurrent page fetches for the streaming discover routes.
+    tmdb_discover_concurrency: int = 4
+
+    # Availability assessments cache (per series_id + region).
+    availability_cache_enabled: bool = True
+    availability_cache_ttl_seconds: float = 3600.0
+    availability_cache_stale_seconds: float = 86400.0
+    availability_cache_max_entries: int = 10_000
+
+    # Max concurrent engine calls per batch availability request.
+    availability_batch_concurrency: int = 8
+    # Shared deadline for all availability engines behind the orchestrator (and planning-hint lookups).
+    availability_engine_deadline_seconds: float = 8.0
+    # Snapshots remembered for the availability diff route (oldest evicted first).
+    availability_snapshot_tokens_max_entries: int = 10_000
+
+    # Attach TVmaze-derived planning hints (cadence, next/last air time) to
+    # assessments. Costs extra upstream calls on a cache miss, so opt-in.
+    planning_hints_enabled: bool = False
+    planning_hints_max_age_seconds: float = 86400.0
+    planning_hints_cache_max_entries: int = 10_000
+
+    # ADR-0004 planner buffers: days kept after a known availability end, and
+    # max gap (days) between required intervals that still merges them.
+    planner_unsubscribe_buffer_days: int = 1
+    planner_merge_gap_days: int = 1
+    # `plan_objective: min_cost`: exact search up to this many title -> service
+    # combinations, otherwise greedy search capped at this many cost evaluations.
+    planner_cost_exact_max_assignments: int = 4_096
+    planner_cost_max_evaluations: int = 20_000
+    # Memoized plans: identical requests within the same `now` window (seconds)
+    # share one plan. Bounded by entries and by serialized size.
+    plan_cache_enabled: bool = True
+    plan_cache_now_granularity_seconds: float = 60.0
+    plan_cache_max_entries: int = 1_000
+    plan_cache_max_bytes: int = 64 * 1024 * 1024
+    # Plans remembered for POST /plan/v1/delta (oldest evicted first).
+    plan_tokens_max_entries: int = 1_000
+
+    # Plan large requests in a process pool instead of on the event loop
+    # (0 workers = always inline). Smaller requests are still planned inline.
+    # Offloading costs the loop ~0.5 ms (hand-off + response parse); inline
+    # planning passes that at roughly 200 assessments + inputs (~1.7 ms at 240,
+    # ~6 ms at 450, ~23 ms at 5k on the reference machine).
+    planner_process_pool_workers: int = 0
+    planner_process_pool_min_items: int = 250
 
 
 settings = Settings()
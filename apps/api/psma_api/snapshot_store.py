@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+import sqlite3
+import uuid
+
+from psma_api.engines.availability_diff import AssessmentKey, assessment_hash, assessment_key
+from psma_api.models.availability import AvailabilityAssessmentV1
+
+
+class AvailabilitySnapshotStore:
+    """Local SQLite store of the latest normalized assessments per series.
+
+    Also records refresh runs and per-series progress so an interrupted
+    catalog refresh can resume where it stopped.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS assessments (
+                    series_id INTEGER NOT NULL,
+                    title_id TEXT NOT NULL,
+                    country TEXT NOT NULL,
+                    service_id TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (title_id, country, service_id)
+                );
+                CREATE INDEX IF NOT EXISTS assessments_series ON assessments (series_id);
+                CREATE TABLE IF NOT EXISTS refresh_runs (
+                    run_id TEXT PRIMARY KEY,
+                    country TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    finished_at TEXT
+                );
+                CREATE TABLE IF NOT EXISTS refresh_progress (
+                    run_id TEXT NOT NULL,
+                    series_id INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    PRIMARY KEY (run_id, series_id)
+                );
+                """
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # Runs -----------------------------------------------------------------
+
+    def start_or_resume_run(self, *, country: str, resume: bool) -> tuple[str, set[int]]:
+        """Return (run_id, series ids already done in that run)."""
+
+        if resume:
+            row = self._conn.execute(
+                "SELECT run_id FROM refresh_runs WHERE finished_at IS NULL AND country = ? "
+                "ORDER BY started_at DESC LIMIT 1",
+                (country,),
+            ).fetchone()
+            if row is not None:
+                run_id = row[0]
+                done = {
+                    sid
+                    for (sid,) in self._conn.execute(
+                        "SELECT series_id FROM refresh_progress WHERE run_id = ? AND status = 'ok'", (run_id,)
+                    )
+                }
+                return run_id, done
+
+        run_id = uuid.uuid4().hex
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO refresh_runs (run_id, country, started_at) VALUES (?, ?, ?)",
+                (run_id, country, _now()),
+            )
+        return run_id, set()
+
+    def finish_run(self, run_id: str) -> None:
+        with self._conn:
+            self._conn.execute("UPDATE refresh_runs SET finished_at = ? WHERE run_id = ?", (_now(), run_id))
+
+    def mark_failed(self, run_id: str, series_id: int) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO refresh_progress VALUES (?, ?, 'error')",
+                (run_id, series_id),
+            )
+
+    # Assessments ----------------------------------------------------------
+
+    def hashes_for_series(self, series_id: int, regions: tuple[str, ...] | None) -> dict[AssessmentKey, str]:
+        rows = self._conn.execute(
+            "SELECT title_id, country, service_id, content_hash FROM assessments WHERE series_id = ?",
+            (series_id,),
+        )
+        return {
+            (title_id, country, service_id): content_hash
+            for title_id, country, service_id, content_hash in rows
+            if regions is None or country in regions
+        }
+
+    def load_series(self, series_id: int) -> list[AvailabilityAssessmentV1]:
+        rows = self._conn.execute(
+            "SELECT payload FROM assessments WHERE series_id = ? ORDER BY title_id, country, service_id",
+            (series_id,),
+        )
+        return [AvailabilityAssessmentV1.model_validate_json(payload) for (payload,) in rows]
+
+    def apply_series(
+        self,
+        *,
+        run_id: str,
+        series_id: int,
+        upserts: list[AvailabilityAssessmentV1],
+        removed: list[AssessmentKey],
+    ) -> None:
+        """Persist one series' changes and mark it done, atomically."""
+
+        now = _now()
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM assessments WHERE title_id = ? AND country = ? AND service_id = ?",
+                removed,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO assessments VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (series_id, *assessment_key(a), assessment_hash(a), a.model_dump_json(exclude_none=True), now)
+                    for a in upserts
+                ],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO refresh_progress VALUES (?, ?, 'ok')",
+                (run_id, series_id),
+            )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
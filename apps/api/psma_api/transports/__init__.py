@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import httpx
+
+
+# Request extension asking the transport stack to leave the response body
+# unread. Layers that buffer bodies (coalescing, HTTP cache) pass such
+# requests straight through.
+STREAM_EXTENSION = "psma_stream"
+
+
+def wants_stream(request: httpx.Request) -> bool:
+    return bool(request.extensions.get(STREAM_EXTENSION))
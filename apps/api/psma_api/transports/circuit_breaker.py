@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import logging
+import time
+from typing import Literal
+
+import httpx
+
+
+logger = logging.getLogger("psma_api.http")
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of calling an upstream host whose circuit is open.
+
+    Subclasses `httpx.RequestError`, so existing route handlers already map it
+    to a 502 - just without waiting for the upstream timeout.
+    """
+
+
+class HostCircuit:
+    """Rolling-window circuit for one upstream host."""
+
+    def __init__(
+        self,
+        *,
+        failure_ratio: float,
+        window: int,
+        min_calls: int,
+        open_seconds: float,
+        half_open_probes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_ratio = failure_ratio
+        self._min_calls = max(1, min_calls)
+        self._open_seconds = open_seconds
+        self._half_open_probes = max(1, half_open_probes)
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=max(1, window))
+        self._state: CircuitState = "closed"
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == "open" and self._clock() - self._opened_at >= self._open_seconds:
+            self._state = "half_open"
+            self._probes_in_flight = 0
+        return self._state
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and self._probes_in_flight < self._half_open_probes:
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def record(self, *, failed: bool) -> CircuitState:
+        if self._state == "half_open":
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if failed:
+                self._trip()
+            else:
+                self._state = "closed"
+                self._outcomes.clear()
+            return self._state
+
+        self._outcomes.append(failed)
+        if self._state == "closed" and len(self._outcomes) >= self._min_calls:
+            ratio = sum(self._outcomes) / len(self._outcomes)
+            if ratio >= self._failure_ratio:
+                self._trip()
+        return self._state
+
+    def abandon(self) -> None:
+        if self._state == "half_open":
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _trip(self) -> None:
+        self._state = "open"
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """Per-host circuit breaker.
+
+    Timeouts, network errors and 5xx responses count as failures. Once the
+    failure ratio over the rolling window crosses the threshold the circuit
+    opens and requests fail immediately with `CircuitOpenError`; after
+    `open_seconds` a few half-open probes decide whether to close it again.
+    """
+
+    def __init__(
+        self,
+        inner: httpx.AsyncBaseTransport,
+        *,
+        failure_ratio: float,
+        window: int,
+        min_calls: int,
+        open_seconds: float,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._options = {
+            "failure_ratio": failure_ratio,
+            "window": window,
+            "min_calls": min_calls,
+            "open_seconds": open_seconds,
+            "half_open_probes": half_open_probes,
+            "clock": clock,
+        }
+        self._circuits: dict[str, HostCircuit] = {}
+
+    def circuit_for(self, host: str) -> HostCircuit:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = HostCircuit(**self._options)
+        return circuit
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        circuit = self.circuit_for(host)
+        if not circuit.allow():
+            raise CircuitOpenError(f"Circuit open for upstream host {host}", request=request)
+
+        try:
+            response = await self._inner.handle_async_request(request)
+        except (httpx.TimeoutException, httpx.NetworkError):
+            self._record(circuit, request, failed=True)
+            raise
+        except BaseException:
+            # Not an upstream health signal (e.g. cancellation); just free the probe slot.
+            circuit.abandon()
+            raise
+
+        self._record(circuit, request, failed=response.status_code >= 500)
+        return response
+
+    def _record(self, circuit: HostCircuit, request: httpx.Request, *, failed: bool) -> None:
+        before = circuit.state
+        after = circuit.record(failed=failed)
+        if after != before:
+            logger.warning(
+                "upstream_circuit_" + after,
+                extra={"upstream": request.url.host, "method": request.method, "path": request.url.path},
+            )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+
+import httpx
+
+from psma_api.transports import wants_stream
+
+
+logger = logging.getLogger("psma_api.http")
+
+_COALESCABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass(frozen=True)
+class _SharedResponse:
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    extensions: dict
+
+
+class CoalescingTransport(httpx.AsyncBaseTransport):
+    """Singleflight wrapper: concurrent identical GET/HEAD requests share one upstream call.
+
+    The key is method + full URL (including query params). The first caller
+    starts the upstream request in its own task; everyone asking for the same
+    key while it is in flight awaits that task and receives a response built
+    from the same body bytes. Cancelling one caller never cancels the shared
+    upstream call. Streamed requests (`STREAM_EXTENSION`) are not coalesced,
+    since sharing requires reading the whole body.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+        self._inner = inner
+        self._inflight: dict[str, asyncio.Task[_SharedResponse]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in _COALESCABLE_METHODS or wants_stream(request):
+            return await self._inner.handle_async_request(request)
+
+        key = f"{request.method} {request.url}"
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._fetch(request))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._on_done(key, t))
+        else:
+            logger.debug(
+                "upstream_request_coalesced",
+                extra={"upstream": request.url.host, "method": request.method, "path": request.url.path},
+            )
+
+        shared = await asyncio.shield(task)
+        return httpx.Response(
+            shared.status_code,
+            headers=shared.headers,
+            content=shared.body,
+            extensions=dict(shared.extensions),
+            request=request,
+        )
+
+    def _on_done(self, key: str, task: asyncio.Task[_SharedResponse]) -> None:
+        self._inflight.pop(key, None)
+        # Mark the exception as retrieved even if every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(self, request: httpx.Request) -> _SharedResponse:
+        response = await self._inner.handle_async_request(request)
+        try:
+            # Decode once; waiters share the decoded body instead of re-inflating it.
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        return _SharedResponse(
+            status_code=response.status_code,
+            headers=[
+                (k, v)
+                for k, v in response.headers.raw
+                if k.lower() not in (b"content-encoding", b"content-length", b"transfer-encoding")
+            ],
+            body=body,
+            extensions={k: v for k, v in response.extensions.items() if k != "network_stream"},
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
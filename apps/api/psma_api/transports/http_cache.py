@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+
+import httpx
+
+from psma_api.transports import wants_stream
+
+
+logger = logging.getLogger("psma_api.http")
+
+# Status codes that RFC 9110 marks as heuristically cacheable.
+_HEURISTIC_STATUSES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+# Hop-by-hop / representation headers we never replay from the store.
+_DROP_HEADERS = frozenset({b"content-encoding", b"content-length", b"transfer-encoding", b"connection"})
+# RFC 9111 §4.2.2 suggests 10% of the Last-Modified age; cap it to stay conservative.
+_HEURISTIC_FRACTION = 0.1
+_HEURISTIC_MAX_SECONDS = 24 * 3600.0
+
+
+def cache_key(request: httpx.Request) -> str:
+    # Same redaction rule as deps._safe_url, but only for the credential:
+    # other query params are part of the resource identity.
+    return f"GET {request.url.copy_remove_param('api_key')}"
+
+
+def _parse_cache_control(value: str | None) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    if not value:
+        return directives
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') if arg else None
+    return directives
+
+
+def _seconds(directives: dict[str, str | None], name: str) -> float | None:
+    raw = directives.get(name)
+    if raw is None:
+        return None
+    try:
+        return max(0.0, float(int(raw)))
+    except ValueError:
+        return None
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class StoredResponse:
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    request_time: float
+    response_time: float
+    vary: dict[str, str | None]
+
+    def header(self, name: str) -> str | None:
+        lname = name.lower()
+        for k, v in self.headers:
+            if k.lower() == lname:
+                return v
+        return None
+
+    def freshness_lifetime(self) -> float:
+        """RFC 9111 §4.2.1 (private cache: max-age, then Expires, then heuristic)."""
+
+        cc = _parse_cache_control(self.header("cache-control"))
+        max_age = _seconds(cc, "max-age")
+        if max_age is not None:
+            return max_age
+
+        expires = self.header("expires")
+        if expires is not None:
+            expires_at = _http_date(expires)
+            if expires_at is None:
+                return 0.0
+            date = _http_date(self.header("date")) or self.response_time
+            return max(0.0, expires_at - date)
+
+        last_modified = _http_date(self.header("last-modified"))
+        if last_modified is not None and self.status_code in _HEURISTIC_STATUSES:
+            date = _http_date(self.header("date")) or self.response_time
+            return min(_HEURISTIC_MAX_SECONDS, max(0.0, (date - last_modified) * _HEURISTIC_FRACTION))
+        return 0.0
+
+    def current_age(self, now: float) -> float:
+        """RFC 9111 §4.2.3."""
+
+        try:
+            age_value = max(0.0, float(int(self.header("age") or 0)))
+        except ValueError:
+            age_value = 0.0
+        date = _http_date(self.header("date")) or self.response_time
+        apparent_age = max(0.0, self.response_time - date)
+        response_delay = self.response_time - self.request_time
+        corrected_initial_age = max(apparent_age, age_value + response_delay)
+        return corrected_initial_age + (now - self.response_time)
+
+    def is_fresh(self, now: float) -> bool:
+        cc = _parse_cache_control(self.header("cache-control"))
+        if "no-cache" in cc:
+            return False
+        return self.freshness_lifetime() > self.current_age(now)
+
+    def matches_vary(self, request: httpx.Request) -> bool:
+        return all(request.headers.get(name) == value for name, value in self.vary.items())
+
+
+class SqliteHttpCacheStorage:
+    """Tiny key/value store for cached responses, persisted in a SQLite file.
+
+    Bounded by entry count and total body bytes: when either is exceeded the
+    least recently used entries are deleted (`get` and `set` both count as a
+    use). Stale entries are kept until then, since they can still be
+    revalidated cheaply.
+    """
+
+    _COLUMNS = ("key", "status_code", "headers", "body", "request_time", "response_time", "vary", "size", "used_at")
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = 10_000,
+        max_bytes: int = 256 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max(1, max_entries)
+        self._max_bytes = max(1, max_bytes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            columns = tuple(row[1] for row in self._conn.execute("PRAGMA table_info(http_cache)"))
+            if columns and columns != self._COLUMNS:
+                # Written by an older version without LRU bookkeeping; it's only a cache.
+                self._conn.execute("DROP TABLE http_cache")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    key TEXT PRIMARY KEY,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    request_time REAL NOT NULL,
+                    response_time REAL NOT NULL,
+                    vary TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    used_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS http_cache_used_at ON http_cache (used_at)")
+            self._entries, self._bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache"
+            ).fetchone()
+            self._evict()
+
+    def __len__(self) -> int:
+        return self._entries
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> StoredResponse | None:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT status_code, headers, body, request_time, response_time, vary FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("UPDATE http_cache SET used_at = ? WHERE key = ?", (self._clock(), key))
+        if row is None:
+            return None
+        status_code, headers, body, request_time, response_time, vary = row
+        return StoredResponse(
+            status_code=status_code,
+            headers=[(k, v) for k, v in json.loads(headers)],
+            body=bytes(body),
+            request_time=request_time,
+            response_time=response_time,
+            vary=json.loads(vary),
+        )
+
+    def set(self, key: str, stored: StoredResponse) -> None:
+        size = len(stored.body)
+        with self._lock, self._conn:
+            self._forget(key)
+            self._conn.execute(
+                "INSERT INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    stored.status_code,
+                    json.dumps(stored.headers),
+                    stored.body,
+                    stored.request_time,
+                    stored.response_time,
+                    json.dumps(stored.vary),
+                    size,
+                    self._clock(),
+                ),
+            )
+            self._entries += 1
+            self._bytes += size
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._forget(key)
+
+    def _forget(self, key: str) -> None:
+        # Caller holds the lock and a transaction.
+        row = self._conn.execute("DELETE FROM http_cache WHERE key = ? RETURNING size", (key,)).fetchone()
+        if row is not None:
+            self._entries -= 1
+            self._bytes -= row[0]
+
+    def _evict(self) -> None:
+        # Caller holds the lock and a transaction.
+        while self._entries > self._max_entries or self._bytes > self._max_bytes:
+            excess = max(1, self._entries - self._max_entries)
+            rows = self._conn.execute(
+                "DELETE FROM http_cache WHERE key IN (SELECT key FROM http_cache ORDER BY used_at, key LIMIT ?) "
+                "RETURNING size",
+                (excess,),
+            ).fetchall()
+            if not rows:
+                break
+            self._entries -= len(rows)
+            self._bytes -= sum(size for (size,) in rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """Private HTTP cache (RFC 9111 subset) in front of an upstream transport.
+
+    - Only GET responses are stored; unsafe methods invalidate the URL.
+    - Honours Cache-Control (no-store, no-cache, max-age), Expires, Age and a
+      Last-Modified heuristic for freshness.
+    - Stale entries with an ETag/Last-Modified are revalidated with
+      If-None-Match/If-Modified-Since; a 304 refreshes the stored headers.
+    - The key drops the `api_key` query parameter so credentials never hit disk.
+    - Streamed requests (`STREAM_EXTENSION`) bypass the cache.
+    """
+
+    def __init__(
+        self,
+        inner: httpx.AsyncBaseTransport,
+        storage: SqliteHttpCacheStorage,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._inner = inner
+        self._storage = storage
+        self._clock = clock
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = cache_key(request)
+        if request.method not in {"GET", "HEAD"}:
+            response = await self._inner.handle_async_request(request)
+            if response.status_code < 400:
+                # RFC 9111 §4.4: a successful unsafe request invalidates the target URI.
+                await asyncio.to_thread(self._storage.delete, key)
+            return response
+
+        request_cc = _parse_cache_control(request.headers.get("cache-control"))
+        if request.method != "GET" or "no-store" in request_cc or wants_stream(request):
+            # Storing would mean buffering the body a streamed request asked us not to read.
+            return await self._inner.handle_async_request(request)
+
+        stored = await asyncio.to_thread(self._storage.get, key)
+        if stored is not None and not stored.matches_vary(request):
+            stored = None
+
+        now = self._clock()
+        force_revalidate = "no-cache" in request_cc or _seconds(request_cc, "max-age") == 0
+        if stored is not None and not force_revalidate and stored.is_fresh(now):
+            logger.debug("upstream_cache_hit", extra={"upstream": request.url.host, "path": request.url.path})
+            return self._build_response(stored, request, now)
+
+        if stored is not None:
+            etag = stored.header("etag")
+            last_modified = stored.header("last-modified")
+            if etag:
+                request.headers["If-None-Match"] = etag
+            if last_modified:
+                request.headers["If-Modified-Since"] = last_modified
+
+        request_time = self._clock()
+        response = await self._inner.handle_async_request(request)
+        response_time = self._clock()
+
+        if response.status_code == 304 and stored is not None:
+            await response.aclose()
+            merged = self._merge_headers(stored.headers, response.headers.raw)
+            stored = StoredResponse(
+                status_code=stored.status_code,
+                headers=merged,
+                body=stored.body,
+                request_time=request_time,
+                response_time=response_time,
+                vary=stored.vary,
+            )
+            logger.debug("upstream_cache_revalidated", extra={"upstream": request.url.host, "path": request.url.path})
+            await asyncio.to_thread(self._storage.set, key, stored)
+            return self._build_response(stored, request, response_time)
+
+        if not self._is_storable(response):
+            return response
+
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        stored = StoredResponse(
+            status_code=response.status_code,
+            headers=[
+                (k.decode("latin-1"), v.decode("latin-1"))
+                for k, v in response.headers.raw
+                if k.lower() not in _DROP_HEADERS
+            ],
+            body=body,
+            request_time=request_time,
+            response_time=response_time,
+            vary=self._vary_values(response, request),
+        )
+        await asyncio.to_thread(self._storage.set, key, stored)
+        return self._build_response(stored, request, response_time)
+
+    def _is_storable(self, response: httpx.Response) -> bool:
+        """RFC 9111 §3, narrowed to responses we can actually reuse."""
+
+        cc = _parse_cache_control(response.headers.get("cache-control"))
+        if "no-store" in cc:
+            return False
+        if response.headers.get("vary", "").strip() == "*":
+            return False
+        has_explicit_freshness = "max-age" in cc or "expires" in response.headers
+        has_validator = "etag" in response.headers or "last-modified" in response.headers
+        if has_explicit_freshness:
+            return True
+        return response.status_code in _HEURISTIC_STATUSES and has_validator
+
+    @staticmethod
+    def _vary_values(response: httpx.Response, request: httpx.Request) -> dict[str, str | None]:
+        names = [n.strip().lower() for n in response.headers.get("vary", "").split(",") if n.strip()]
+        return {name: request.headers.get(name) for name in names}
+
+    @staticmethod
+    def _merge_headers(
+        stored: list[tuple[str, str]], fresh: list[tuple[bytes, bytes]]
+    ) -> list[tuple[str, str]]:
+        # RFC 9111 §4.3.4: headers from the 304 replace the stored ones.
+        updates = {
+            k.decode("latin-1").lower(): v.decode("latin-1") for k, v in fresh if k.lower() not in _DROP_HEADERS
+        }
+        merged = [(k, updates.pop(k.lower(), v)) for k, v in stored]
+        merged.extend(updates.items())
+        return merged
+
+    @staticmethod
+    def _build_response(stored: StoredResponse, request: httpx.Request, now: float) -> httpx.Response:
+        headers = [(k, v) for k, v in stored.headers if k.lower() != "age"]
+        headers.append(("Age", str(int(stored.current_age(now)))))
+        return httpx.Response(
+            stored.status_code,
+            headers=headers,
+            content=stored.body,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        try:
+            await self._inner.aclose()
+        finally:
+            self._storage.close()
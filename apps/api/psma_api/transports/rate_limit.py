@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+import logging
+import time
+
+import httpx
+
+
+logger = logging.getLogger("psma_api.http")
+
+# Multiplicative decrease factors for the adaptive concurrency limit (AIMD).
+_THROTTLED_BACKOFF = 0.5
+_ERROR_BACKOFF = 0.75
+
+
+def parse_rate(value: str) -> tuple[float, int]:
+    """Parse "N/S" (N requests per S seconds) into (tokens per second, burst)."""
+
+    count, _, seconds = value.partition("/")
+    n = int(count.strip())
+    s = float(seconds.strip() or 1)
+    if n <= 0 or s <= 0:
+        raise ValueError(f"Invalid rate limit: {value!r}")
+    return n / s, n
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    """Retry-After is either delay-seconds or an HTTP-date (RFC 9110 §10.2.3)."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, at - (time.time() if now is None else now))
+
+
+class HostLimiter:
+    """Token bucket plus an adaptive (AIMD) in-flight limit for one upstream host."""
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int,
+        max_concurrency: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._clock = clock
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._max_concurrency = max(1, max_concurrency)
+        self._limit = float(self._max_concurrency)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def concurrency_limit(self) -> int:
+        return max(1, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                wait: float | None
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._in_flight >= self.concurrency_limit:
+                    wait = None
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self._in_flight += 1
+                    return
+                else:
+                    wait = (1.0 - self._tokens) / self._rate
+
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=wait)
+                except TimeoutError:
+                    pass
+
+    async def release(self, *, throttled: bool = False, failed: bool = False, abandoned: bool = False) -> None:
+        """Free an in-flight slot and adapt the limit to the call's outcome.
+
+        `abandoned` (cancelled, or failed for reasons that say nothing about
+        the upstream) frees the slot without moving the limit.
+        """
+
+        async with self._cond:
+            self._in_flight -= 1
+            if abandoned:
+                pass
+            elif throttled:
+                self._limit = max(1.0, self._limit * _THROTTLED_BACKOFF)
+            elif failed:
+                self._limit = max(1.0, self._limit * _ERROR_BACKOFF)
+            else:
+                # Additive increase: roughly +1 per "window" of successful calls.
+                self._limit = min(float(self._max_concurrency), self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    async def pause(self, seconds: float) -> None:
+        async with self._cond:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+            # Drain the bucket so resumed traffic restarts gently.
+            self._tokens = 0.0
+            self._cond.notify_all()
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """Per-host rate limiting in front of the network.
+
+    Requests queue for a token instead of being fired into a 429. Upstream
+    429/503 responses pause the host for `Retry-After` and are retried a
+    bounded number of times; the per-host concurrency limit shrinks on
+    throttling/errors and grows back while calls succeed.
+    Hosts without a configured rate pass straight through.
+    """
+
+    def __init__(
+        self,
+        inner: httpx.AsyncBaseTransport,
+        *,
+        rates: Mapping[str, str],
+        max_concurrency: int,
+        max_retries: int,
+        max_retry_wait_seconds: float,
+        default_retry_seconds: float = 1.0,
+    ) -> None:
+        self._inner = inner
+        self._max_retries = max(0, max_retries)
+        self._max_retry_wait = max_retry_wait_seconds
+        self._default_retry = default_retry_seconds
+        self._limiters: dict[str, HostLimiter] = {}
+        for host, spec in rates.items():
+            rate, burst = parse_rate(spec)
+            self._limiters[host.lower()] = HostLimiter(rate=rate, burst=burst, max_concurrency=max_concurrency)
+
+    def limiter_for(self, host: str) -> HostLimiter | None:
+        return self._limiters.get(host.lower())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = self.limiter_for(request.url.host)
+        if limiter is None:
+            return await self._inner.handle_async_request(request)
+
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            response: httpx.Response | None = None
+            failed = False
+            try:
+                response = await self._inner.handle_async_request(request)
+            except httpx.TransportError:
+                # Timeouts, connection and protocol errors count against the upstream.
+                failed = True
+                raise
+            finally:
+                # Cancellation (deadlines, client disconnects) must free the slot too,
+                # or enough of them wedge the host at its concurrency limit.
+                if response is None:
+                    await limiter.release(failed=failed, abandoned=not failed)
+
+            throttled = response.status_code in (429, 503)
+            await limiter.release(throttled=throttled, failed=response.status_code >= 500)
+            if not throttled:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            delay = self._default_retry * (2**attempt) if retry_after is None else retry_after
+            await limiter.pause(delay)
+
+            logger.warning(
+                "upstream_throttled",
+                extra={
+                    "upstream": request.url.host,
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status_code": response.status_code,
+                },
+            )
+            if attempt >= self._max_retries or delay > self._max_retry_wait:
+                return response
+
+            await response.aclose()
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
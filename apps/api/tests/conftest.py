@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from psma_api.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def _in_memory_http_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # Tests that enter the app lifespan build the real HTTP client; keep its
+    # cache out of the source tree.
+    monkeypatch.setattr(settings, "http_cache_path", ":memory:")
+    yield
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+from fastapi.testclient import TestClient
+
+from psma_api.cache import StaleWhileRevalidateCache
+from psma_api.deps import get_http_client
+from psma_api.main import app
+from psma_api.settings import settings
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_swr_cache_serves_fresh_then_stale_then_reloads() -> None:
+    clock = _Clock()
+    cache: StaleWhileRevalidateCache[str, int] = StaleWhileRevalidateCache(
+        ttl_seconds=10, stale_seconds=20, clock=clock
+    )
+    calls = {"n": 0}
+
+    async def loader() -> int:
+        calls["n"] += 1
+        return calls["n"]
+
+    async def scenario() -> None:
+        assert await cache.get_or_load("k", loader) == 1
+        clock.now = 5
+        assert await cache.get_or_load("k", loader) == 1
+        assert calls["n"] == 1
+
+        # Stale: served immediately, refreshed in the background.
+        clock.now = 15
+        assert await cache.get_or_load("k", loader) == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert calls["n"] == 2
+        assert cache.peek("k") == 2
+
+        # Past the stale window: the caller waits for a fresh load.
+        clock.now = 100
+        assert await cache.get_or_load("k", loader) == 3
+
+    asyncio.run(scenario())
+
+
+def test_swr_cache_evicts_least_recently_used() -> None:
+    cache: StaleWhileRevalidateCache[str, int] = StaleWhileRevalidateCache(ttl_seconds=10, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.peek("a") is None
+    assert cache.peek("b") == 2
+    assert len(cache) == 2
+
+
+def test_availability_v1_facade_uses_cache() -> None:
+    prior = settings.tmdb_api_key
+    settings.tmdb_api_key = "test-key"
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(
+            200,
+            json={"id": 1396, "results": {"US": {"flatrate": [{"provider_id": 8, "provider_name": "Netflix"}]}}},
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        with TestClient(app) as client:
+            for _ in range(3):
+                resp = client.get("/availability/v1/tmdb/tv/1396", params={"country": "us"})
+                assert resp.status_code == 200
+                assert resp.json()["assessments"][0]["service_id"] == "netflix"
+        assert calls["n"] == 1
+    finally:
+        app.dependency_overrides.clear()
+        settings.tmdb_api_key = prior
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+import random
+from typing import Any
+
+import httpx
+
+from psma_api.engines.availability_columnar import WatchProviderColumns, assess_tmdb_payloads_columnar
+from psma_api.engines.availability_v1 import assess_tmdb_tv_watch_providers_v1, parse_regions
+
+
+def _random_payload(rng: random.Random) -> dict[str, Any]:
+    providers = [(8, "Netflix"), (350, "Apple TV+"), (9, "Amazon Prime Video"), (999, "Some Free App"), (1234, None)]
+    results: dict[str, Any] = {}
+    for region in rng.sample(["US", "CA", "GB", "DE"], rng.randint(0, 4)):
+        region_result: dict[str, Any] = {"link": "https://example.invalid"}
+        for bucket in ("flatrate", "free", "ads", "rent", "buy"):
+            if rng.random() < 0.5:
+                region_result[bucket] = [
+                    {"provider_id": pid, "provider_name": name}
+                    for pid, name in rng.sample(providers, rng.randint(1, 3))
+                ]
+        results[region] = region_result
+    return {"results": results}
+
+
+async def _v1(series_id: int, payload: Any, country: str) -> list[dict]:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    async with httpx.AsyncClient(transport=transport) as client:
+        resp = await assess_tmdb_tv_watch_providers_v1(series_id=series_id, country=country, api_key="k", client=client)
+    return [a.model_dump(mode="json", exclude={"evidence": {"__all__": {"retrieved_at"}}}) for a in resp.assessments]
+
+
+def test_columnar_matches_v1_engine() -> None:
+    rng = random.Random(7)
+    payloads = [(sid, _random_payload(rng)) for sid in range(1, 60)]
+    retrieved_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    for country in ("US", "US,GB", "*"):
+        columnar = assess_tmdb_payloads_columnar(payloads, regions=parse_regions(country), retrieved_at=retrieved_at)
+        for series_id, payload in payloads:
+            expected = asyncio.run(_v1(series_id, payload, country))
+            actual = [
+                a.model_dump(mode="json", exclude={"evidence": {"__all__": {"retrieved_at"}}})
+                for a in columnar.get(series_id, [])
+            ]
+            assert actual == expected, (country, series_id)
+
+
+def test_columns_merge_buckets_into_one_row() -> None:
+    columns = WatchProviderColumns()
+    netflix = {"provider_id": 8, "provider_name": "Netflix"}
+    columns.ingest(1, {"results": {"US": {"flatrate": [netflix], "ads": [netflix]}, "CA": {"buy": [netflix]}}}, None)
+
+    assert len(columns) == 2
+    assert [columns.regions[r] for r in columns.region] == ["CA", "US"]
+    assert list(columns.mask) == [0b10000, 0b00101]
+    assert columns.names == ["Netflix"]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+import time
+
+import httpx
+import pytest
+
+from psma_api.engines.availability_engine_impl import DefaultAvailabilityEngine
+from psma_api.engines.availability_orchestrator import AvailabilityOrchestrator
+from psma_api.models.availability import (
+    AvailabilityAssessmentsProjectionResponseV1,
+    AvailabilityAssessmentsResponseV1,
+    AvailabilityAssessmentV1,
+)
+
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _assessment(service_id: str, source_id: str, reason: str) -> AvailabilityAssessmentV1:
+    return AvailabilityAssessmentV1(
+        title_id="tmdb:tv:1",
+        country="US",
+        service_id=service_id,
+        provider_category="svod",
+        availability_now="true",
+        confidence="medium",
+        reason_codes=[reason],
+        evidence=[{"source_id": source_id, "retrieved_at": T0}],
+    )
+
+
+class FakeEngine:
+    def __init__(self, *, delay: float, services: list[str], source_id: str, fail: bool = False) -> None:
+        self.delay = delay
+        self.services = services
+        self.source_id = source_id
+        self.fail = fail
+        self.cancelled = False
+
+    async def assess_tmdb_tv_watch_providers_v1(self, **_: object) -> AvailabilityAssessmentsResponseV1:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise httpx.ConnectError("boom")
+        return AvailabilityAssessmentsResponseV1(
+            retrieved_at=T0 + timedelta(seconds=self.delay),
+            assessments=[_assessment(s, self.source_id, f"{self.source_id.upper()}_PRESENT") for s in self.services],
+        )
+
+
+def _assess(orchestrator: AvailabilityOrchestrator) -> AvailabilityAssessmentsResponseV1:
+    async def run() -> AvailabilityAssessmentsResponseV1:
+        async with httpx.AsyncClient() as client:
+            return await orchestrator.assess_tmdb_tv_watch_providers_v1(
+                series_id=1, country="US", api_key="k", client=client
+            )
+
+    return asyncio.run(run())
+
+
+def test_merge_is_deterministic_and_runs_engines_concurrently() -> None:
+    # The second engine finishes first; registration order still decides the merge.
+    vod = FakeEngine(delay=0.2, services=["netflix", "hulu"], source_id="vod")
+    live = FakeEngine(delay=0.1, services=["hulu", "sling"], source_id="live")
+    orchestrator = AvailabilityOrchestrator([("vod", vod), ("live", live)], deadline_seconds=2.0)
+
+    start = time.perf_counter()
+    resp = _assess(orchestrator)
+    assert time.perf_counter() - start < 0.3
+
+    assert [a.service_id for a in resp.assessments] == ["netflix", "hulu", "sling"]
+    hulu = resp.assessments[1]
+    assert hulu.reason_codes == ["VOD_PRESENT", "LIVE_PRESENT"]
+    assert [e.source_id for e in hulu.evidence] == ["vod", "live"]
+    assert resp.retrieved_at == T0 + timedelta(seconds=0.1)
+
+
+def test_engine_missing_deadline_yields_partial_result() -> None:
+    fast = FakeEngine(delay=0.0, services=["netflix"], source_id="vod")
+    slow = FakeEngine(delay=5.0, services=["sling"], source_id="live")
+    orchestrator = AvailabilityOrchestrator([("vod", fast), ("live", slow)], deadline_seconds=0.05)
+
+    resp = _assess(orchestrator)
+
+    assert [a.service_id for a in resp.assessments] == ["netflix"]
+    assert slow.cancelled
+
+
+def test_all_engines_failing_raises() -> None:
+    failing = FakeEngine(delay=0.0, services=[], source_id="vod", fail=True)
+    slow = FakeEngine(delay=5.0, services=["sling"], source_id="live")
+
+    with pytest.raises(httpx.ConnectError):
+        _assess(AvailabilityOrchestrator([("vod", failing), ("live", slow)], deadline_seconds=0.05))
+
+    with pytest.raises(httpx.TimeoutException):
+        _assess(AvailabilityOrchestrator([("live", slow)], deadline_seconds=0.05))
+
+
+def test_evidence_free_results_are_valid_projections() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": 1, "results": {"US": {"flatrate": [{"provider_id": 8}]}}})
+
+    orchestrator = AvailabilityOrchestrator(
+        [("a", DefaultAvailabilityEngine()), ("b", DefaultAvailabilityEngine())], deadline_seconds=1.0
+    )
+
+    async def scenario() -> object:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await orchestrator.assess_tmdb_tv_watch_providers_v1(
+                series_id=1, country="US", api_key="k", client=client, include_evidence=False
+            )
+
+    resp = asyncio.run(scenario())
+    assert isinstance(resp, AvailabilityAssessmentsProjectionResponseV1)
+    (assessment,) = resp.assessments
+    assert assessment.evidence is None
+    assert assessment.reason_codes == ["TMDB_WATCH_PROVIDER_PRESENT", "SERVICE_ID_MAPPED"]
+    # Nothing relies on skipping validation: the result round-trips through its own model.
+    assert AvailabilityAssessmentsProjectionResponseV1.model_validate(resp.model_dump()) == resp
@@ -10,6 +10,10 @@ from jsonschema import validate
 
 from psma_api.deps import get_http_client
 from psma_api.main import app
+from psma_api.models.availability import (
+    AvailabilityAssessmentsProjectionResponseV1,
+    AvailabilityBatchProjectionResponseV1,
+)
 from psma_api.settings import settings
 
 
@@ -78,3 +82,201 @@ def test_availability_v1_facade_is_schema_valid() -> None:
     finally:
         app.dependency_overrides.clear()
         settings.tmdb_api_key = prior
+
+
+def test_availability_v1_batch_reports_per_series_results_and_errors() -> None:
+    prior = settings.tmdb_api_key
+    settings.tmdb_api_key = "test-key"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/3/tv/404/watch/providers":
+            return httpx.Response(404, json={"status_message": "not found"})
+        return httpx.Response(
+            200,
+            json={"id": 1, "results": {"US": {"flatrate": [{"provider_id": 8, "provider_name": "Netflix"}]}}},
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        client = TestClient(app)
+        resp = client.post(
+            "/availability/v1/tmdb/tv:batch",
+            json={"series_ids": [1396, 404, 1396, 66732], "country": "US"},
+        )
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert [r["series_id"] for r in results] == [1396, 404, 66732]
+        assert [r["status"] for r in results] == ["ok", "error", "ok"]
+        assert results[0]["assessments"][0]["service_id"] == "netflix"
+        assert results[1]["error"]["upstream_status"] == 404
+    finally:
+        app.dependency_overrides.clear()
+        settings.tmdb_api_key = prior
+
+
+def test_availability_v1_facade_multi_region_single_fetch() -> None:
+    prior = settings.tmdb_api_key
+    settings.tmdb_api_key = "test-key"
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(
+            200,
+            json={
+                "id": 1396,
+                "results": {
+                    "US": {"flatrate": [{"provider_id": 8, "provider_name": "Netflix"}]},
+                    "CA": {"flatrate": [{"provider_id": 8, "provider_name": "Netflix"}]},
+                    "GB": {"buy": [{"provider_id": 2, "provider_name": "Apple TV"}]},
+                },
+            },
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        client = TestClient(app)
+        resp = client.get("/availability/v1/tmdb/tv/1396", params={"country": "us, ca"})
+        assert resp.status_code == 200
+        assert [a["country"] for a in resp.json()["assessments"]] == ["CA", "US"]
+        assert calls["n"] == 1
+
+        resp = client.get("/availability/v1/tmdb/tv/1396", params={"country": "*"})
+        assert resp.status_code == 200
+        assert {a["country"] for a in resp.json()["assessments"]} == {"CA", "GB", "US"}
+        assert calls["n"] == 2
+    finally:
+        app.dependency_overrides.clear()
+        settings.tmdb_api_key = prior
+
+
+def test_availability_v1_diff_returns_only_changes_since_token() -> None:
+    prior = (settings.tmdb_api_key, settings.availability_cache_enabled)
+    settings.tmdb_api_key = "test-key"
+    settings.availability_cache_enabled = False
+    netflix = {"provider_id": 8, "provider_name": "Netflix"}
+    apple = {"provider_id": 350, "provider_name": "Apple TV+"}
+    upstream = {"US": {"flatrate": [netflix, apple]}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"id": 1396, "results": upstream})
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        with TestClient(app) as client:
+            first = client.get("/availability/v1/tmdb/tv/1396/diff").json()
+            assert first["full_resync"] is True
+            assert [a["service_id"] for a in first["added"]] == ["apple-tv-plus", "netflix"]
+
+            # Nothing changed (retrieved_at differs): empty delta, same token.
+            second = client.get("/availability/v1/tmdb/tv/1396/diff", params={"since": first["snapshot_token"]}).json()
+            assert second["full_resync"] is False
+            assert (second["added"], second["changed"], second["removed"]) == ([], [], [])
+            assert second["snapshot_token"] == first["snapshot_token"]
+
+            upstream["US"] = {"ads": [netflix]}
+            third = client.get("/availability/v1/tmdb/tv/1396/diff", params={"since": first["snapshot_token"]}).json()
+            assert [a["service_id"] for a in third["changed"]] == ["netflix"]
+            assert third["removed"] == [{"title_id": "tmdb:tv:1396", "country": "US", "service_id": "apple-tv-plus"}]
+            assert third["added"] == []
+
+            resync = client.get("/availability/v1/tmdb/tv/1396/diff", params={"since": "unknown"}).json()
+            assert resync["full_resync"] is True
+            assert [a["service_id"] for a in resync["added"]] == ["netflix"]
+
+            # A token from another series or region is unknown here, not a base to diff against.
+            token = resync["snapshot_token"]
+            other = client.get("/availability/v1/tmdb/tv/1399/diff", params={"since": token}).json()
+            assert other["full_resync"] is True
+            assert [a["service_id"] for a in other["added"]] == ["netflix"]
+            assert other["removed"] == []
+            other = client.get("/availability/v1/tmdb/tv/1396/diff", params={"since": token, "country": "US,CA"}).json()
+            assert other["full_resync"] is True
+    finally:
+        app.dependency_overrides.clear()
+        settings.tmdb_api_key, settings.availability_cache_enabled = prior
+
+
+def test_availability_v1_projection_skips_evidence() -> None:
+    prior = settings.tmdb_api_key
+    settings.tmdb_api_key = "test-key"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        series_id = int(request.url.path.split("/")[3])
+        return httpx.Response(
+            200,
+            json={"id": series_id, "results": {"US": {"flatrate": [{"provider_id": 8, "provider_name": "Netflix"}]}}},
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        client = TestClient(app)
+        resp = client.get(
+            "/availability/v1/tmdb/tv/1396",
+            params={"fields": "service_id,availability_now,confidence"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["assessments"] == [
+            {"service_id": "netflix", "availability_now": "true", "confidence": "medium"}
+        ]
+        AvailabilityAssessmentsProjectionResponseV1.model_validate(resp.json())
+
+        resp = client.get("/availability/v1/tmdb/tv/1396", params={"include_evidence": "false"})
+        assert resp.status_code == 200
+        (assessment,) = resp.json()["assessments"]
+        assert "evidence" not in assessment
+        assert assessment["reason_codes"] == ["TMDB_WATCH_PROVIDER_PRESENT", "SERVICE_ID_MAPPED"]
+        AvailabilityAssessmentsProjectionResponseV1.model_validate(resp.json())
+
+        # Asking for evidence while skipping it is contradictory.
+        resp = client.get(
+            "/availability/v1/tmdb/tv/1396",
+            params={"fields": "service_id,evidence", "include_evidence": "false"},
+        )
+        assert resp.status_code == 422
+
+        resp = client.get("/availability/v1/tmdb/tv/1396", params={"fields": "service_id,bogus"})
+        assert resp.status_code == 422
+
+        resp = client.post(
+            "/availability/v1/tmdb/tv:batch",
+            json={"series_ids": [1, 2], "fields": ["service_id"]},
+        )
+        assert resp.status_code == 200
+        assert [r["assessments"] for r in resp.json()["results"]] == [
+            [{"service_id": "netflix"}],
+            [{"service_id": "netflix"}],
+        ]
+        AvailabilityBatchProjectionResponseV1.model_validate(resp.json())
+
+        # The projected shape is part of the declared contract.
+        schema = app.openapi()["paths"]["/availability/v1/tmdb/tv/{series_id}"]["get"]["responses"]["200"]
+        refs = [s["$ref"] for s in schema["content"]["application/json"]["schema"]["anyOf"]]
+        assert refs[-1].endswith("/AvailabilityAssessmentsProjectionResponseV1")
+    finally:
+        app.dependency_overrides.clear()
+        settings.tmdb_api_key = prior
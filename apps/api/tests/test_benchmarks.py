@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from benchmarks import golden
+from benchmarks.bench_engines import BASELINE_PATH, compare, run
+from benchmarks.generators import planner_request, watch_providers_payload
+
+
+def test_golden_scenarios_match_the_documented_outcomes() -> None:
+    golden.check_all()
+
+
+def test_generators_are_seeded() -> None:
+    assert planner_request(titles=30, services=4, inputs=20, seed=3) == planner_request(
+        titles=30, services=4, inputs=20, seed=3
+    )
+    assert watch_providers_payload(regions=5, providers=8, seed=1) == watch_providers_payload(
+        regions=5, providers=8, seed=1
+    )
+    assert len(json.loads(watch_providers_payload(regions=5, providers=8))["results"]) == 5
+
+
+def test_quick_run_reports_every_metric_and_has_a_baseline() -> None:
+    results = asyncio.run(run(quick=True, only="golden"))
+    assert set(results) == {s.name for s in golden.scenarios()}
+    assert all(set(row) == {"ops_per_s", "p50_ms", "p99_ms", "peak_kib"} for row in results.values())
+
+    baseline = json.loads(BASELINE_PATH.read_text())
+    assert set(results) <= set(baseline)
+
+
+def test_compare_flags_slowdowns_and_memory_growth_beyond_tolerance() -> None:
+    baseline = {"a": {"p50_ms": 10.0, "peak_kib": 100.0}, "b": {"p50_ms": 10.0, "peak_kib": 100.0}}
+    results = {
+        "a": {"p50_ms": 14.0, "peak_kib": 110.0},
+        "b": {"p50_ms": 16.0, "peak_kib": 130.0},
+        "new": {"p50_ms": 1e6, "peak_kib": 1e6},
+    }
+    assert compare(results, baseline, tolerance=0.5, memory_tolerance=0.2) == [
+        "b: p50 16.000 ms > baseline 10.000 ms",
+        "b: peak 130.0 KiB > baseline 100.0 KiB",
+    ]
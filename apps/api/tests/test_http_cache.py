@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+
+from psma_api.transports.http_cache import CachingTransport, SqliteHttpCacheStorage, StoredResponse
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(handler, storage: SqliteHttpCacheStorage, clock: _Clock) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=CachingTransport(httpx.MockTransport(handler), storage, clock=clock))
+
+
+def test_max_age_is_served_from_cache_and_key_ignores_api_key(tmp_path: Path) -> None:
+    clock = _Clock()
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, headers={"Cache-Control": "max-age=60"}, json={"genres": []})
+
+    async def scenario() -> None:
+        path = tmp_path / "cache.sqlite3"
+        async with _client(handler, SqliteHttpCacheStorage(path), clock) as client:
+            r1 = await client.get("https://api.themoviedb.org/3/genre/tv/list", params={"api_key": "a"})
+            r2 = await client.get("https://api.themoviedb.org/3/genre/tv/list", params={"api_key": "b"})
+            assert r1.json() == r2.json() == {"genres": []}
+            assert len(calls) == 1
+
+        # Survives a restart (new storage on the same file).
+        async with _client(handler, SqliteHttpCacheStorage(path), clock) as client:
+            clock.now += 30
+            r3 = await client.get("https://api.themoviedb.org/3/genre/tv/list", params={"api_key": "a"})
+            assert r3.status_code == 200
+            assert int(r3.headers["age"]) >= 30
+            assert len(calls) == 1
+
+            clock.now += 60
+            await client.get("https://api.themoviedb.org/3/genre/tv/list", params={"api_key": "a"})
+            assert len(calls) == 2
+
+        # The credential never reaches disk.
+        assert b"api_key" not in path.read_bytes()
+
+    asyncio.run(scenario())
+
+
+def test_stale_entry_is_revalidated_with_etag() -> None:
+    clock = _Clock()
+    seen_inm: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_inm.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"', "Cache-Control": "max-age=10"})
+        return httpx.Response(200, headers={"ETag": '"v1"', "Cache-Control": "no-cache"}, json={"id": 1})
+
+    async def scenario() -> None:
+        async with _client(handler, SqliteHttpCacheStorage(":memory:"), clock) as client:
+            r1 = await client.get("https://api.tvmaze.com/shows/1")
+            r2 = await client.get("https://api.tvmaze.com/shows/1")
+            assert r1.json() == r2.json() == {"id": 1}
+            assert r2.status_code == 200
+            # 304 replaced Cache-Control with max-age=10: now fresh without a call.
+            r3 = await client.get("https://api.tvmaze.com/shows/1")
+            assert r3.json() == {"id": 1}
+
+    asyncio.run(scenario())
+    assert seen_inm == [None, '"v1"']
+
+
+def test_no_store_and_unvalidated_responses_are_not_cached() -> None:
+    clock = _Clock()
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if request.url.path == "/private":
+            return httpx.Response(200, headers={"Cache-Control": "no-store, max-age=60"}, json={})
+        return httpx.Response(200, json={})
+
+    async def scenario() -> None:
+        async with _client(handler, SqliteHttpCacheStorage(":memory:"), clock) as client:
+            for _ in range(2):
+                await client.get("https://api.tvmaze.com/private")
+                await client.get("https://api.tvmaze.com/plain")
+
+    asyncio.run(scenario())
+    assert calls["n"] == 4
+
+
+def test_storage_evicts_least_recently_used_beyond_its_bounds(tmp_path: Path) -> None:
+    clock = _Clock()
+
+    def stored(body: bytes) -> StoredResponse:
+        return StoredResponse(200, [], body, clock.now, clock.now, {})
+
+    path = tmp_path / "cache.sqlite3"
+    storage = SqliteHttpCacheStorage(path, max_entries=3, max_bytes=1_000, clock=clock)
+    for key in ("a", "b", "c"):
+        clock.now += 1
+        storage.set(key, stored(b"x" * 100))
+    clock.now += 1
+    assert storage.get("a") is not None  # "b" is now the least recently used
+
+    clock.now += 1
+    storage.set("d", stored(b"x" * 100))
+    assert [k for k in "abcd" if storage.get(k) is not None] == ["a", "c", "d"]
+
+    # The byte bound evicts too, oldest first.
+    clock.now += 1
+    storage.set("e", stored(b"x" * 850))
+    assert (len(storage), storage.nbytes) == (2, 950)
+    storage.close()
+
+    # Bounds (and the running totals) survive a restart.
+    reopened = SqliteHttpCacheStorage(path, max_entries=1, clock=clock)
+    assert (len(reopened), reopened.nbytes) == (1, 850)
+    assert reopened.get("e") is not None
+    reopened.close()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import httpx
+from fastapi.testclient import TestClient
+
+from psma_api.deps import get_http_client
+from psma_api.http_caching import etag_for
+from psma_api.main import app
+from psma_api.settings import settings
+
+
+def _override(handler) -> None:
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+
+
+def test_json_get_has_strong_etag_and_answers_if_none_match() -> None:
+    prior = settings.tmdb_api_key
+    settings.tmdb_api_key = "test-key"
+    upstream = {"US": {"flatrate": [{"provider_id": 8, "provider_name": "Netflix"}]}}
+    _override(lambda request: httpx.Response(200, json={"id": 1396, "results": upstream}))
+    try:
+        # The lifespan's availability cache keeps retrieved_at stable between hits.
+        with TestClient(app) as client:
+            resp = client.get("/availability/v1/tmdb/tv/1396")
+            assert resp.status_code == 200
+            etag = resp.headers["etag"]
+            assert etag == etag_for(resp.content)
+            assert not etag.startswith("W/")
+            assert resp.headers["cache-control"] == (
+                f"public, max-age={settings.response_max_age_availability_seconds}"
+            )
+
+            again = client.get("/availability/v1/tmdb/tv/1396", headers={"If-None-Match": f'"other", {etag}'})
+            assert again.status_code == 304
+            assert again.content == b""
+            assert again.headers["etag"] == etag
+
+            # Different representation -> different tag -> full response.
+            changed = client.get(
+                "/availability/v1/tmdb/tv/1396", params={"fields": "service_id"}, headers={"If-None-Match": etag}
+            )
+            assert changed.status_code == 200
+            assert changed.headers["etag"] != etag
+    finally:
+        app.dependency_overrides.clear()
+        settings.tmdb_api_key = prior
+
+
+def test_streamed_and_error_responses_are_untouched() -> None:
+    _override(lambda request: httpx.Response(200, json={"id": 1}))
+    try:
+        client = TestClient(app)
+        raw = client.get("/providers/tvmaze/shows/1", params={"raw": "true"}, headers={"If-None-Match": "*"})
+        assert raw.status_code == 200
+        assert "etag" not in raw.headers
+        assert raw.json()["data"] == {"id": 1}
+
+        _override(lambda request: httpx.Response(500, json={}))
+        failed = client.get("/providers/tvmaze/shows/1", headers={"If-None-Match": "*"})
+        assert failed.status_code == 502
+        assert "etag" not in failed.headers
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_plan_post_gets_etag_but_never_304() -> None:
+    client = TestClient(app)
+    body = {"country": "US", "assessments": []}
+    resp = client.post("/plan/v1/generate", json=body)
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == "private, no-cache"
+    assert "etag" in resp.headers
+
+    again = client.post("/plan/v1/generate", json=body, headers={"If-None-Match": "*"})
+    assert again.status_code == 200
+
+
+def test_unmatched_paths_are_not_decorated() -> None:
+    resp = TestClient(app).get("/health")
+    assert "etag" not in resp.headers
+    assert "cache-control" not in resp.headers
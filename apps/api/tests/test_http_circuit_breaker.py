@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+import time
+
+from fastapi.testclient import TestClient
+import httpx
+import pytest
+
+from psma_api.cache import StaleWhileRevalidateCache
+from psma_api.deps import get_http_client
+from psma_api.engines.availability_engine_cached import (
+    LAST_KNOWN_GOOD_REASON_CODE,
+    CachedAvailabilityEngine,
+    UpstreamStatus,
+)
+from psma_api.main import app
+from psma_api.models.availability import AvailabilityAssessmentV1, AvailabilityAssessmentsResponseV1
+from psma_api.settings import settings
+from psma_api.transports.circuit_breaker import CircuitBreakerTransport, CircuitOpenError
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_opens_fails_fast_and_closes_after_probe() -> None:
+    clock = _Clock()
+    state = {"healthy": False, "calls": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["calls"] += 1
+        if not state["healthy"]:
+            raise httpx.ConnectTimeout("timed out", request=request)
+        return httpx.Response(200, json={})
+
+    transport = CircuitBreakerTransport(
+        httpx.MockTransport(handler),
+        failure_ratio=0.5,
+        window=4,
+        min_calls=4,
+        open_seconds=30,
+        clock=clock,
+    )
+
+    async def scenario() -> None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(4):
+                with pytest.raises(httpx.ConnectTimeout):
+                    await client.get("https://api.themoviedb.org/3/x")
+            assert transport.circuit_for("api.themoviedb.org").state == "open"
+
+            with pytest.raises(CircuitOpenError):
+                await client.get("https://api.themoviedb.org/3/x")
+            assert state["calls"] == 4
+
+            # Other hosts are unaffected.
+            state["healthy"] = True
+            assert (await client.get("https://api.tvmaze.com/shows/1")).status_code == 200
+
+            clock.now = 31
+            assert transport.circuit_for("api.themoviedb.org").state == "half_open"
+            assert (await client.get("https://api.themoviedb.org/3/x")).status_code == 200
+            assert transport.circuit_for("api.themoviedb.org").state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_cached_engine_serves_last_known_good_while_circuit_open() -> None:
+    clock = _Clock()
+    cache: StaleWhileRevalidateCache = StaleWhileRevalidateCache(ttl_seconds=10, stale_seconds=0, clock=clock)
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    class FlakyEngine:
+        fail = False
+
+        async def assess_tmdb_tv_watch_providers_v1(self, **kwargs) -> AvailabilityAssessmentsResponseV1:
+            if self.fail:
+                raise CircuitOpenError("open")
+            return AvailabilityAssessmentsResponseV1(
+                retrieved_at=now,
+                assessments=[
+                    AvailabilityAssessmentV1(
+                        title_id="tmdb:tv:1396",
+                        country="US",
+                        service_id="netflix",
+                        provider_category="svod",
+                        availability_now="true",
+                        confidence="medium",
+                        reason_codes=["TMDB_WATCH_PROVIDER_PRESENT"],
+                        evidence=[{"source_id": "tmdb_watch_providers", "retrieved_at": now}],
+                    )
+                ],
+            )
+
+    inner = FlakyEngine()
+    engine = CachedAvailabilityEngine(inner, cache)
+    kwargs = {"series_id": 1396, "country": "US", "api_key": "k", "client": None}
+
+    async def scenario() -> AvailabilityAssessmentsResponseV1:
+        await engine.assess_tmdb_tv_watch_providers_v1(**kwargs)
+        inner.fail = True
+        clock.now = 100
+        return await engine.assess_tmdb_tv_watch_providers_v1(**kwargs)
+
+    resp = asyncio.run(scenario())
+    assert resp.retrieved_at == now
+    assert resp.assessments[0].confidence == "low"
+    assert LAST_KNOWN_GOOD_REASON_CODE in resp.assessments[0].reason_codes
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(engine.assess_tmdb_tv_watch_providers_v1(**{**kwargs, "series_id": 1}))
+
+
+def test_cached_engine_downgrades_stale_window_hits_after_a_failed_refresh() -> None:
+    clock = _Clock()
+    cache: StaleWhileRevalidateCache = StaleWhileRevalidateCache(ttl_seconds=10, stale_seconds=3600, clock=clock)
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    class FlakyEngine:
+        fail = False
+
+        async def assess_tmdb_tv_watch_providers_v1(self, **kwargs) -> AvailabilityAssessmentsResponseV1:
+            if self.fail:
+                raise CircuitOpenError("open")
+            return AvailabilityAssessmentsResponseV1(
+                retrieved_at=now,
+                assessments=[
+                    AvailabilityAssessmentV1(
+                        title_id="tmdb:tv:1396",
+                        country="US",
+                        service_id="netflix",
+                        provider_category="svod",
+                        availability_now="true",
+                        confidence="medium",
+                        reason_codes=["TMDB_WATCH_PROVIDER_PRESENT"],
+                        evidence=[{"source_id": "tmdb_watch_providers", "retrieved_at": now}],
+                    )
+                ],
+            )
+
+    inner = FlakyEngine()
+    upstream = UpstreamStatus(unavailable_seconds=30, clock=clock)
+    kwargs = {"series_id": 1396, "country": "US", "api_key": "k", "client": None}
+
+    class PerCallEngine:
+        # Routes build a new engine per request; only the cache and status are shared.
+        async def assess_tmdb_tv_watch_providers_v1(self, **kwargs) -> AvailabilityAssessmentsResponseV1:
+            cached = CachedAvailabilityEngine(inner, cache, upstream=upstream)
+            return await cached.assess_tmdb_tv_watch_providers_v1(**kwargs)
+
+    engine = PerCallEngine()
+
+    async def settle() -> None:
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+    async def scenario() -> list[str]:
+        confidences = []
+        await engine.assess_tmdb_tv_watch_providers_v1(**kwargs)
+        inner.fail = True
+        # Stale window: served at once while the background refresh hits the open circuit.
+        clock.now = 20
+        for _ in range(2):
+            resp = await engine.assess_tmdb_tv_watch_providers_v1(**kwargs)
+            confidences.append(resp.assessments[0].confidence)
+            await settle()
+        assert upstream.unavailable
+
+        # A successful refresh closes it again.
+        inner.fail = False
+        await engine.assess_tmdb_tv_watch_providers_v1(**kwargs)
+        await settle()
+        resp = await engine.assess_tmdb_tv_watch_providers_v1(**kwargs)
+        confidences.append(resp.assessments[0].confidence)
+        return confidences
+
+    # The first hit only learns about the outage through its refresh; later hits are downgraded.
+    assert asyncio.run(scenario()) == ["medium", "low", "medium"]
+    assert not upstream.unavailable
+
+
+def test_app_downgrades_stale_hits_after_a_failed_background_refresh() -> None:
+    prior = (
+        settings.tmdb_api_key,
+        settings.availability_cache_enabled,
+        settings.availability_cache_ttl_seconds,
+        settings.availability_cache_stale_seconds,
+    )
+    settings.tmdb_api_key = "test-key"
+    settings.availability_cache_enabled = True
+    # Every hit after the first is in the stale window and triggers a background refresh.
+    settings.availability_cache_ttl_seconds = 0
+    settings.availability_cache_stale_seconds = 3600
+    circuit_open = [False]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if circuit_open[0]:
+            raise CircuitOpenError("open", request=request)
+        return httpx.Response(200, json={"id": 1396, "results": {"US": {"flatrate": [{"provider_id": 8}]}}})
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    def confidence(client: TestClient) -> str:
+        resp = client.get("/availability/v1/tmdb/tv/1396", params={"country": "US"})
+        assert resp.status_code == 200
+        # Give the background refresh a moment to run on the app's loop.
+        time.sleep(0.05)
+        return resp.json()["assessments"][0]["confidence"]
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        with TestClient(app) as client:
+            assert confidence(client) == "medium"
+            circuit_open[0] = True
+            # This request's own refresh is the first to hit the open circuit...
+            assert confidence(client) == "medium"
+            # ...and the next request, with a new engine, serves the stale entry downgraded.
+            assert confidence(client) == "low"
+            circuit_open[0] = False
+            confidence(client)
+            assert confidence(client) == "medium"
+    finally:
+        app.dependency_overrides.clear()
+        (
+            settings.tmdb_api_key,
+            settings.availability_cache_enabled,
+            settings.availability_cache_ttl_seconds,
+            settings.availability_cache_stale_seconds,
+        ) = prior
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from psma_api.deps import build_http_client
+
+
+def test_concurrent_identical_gets_share_one_upstream_call() -> None:
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"id": 1396})
+
+    async def scenario() -> list[httpx.Response]:
+        async with build_http_client(transport=httpx.MockTransport(handler)) as client:
+            same = [client.get("https://api.tvmaze.com/shows/1", params={"embed": "episodes"}) for _ in range(10)]
+            other = client.get("https://api.tvmaze.com/shows/2")
+            return await asyncio.gather(*same, other)
+
+    responses = asyncio.run(scenario())
+    assert len(calls) == 2
+    assert all(r.status_code == 200 and r.json() == {"id": 1396} for r in responses)
+
+
+def test_errors_are_shared_and_next_call_goes_upstream() -> None:
+    calls = {"n": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectError("boom", request=request)
+
+    async def scenario() -> list[object]:
+        async with build_http_client(transport=httpx.MockTransport(handler)) as client:
+            first = await asyncio.gather(
+                *[client.get("https://api.tvmaze.com/shows/1") for _ in range(3)],
+                return_exceptions=True,
+            )
+            second = await asyncio.gather(client.get("https://api.tvmaze.com/shows/1"), return_exceptions=True)
+            return first + second
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, httpx.ConnectError) for r in results)
+    assert calls["n"] == 2
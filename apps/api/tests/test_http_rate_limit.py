@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+
+from psma_api.transports.rate_limit import RateLimitTransport, parse_rate, parse_retry_after
+
+
+def _transport(handler, **overrides) -> RateLimitTransport:
+    options = {
+        "rates": {"api.tvmaze.com": "2/0.1"},
+        "max_concurrency": 4,
+        "max_retries": 2,
+        "max_retry_wait_seconds": 1.0,
+    }
+    options.update(overrides)
+    return RateLimitTransport(httpx.MockTransport(handler), **options)
+
+
+def test_parse_helpers() -> None:
+    assert parse_rate("20/10") == (2.0, 20)
+    assert parse_rate("40") == (40.0, 40)
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470.0) == 10.0
+    assert parse_retry_after("soon") is None
+
+
+def test_requests_queue_for_tokens_instead_of_bursting() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    async def scenario() -> float:
+        async with httpx.AsyncClient(transport=_transport(handler)) as client:
+            start = time.perf_counter()
+            await asyncio.gather(*[client.get(f"https://api.tvmaze.com/shows/{i}") for i in range(6)])
+            return time.perf_counter() - start
+
+    # Burst of 2, then 20 tokens/s: the remaining 4 need ~0.2s.
+    assert asyncio.run(scenario()) >= 0.15
+
+
+def test_429_honours_retry_after_and_shrinks_concurrency() -> None:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"ok": True})
+
+    transport = _transport(handler)
+
+    async def scenario() -> httpx.Response:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get("https://api.tvmaze.com/shows/1")
+
+    resp = asyncio.run(scenario())
+    assert resp.status_code == 200
+    assert calls["n"] == 2
+    limiter = transport.limiter_for("api.tvmaze.com")
+    assert limiter is not None and limiter.concurrency_limit < 4
+
+
+def test_429_is_returned_when_retry_after_exceeds_budget() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    async def scenario() -> httpx.Response:
+        async with httpx.AsyncClient(transport=_transport(handler)) as client:
+            return await client.get("https://api.tvmaze.com/shows/1")
+
+    assert asyncio.run(scenario()).status_code == 429
+
+
+def test_unconfigured_hosts_pass_through() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200)
+
+    transport = _transport(handler)
+    assert transport.limiter_for("example.com") is None
+
+
+def test_cancelled_and_failed_calls_free_their_slots() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/slow":
+            await asyncio.sleep(10)
+        if request.url.path == "/broken":
+            raise httpx.RemoteProtocolError("peer closed connection", request=request)
+        return httpx.Response(200, json={})
+
+    transport = _transport(handler, rates={"api.tvmaze.com": "100/1"}, max_concurrency=2)
+    limiter = transport.limiter_for("api.tvmaze.com")
+    assert limiter is not None
+
+    async def scenario() -> int:
+        async with httpx.AsyncClient(transport=transport) as client:
+            slow = [asyncio.ensure_future(client.get("https://api.tvmaze.com/slow")) for _ in range(2)]
+            while limiter.in_flight < 2:
+                await asyncio.sleep(0.01)
+            for task in slow:
+                task.cancel()
+            await asyncio.gather(*slow, return_exceptions=True)
+            assert limiter.in_flight == 0
+            assert limiter.concurrency_limit == 2  # cancellation says nothing about the upstream
+
+            try:
+                await client.get("https://api.tvmaze.com/broken")
+            except httpx.RemoteProtocolError:
+                pass
+            assert limiter.in_flight == 0
+            assert limiter.concurrency_limit == 1
+
+            resp = await asyncio.wait_for(client.get("https://api.tvmaze.com/shows/1"), timeout=1.0)
+            return resp.status_code
+
+    assert asyncio.run(scenario()) == 200
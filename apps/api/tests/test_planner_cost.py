@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import itertools
+import random
+import time
+
+from psma_api.engines.planner_cost import assign_min_cost
+from psma_api.engines.planner_delta import PlanState, plan_delta
+from psma_api.engines.planner_v1 import PlannerPolicy, plan_v1
+from psma_api.models.planning import PlanDeltaRequestV1, PlanRequestV1
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_DAY = 86400.0
+
+
+def _assessment(title_id: str, service_id: str, *, confidence: str = "high", starts_in_days: int | None = None) -> dict:
+    a: dict = {
+        "title_id": title_id,
+        "country": "US",
+        "service_id": service_id,
+        "provider_category": "svod",
+        "availability_now": "true" if starts_in_days is None else "false",
+        "confidence": confidence,
+        "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+        "evidence": [{"source_id": "tmdb_watch_providers", "retrieved_at": "2026-01-01T00:00:00Z"}],
+    }
+    if starts_in_days is not None:
+        a["availability_window"] = {"start": (NOW + timedelta(days=starts_in_days)).isoformat()}
+    return a
+
+
+def _request(assessments: list[dict], prices: dict[str, float], **extra: object) -> PlanRequestV1:
+    services = sorted({a["service_id"] for a in assessments})
+    inputs = [{"key": "plan_objective", "value": "min_cost"}]
+    for service_id in services:
+        inputs += [
+            {"key": "min_contract_days", "service_id": service_id, "value": 30},
+            {"key": "estimated_watch_days", "service_id": service_id, "value": 10},
+        ]
+    inputs += [{"key": "monthly_price", "service_id": s, "value": p} for s, p in prices.items()]
+    return PlanRequestV1.model_validate(
+        {"country": "US", "horizon_days": 180, "assessments": assessments, "inputs": inputs, **extra}
+    )
+
+
+def _subscribed(request: PlanRequestV1) -> dict[str, list[str]]:
+    resp = plan_v1(request, now=NOW)
+    out: dict[str, list[str]] = {}
+    for e in resp.events:
+        if e.action == "subscribe":
+            out.setdefault(e.service_id, []).extend(e.title_ids)
+    return out
+
+
+def test_min_cost_picks_one_service_per_title_and_consolidates() -> None:
+    # "a" is on both; "b" only on netflix. Netflix alone covers everything.
+    request = _request(
+        [_assessment("a", "hulu"), _assessment("a", "netflix"), _assessment("b", "netflix")],
+        {"hulu": 5, "netflix": 10},
+    )
+    assert _subscribed(request) == {"netflix": ["a", "b"]}
+    subscribe = next(e for e in plan_v1(request, now=NOW).events if e.action == "subscribe")
+    assert {"service_chosen_by_min_cost", "alternative_services_available"} <= set(subscribe.assumptions or [])
+
+    # Without the objective, every service carrying a title is planned.
+    default = request.model_copy(update={"inputs": request.inputs[1:]})
+    assert sorted(_subscribed(default)) == ["hulu", "netflix"]
+
+
+def test_min_cost_skips_titles_on_permanent_services_and_asks_for_missing_prices() -> None:
+    request = _request(
+        [
+            _assessment("a", "youtube_tv"),
+            _assessment("a", "netflix"),
+            _assessment("b", "max", confidence="low"),
+            _assessment("b", "peacock", confidence="high"),
+        ],
+        {"netflix": 10},
+        permanent_service_ids=["youtube_tv"],
+    )
+    resp = plan_v1(request, now=NOW)
+    # "a" is already covered; "b" has no priced option, so the ADR-0004 tie-breaker picks peacock.
+    assert {e.service_id for e in resp.events} == {"peacock"}
+    price_questions = {q.service_id: q.required for q in resp.questions or [] if q.key == "monthly_price"}
+    assert price_questions == {"max": False, "peacock": False}
+
+
+def test_exact_solver_matches_brute_force() -> None:
+    rng = random.Random(7)
+    services = ["s0", "s1", "s2", "s3"]
+    prices = {s: rng.choice([4.0, 7.0, 9.0, 12.0]) for s in services}
+    candidates = {
+        f"t{i}": [(s, (rng.choice([0, 20, 45, 90]) * _DAY, None)) for s in sorted(rng.sample(services, rng.randint(1, 3)))]
+        for i in range(7)
+    }
+
+    def service_cost(service_id: str, spans: frozenset) -> float:
+        return prices[service_id] * len(spans)
+
+    def total(assignment: dict[str, str]) -> float:
+        loads: dict[str, set] = {}
+        for t, s in assignment.items():
+            loads.setdefault(s, set()).add(dict(candidates[t])[s])
+        return sum(service_cost(s, frozenset(spans)) for s, spans in loads.items())
+
+    exact, was_exact = assign_min_cost(candidates, service_cost, exact_max_assignments=10_000, max_evaluations=10_000)
+    titles = sorted(candidates)
+    brute = min(
+        total(dict(zip(titles, combo)))
+        for combo in itertools.product(*([s for s, _ in candidates[t]] for t in titles))
+    )
+    assert was_exact and total(exact) == brute
+
+    greedy, was_exact = assign_min_cost(candidates, service_cost, exact_max_assignments=1, max_evaluations=10_000)
+    assert not was_exact and total(greedy) >= brute
+    assert sorted(greedy) == titles
+
+
+def test_min_cost_is_deterministic_and_fast_for_large_households() -> None:
+    rng = random.Random(42)
+    services = [f"service-{i:02d}" for i in range(40)]
+    assessments = [
+        _assessment(f"tmdb:tv:{t}", s, starts_in_days=rng.choice([None, None, 15, 40, 75, 120]))
+        for t in range(400)
+        for s in rng.sample(services, rng.randint(1, 5))
+    ]
+    request = _request(assessments, {s: float(rng.randint(5, 20)) for s in services})
+
+    started = time.perf_counter()
+    first = plan_v1(request, now=NOW)
+    elapsed = time.perf_counter() - started
+
+    assert first == plan_v1(request, now=NOW)
+    assert elapsed < 2.0
+    covered = [t for e in first.events if e.action == "subscribe" for t in e.title_ids]
+    assert sorted(set(covered)) == sorted({a["title_id"] for a in assessments})
+    assert any("min_cost_heuristic_used" in (e.assumptions or []) for e in first.events)
+
+
+def test_delta_replans_every_service_in_min_cost_mode() -> None:
+    request = _request(
+        [_assessment("a", "hulu"), _assessment("a", "netflix"), _assessment("b", "netflix")],
+        {"hulu": 5, "netflix": 10},
+    )
+    base = PlanState.from_request(request, now=NOW)
+    # Only netflix's assessment changes, but "a" is now cheaper on hulu.
+    delta = PlanDeltaRequestV1.model_validate(
+        {"plan_token": "t0", "remove_assessments": [{"title_id": "b", "country": "US", "service_id": "netflix"}]}
+    )
+    state, resp = plan_delta(base, delta, token="t1", base_token="t0")
+    assert resp.affected_service_ids == ["hulu", "netflix"]
+    assert {(e.service_id, tuple(e.title_ids)) for e in resp.events_added if e.action == "subscribe"} == {
+        ("hulu", ("a",))
+    }
+    assert {(e.service_id, tuple(e.title_ids)) for e in resp.events_removed if e.action == "subscribe"} == {
+        ("netflix", ("a", "b"))
+    }
+
+    policy = PlannerPolicy()
+    full = plan_v1(
+        request.model_copy(update={"assessments": request.assessments[:2]}), now=NOW, policy=policy
+    )
+    replanned = [e for s in sorted(state.services) for e in state.plan_service(s, policy=policy)[0]]
+    assert replanned == full.events
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+from psma_api.cache import SizedLRUCache
+from psma_api.engines.planner_engine_cached import CachedPlannerEngine, plan_request_key, quantize_now
+from psma_api.engines.planner_engine_impl import DefaultPlannerEngine
+from psma_api.models.planning import PlanRequestV1, PlanResponseV1
+
+
+NOW = datetime(2026, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+
+
+def _request(*, reverse: bool = False, retrieved_at: str = "2026-01-01T00:00:00Z") -> PlanRequestV1:
+    assessments = [
+        {
+            "title_id": f"tmdb:tv:{i}",
+            "country": "US",
+            "service_id": service_id,
+            "provider_category": "svod",
+            "availability_now": "true",
+            "confidence": "high",
+            "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+            "evidence": [{"source_id": "tmdb_watch_providers", "retrieved_at": retrieved_at}],
+        }
+        for i, service_id in enumerate(["netflix", "hulu", "max"])
+    ]
+    inputs = [
+        {"key": "min_contract_days", "service_id": "netflix", "value": 7, "source_id": "ui"},
+        {"key": "min_contract_days", "service_id": "netflix", "value": 30, "source_id": "ui"},
+        {"key": "estimated_watch_days", "title_ids": ["tmdb:tv:0"], "value": 10},
+    ]
+    if reverse:
+        assessments.reverse()
+        # Same effective inputs: the superseded one stays first.
+        inputs = [inputs[0], inputs[2], {**inputs[1], "source_id": "import"}]
+    return PlanRequestV1.model_validate(
+        {"country": "US", "horizon_days": 60, "assessments": assessments, "inputs": inputs}
+    )
+
+
+def test_key_ignores_order_provenance_and_evidence_timestamps() -> None:
+    key = plan_request_key(_request(), now=NOW)
+    assert plan_request_key(_request(reverse=True, retrieved_at="2026-02-01T00:00:00Z"), now=NOW) == key
+
+    changed = _request()
+    changed.inputs[1].value = 31
+    assert plan_request_key(changed, now=NOW) != key
+    assert plan_request_key(_request(), now=NOW.replace(minute=1)) != key
+
+
+def test_quantize_now() -> None:
+    assert quantize_now(NOW, granularity_seconds=60) == datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert quantize_now(NOW, granularity_seconds=0) == NOW
+
+
+def test_repeat_plans_are_served_from_cache() -> None:
+    calls: list[datetime | None] = []
+
+    class CountingEngine(DefaultPlannerEngine):
+        async def generate_plan_v1(
+            self, request: PlanRequestV1, *, now: datetime | None = None, request_json: bytes | None = None
+        ) -> PlanResponseV1:
+            calls.append(now)
+            return await super().generate_plan_v1(request, now=now)
+
+    cache: SizedLRUCache[str, PlanResponseV1] = SizedLRUCache(max_entries=10)
+    engine = CachedPlannerEngine(CountingEngine(), cache, now_granularity_seconds=60)
+
+    async def scenario() -> None:
+        first = await engine.generate_plan_v1(_request(), now=NOW)
+        again = await engine.generate_plan_v1(_request(reverse=True), now=NOW.replace(second=59))
+        assert again is first
+        assert first.generated_at == datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        await engine.generate_plan_v1(_request(), now=NOW.replace(minute=1))
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+    assert len(cache) == 2
+
+
+def test_min_cost_plans_are_keyed_on_evidence_freshness() -> None:
+    def request(fresher: str) -> PlanRequestV1:
+        assessments = [
+            {
+                "title_id": "tmdb:tv:1",
+                "country": "US",
+                "service_id": service_id,
+                "provider_category": "svod",
+                "availability_now": "true",
+                "confidence": "high",
+                "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+                "evidence": [
+                    {
+                        "source_id": "tmdb_watch_providers",
+                        "retrieved_at": "2026-01-01T00:00:00Z" if service_id == fresher else "2025-12-01T00:00:00Z",
+                    }
+                ],
+            }
+            for service_id in ("svc-a", "svc-b")
+        ]
+        inputs = [{"key": "plan_objective", "value": "min_cost"}]
+        return PlanRequestV1.model_validate(
+            {"country": "US", "horizon_days": 60, "assessments": assessments, "inputs": inputs}
+        )
+
+    assert plan_request_key(request("svc-a"), now=NOW) != plan_request_key(request("svc-b"), now=NOW)
+
+    cache: SizedLRUCache[str, PlanResponseV1] = SizedLRUCache(max_entries=10)
+    engine = CachedPlannerEngine(DefaultPlannerEngine(), cache)
+
+    async def scenario() -> list[set[str]]:
+        plans = [await engine.generate_plan_v1(request(fresher), now=NOW) for fresher in ("svc-a", "svc-b")]
+        return [{e.service_id for e in plan.events} for plan in plans]
+
+    assert asyncio.run(scenario()) == [{"svc-a"}, {"svc-b"}]
+
+
+def test_sized_lru_evicts_by_bytes_and_entries() -> None:
+    cache: SizedLRUCache[str, str] = SizedLRUCache(max_entries=3, max_bytes=100)
+    cache.set("a", "a", size=40)
+    cache.set("b", "b", size=40)
+    assert cache.get("a") == "a"  # "b" is now least recently used
+    cache.set("c", "c", size=40)
+    assert cache.get("b") is None
+    assert cache.nbytes == 80
+
+    cache.set("huge", "x", size=101)
+    assert cache.get("huge") is None
+    cache.set("d", "d", size=1)
+    cache.set("e", "e", size=1)
+    assert len(cache) == 3
+    assert cache.get("a") is None
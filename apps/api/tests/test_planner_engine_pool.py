@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+import multiprocessing
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from psma_api.deps import get_planner_engine
+from psma_api.engines.planner_engine_impl import DefaultPlannerEngine
+from psma_api.engines.planner_engine_pool import ProcessPoolPlannerEngine
+from psma_api.engines.planner_v1 import plan_v1
+from psma_api.main import app
+from psma_api.models.planning import PlanRequestV1, PlanResponseV1
+
+
+def _request(n: int) -> PlanRequestV1:
+    return PlanRequestV1.model_validate(
+        {
+            "country": "US",
+            "horizon_days": 60,
+            "inputs": [
+                {"key": "min_contract_days", "service_id": "service-1", "value": 30},
+                {"key": "estimated_watch_days", "service_id": "service-1", "value": 10},
+            ],
+            "assessments": [
+                {
+                    "title_id": f"tmdb:tv:{i}",
+                    "country": "US",
+                    "service_id": f"service-{i % 5}",
+                    "provider_category": "svod",
+                    "availability_now": "true",
+                    "confidence": "high",
+                    "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+                    "evidence": [{"source_id": "tmdb_watch_providers", "retrieved_at": "2026-01-01T00:00:00Z"}],
+                }
+                for i in range(n)
+            ],
+        }
+    )
+
+
+def test_core_is_deterministic_for_a_given_now() -> None:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    request = _request(20)
+    assert plan_v1(request, now=now) == plan_v1(request, now=now)
+
+
+def test_large_requests_run_in_the_pool_and_match_inline() -> None:
+    request = _request(50)
+    pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        pooled = asyncio.run(ProcessPoolPlannerEngine(pool, min_items=10).generate_plan_v1(request))
+    finally:
+        pool.shutdown()
+    inline = plan_v1(request, now=pooled.generated_at)
+    assert pooled == inline
+    assert {e.action for e in pooled.events} == {"subscribe", "unsubscribe"}
+
+
+def test_small_requests_never_touch_the_pool() -> None:
+    class ExplodingExecutor(ProcessPoolExecutor):
+        def submit(self, *args, **kwargs):  # type: ignore[override]
+            raise AssertionError("small plans must stay inline")
+
+    engine = ProcessPoolPlannerEngine(ExplodingExecutor(max_workers=1), min_items=1000)
+    resp = asyncio.run(engine.generate_plan_v1(_request(3)))
+    assert [e.service_id for e in resp.events if e.action == "subscribe"] == ["service-0", "service-1", "service-2"]
+
+
+def test_get_planner_engine_selects_pool_from_app_state() -> None:
+    pool = ProcessPoolExecutor(max_workers=1)
+    try:
+        with_pool = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(planner_pool=pool)))
+        without_pool = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+        assert isinstance(get_planner_engine(with_pool), ProcessPoolPlannerEngine)  # type: ignore[arg-type]
+        assert isinstance(get_planner_engine(without_pool), DefaultPlannerEngine)  # type: ignore[arg-type]
+    finally:
+        pool.shutdown()
+
+
+def test_pool_ships_the_received_body_instead_of_re_dumping() -> None:
+    request = _request(50)
+    body = request.model_dump_json(indent=2).encode()
+    shipped: list[bytes] = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):  # type: ignore[override]
+            shipped.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    executor = RecordingExecutor(max_workers=1)
+    try:
+        engine = ProcessPoolPlannerEngine(executor, min_items=10)
+        asyncio.run(engine.generate_plan_v1(request, request_json=body))
+    finally:
+        executor.shutdown()
+    assert shipped == [body]
+
+
+def test_generate_route_passes_the_request_body_to_the_engine() -> None:
+    body = _request(3).model_dump_json().encode()
+    received: list[bytes | None] = []
+
+    class RecordingEngine(DefaultPlannerEngine):
+        async def generate_plan_v1(
+            self, request: PlanRequestV1, *, now: datetime | None = None, request_json: bytes | None = None
+        ) -> PlanResponseV1:
+            received.append(request_json)
+            return await super().generate_plan_v1(request, now=now)
+
+    app.dependency_overrides[get_planner_engine] = RecordingEngine
+    try:
+        resp = TestClient(app).post("/plan/v1/generate", content=body, headers={"content-type": "application/json"})
+    finally:
+        app.dependency_overrides.clear()
+    assert resp.status_code == 200
+    assert received == [body]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+import json
+import multiprocessing
+
+from fastapi.testclient import TestClient
+
+from psma_api.engines.planner_bulk import ndjson_records, stream_bulk_plans
+from psma_api.engines.planner_v1 import plan_v1
+from psma_api.main import app
+from psma_api.models.planning import PlanRequestV1
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _household(service_id: str) -> dict:
+    return {
+        "country": "US",
+        "horizon_days": 60,
+        "inputs": [
+            {"key": "min_contract_days", "service_id": service_id, "value": 30},
+            {"key": "estimated_watch_days", "service_id": service_id, "value": 10},
+        ],
+        "assessments": [
+            {
+                "title_id": "tmdb:tv:1",
+                "country": "US",
+                "service_id": service_id,
+                "provider_category": "svod",
+                "availability_now": "true",
+                "confidence": "high",
+                "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+                "evidence": [{"source_id": "tmdb_watch_providers", "retrieved_at": "2026-01-01T00:00:00Z"}],
+            }
+        ],
+    }
+
+
+def _body(*records: object) -> bytes:
+    return b"".join(
+        (r if isinstance(r, bytes) else json.dumps(r).encode()) + b"\n" for r in records
+    )
+
+
+async def _chunks(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+def _collect(body: bytes, *, executor: ProcessPoolExecutor | None, chunk_size: int = 7) -> list[dict]:
+    async def run() -> list[dict]:
+        lines = stream_bulk_plans(
+            ndjson_records(_chunks(body, chunk_size)), now=NOW, executor=executor, max_in_flight=2
+        )
+        return [json.loads(line) async for line in lines]
+
+    return asyncio.run(run())
+
+
+def test_records_split_across_chunks_and_skip_blank_lines() -> None:
+    body = b'{"a":1}\n\n  \n{"b":2}'
+
+    async def run() -> list[tuple[int, bytes]]:
+        return [r async for r in ndjson_records(_chunks(body, 3))]
+
+    assert asyncio.run(run()) == [(1, b'{"a":1}'), (4, b'{"b":2}')]
+
+
+def test_bulk_without_pool_reports_plans_and_errors_per_line() -> None:
+    out = _collect(_body(_household("netflix"), b"{not json", _household("hulu")), executor=None)
+    assert out[-1] == {"type": "summary", "plans": 2, "errors": 1}
+    by_line = {o["line"]: o for o in out[:-1]}
+    assert {n: o["type"] for n, o in by_line.items()} == {1: "plan", 2: "error", 3: "plan"}
+
+    expected = plan_v1(PlanRequestV1.model_validate(_household("netflix")), now=NOW)
+    assert by_line[1]["plan"] == json.loads(expected.model_dump_json(exclude_none=True))
+
+
+def test_bulk_in_pool_matches_inline() -> None:
+    body = _body(*(_household(f"service-{i}") for i in range(6)), {"country": "US"})
+    pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        pooled = _collect(body, executor=pool)
+    finally:
+        pool.shutdown()
+    threaded = _collect(body, executor=None)
+
+    def by_line(out: list[dict]) -> dict[int, dict]:
+        return {o["line"]: o for o in out if o["type"] != "summary"}
+
+    assert by_line(pooled) == by_line(threaded)
+    assert pooled[-1] == {"type": "summary", "plans": 6, "errors": 1}
+
+
+def test_bulk_route_streams_ndjson() -> None:
+    client = TestClient(app)
+    r = client.post(
+        "/plan/v1/generate:bulk",
+        content=_body(_household("netflix"), {"country": "US"}),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    out = [json.loads(line) for line in r.text.splitlines()]
+    assert out[-1] == {"type": "summary", "plans": 1, "errors": 1}
+    plan, error = sorted(out[:-1], key=lambda o: o["line"])
+    assert error["type"] == "error" and error["line"] == 2 and error["errors"]
+    assert any(e["action"] == "subscribe" and e["service_id"] == "netflix" for e in plan["plan"]["events"])
+
+
+def test_bulk_route_plans_records_before_the_body_ends() -> None:
+    # TestClient hands the app the whole body at once, so drive the ASGI app
+    # directly: the second chunk is only delivered once the first plan is out.
+    first, second = _body(_household("netflix")), _body(_household("hulu"))
+    sent: list[dict] = []
+    first_line = asyncio.Event()
+    messages = [
+        {"type": "http.request", "body": first, "more_body": True},
+        {"type": "http.request", "body": second, "more_body": False},
+    ]
+
+    async def receive() -> dict:
+        if len(messages) == 1:
+            await first_line.wait()
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+        if message.get("body"):
+            first_line.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/plan/v1/generate:bulk",
+        "raw_path": b"/plan/v1/generate:bulk",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/x-ndjson")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+        "app": app,
+    }
+    asyncio.run(asyncio.wait_for(app(scope, receive, send), timeout=30))
+
+    body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    out = [json.loads(line) for line in body.splitlines()]
+    assert [(o["type"], o.get("line")) for o in out] == [("plan", 1), ("plan", 2), ("summary", None)]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from psma_api.engines.planner_delta import PlanState, plan_delta
+from psma_api.engines.planner_v1 import plan_v1
+from psma_api.main import app
+from psma_api.models.planning import PlanDeltaRequestV1, PlanRequestV1
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _assessment(title_id: str, service_id: str, **extra: object) -> dict:
+    return {
+        "title_id": title_id,
+        "country": "US",
+        "service_id": service_id,
+        "provider_category": "svod",
+        "availability_now": "true",
+        "confidence": "high",
+        "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+        "evidence": [{"source_id": "tmdb_watch_providers", "retrieved_at": "2026-01-01T00:00:00Z"}],
+        **extra,
+    }
+
+
+def _base_request() -> dict:
+    return {
+        "country": "US",
+        "horizon_days": 90,
+        "inputs": [
+            {"key": key, "service_id": service_id, "value": 30}
+            for service_id in ("hulu", "netflix")
+            for key in ("min_contract_days", "estimated_watch_days")
+        ],
+        "assessments": [
+            _assessment("tmdb:tv:1", "netflix"),
+            _assessment("tmdb:tv:2", "hulu"),
+            _assessment("tmdb:tv:3", "max"),
+        ],
+    }
+
+
+def test_delta_matches_full_replan_for_affected_services() -> None:
+    base_request = PlanRequestV1.model_validate(_base_request())
+    delta = PlanDeltaRequestV1.model_validate(
+        {
+            "previous": base_request.model_dump(mode="json"),
+            "upsert_assessments": [
+                _assessment(
+                    "tmdb:tv:4",
+                    "netflix",
+                    availability_now="false",
+                    availability_window={"start": "2026-03-02T00:00:00Z"},
+                )
+            ],
+            "remove_assessments": [{"title_id": "tmdb:tv:2", "country": "US", "service_id": "hulu"}],
+            "upsert_inputs": [{"key": "min_contract_days", "service_id": "max", "value": 7}],
+        }
+    )
+    state, resp = plan_delta(PlanState.from_request(base_request, now=NOW), delta, token="t1", base_token=None)
+
+    assert resp.affected_service_ids == ["hulu", "max", "netflix"]
+
+    updated = _base_request()
+    updated["assessments"] = [
+        updated["assessments"][0],
+        updated["assessments"][2],
+        *delta.model_dump(mode="json")["upsert_assessments"],
+    ]
+    updated["inputs"].append({"key": "min_contract_days", "service_id": "max", "value": 7})
+    before = plan_v1(base_request, now=NOW)
+    after = plan_v1(PlanRequestV1.model_validate(updated), now=NOW)
+
+    assert resp.events_added == [e for e in after.events if e not in before.events]
+    assert resp.events_removed == [e for e in before.events if e not in after.events]
+    assert resp.questions_removed == ["max:min_contract_days"]
+    assert resp.questions_added == []
+    assert {e.service_id for e in resp.events_removed} == {"hulu"}
+
+
+def test_unaffected_services_are_shared_not_replanned() -> None:
+    base = PlanState.from_request(PlanRequestV1.model_validate(_base_request()), now=NOW)
+    delta = PlanDeltaRequestV1.model_validate(
+        {"plan_token": "t0", "upsert_inputs": [{"key": "estimated_watch_days", "service_id": "netflix", "value": 3}]}
+    )
+    state, resp = plan_delta(base, delta, token="t1", base_token="t0")
+
+    assert resp.affected_service_ids == ["netflix"]
+    assert state.services["hulu"] is base.services["hulu"]
+    assert state.services["netflix"] is not base.services["netflix"]
+    # The base state is untouched, so its token keeps working.
+    assert base.services["netflix"].inputs != state.services["netflix"].inputs
+    # netflix: watch days 30 -> 3, but the 30-day minimum keeps the same dates.
+    assert resp.events_added == resp.events_removed == []
+
+
+def test_cross_service_inputs_affect_services_carrying_the_title() -> None:
+    request = _base_request()
+    request["assessments"].append(_assessment("tmdb:tv:1", "hulu"))
+    base = PlanState.from_request(PlanRequestV1.model_validate(request), now=NOW)
+    delta = PlanDeltaRequestV1.model_validate(
+        {
+            "plan_token": "t0",
+            "upsert_inputs": [{"key": "estimated_watch_days", "title_ids": ["tmdb:tv:1"], "value": 45}],
+            "permanent_service_ids": ["max"],
+        }
+    )
+    _, resp = plan_delta(base, delta, token="t1", base_token="t0")
+
+    assert resp.affected_service_ids == ["hulu", "max", "netflix"]
+    assert {(e.service_id, e.action) for e in resp.events_removed} == {
+        ("hulu", "unsubscribe"),
+        ("netflix", "unsubscribe"),
+        ("max", "subscribe"),
+    }
+    assert {(e.service_id, e.action) for e in resp.events_added} == {
+        ("hulu", "unsubscribe"),
+        ("netflix", "unsubscribe"),
+    }
+    assert "max:min_contract_days" in resp.questions_removed
+
+
+def test_delta_route_issues_tokens_and_rejects_unknown_ones() -> None:
+    with TestClient(app) as client:
+        first = client.post(
+            "/plan/v1/delta",
+            json={
+                "previous": _base_request(),
+                "previous_generated_at": "2026-01-01T00:00:00Z",
+                "remove_assessments": [{"title_id": "tmdb:tv:1", "country": "US", "service_id": "netflix"}],
+            },
+        )
+        assert first.status_code == 200
+        body = first.json()
+        assert body["generated_at"] == "2026-01-01T00:00:00Z"
+        assert body["affected_service_ids"] == ["netflix"]
+        assert [e["action"] for e in body["events_removed"]] == ["subscribe", "unsubscribe"]
+
+        second = client.post(
+            "/plan/v1/delta",
+            json={"plan_token": body["plan_token"], "upsert_assessments": [_assessment("tmdb:tv:1", "netflix")]},
+        )
+        assert second.status_code == 200
+        assert second.json()["base_plan_token"] == body["plan_token"]
+        assert second.json()["events_added"] == body["events_removed"]
+
+        assert client.post("/plan/v1/delta", json={"plan_token": "nope"}).status_code == 409
+        assert client.post("/plan/v1/delta", json={}).status_code == 422
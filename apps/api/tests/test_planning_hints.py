@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+
+from psma_api.cache import ExpiringCache
+from psma_api.engines.availability_engine_impl import DefaultAvailabilityEngine
+from psma_api.engines.planning_hints_tvmaze import PlanningHintsEngine, derive_planning_hints
+from psma_api.models.availability import PlanningHintsV1
+
+
+def _episodes(season: int, stamps: list[datetime]) -> list[dict[str, Any]]:
+    return [{"season": season, "number": i + 1, "airstamp": s.isoformat()} for i, s in enumerate(stamps)]
+
+
+T0 = datetime(2026, 3, 1, 1, 0, tzinfo=timezone.utc)
+
+
+def test_derive_cadence() -> None:
+    weekly = {
+        "status": "Running",
+        "_embedded": {
+            "episodes": _episodes(1, [T0] * 8) + _episodes(2, [T0 + timedelta(days=7 * i) for i in range(4)]),
+            "previousepisode": {"airstamp": (T0 + timedelta(days=21)).isoformat()},
+            "nextepisode": {"airstamp": (T0 + timedelta(days=28)).isoformat()},
+        },
+    }
+    hints = derive_planning_hints(weekly)
+    assert hints.cadence == "weekly"
+    assert hints.next_air_time == T0 + timedelta(days=28)
+    assert hints.last_air_time == T0 + timedelta(days=21)
+
+    batch = {"status": "Running", "_embedded": {"episodes": _episodes(1, [T0] * 8)}}
+    assert derive_planning_hints(batch).cadence == "batch"
+
+    ended = {"status": "Ended", "_embedded": {"episodes": _episodes(1, [T0, T0 + timedelta(days=7)])}}
+    assert derive_planning_hints(ended).cadence == "ended"
+
+    assert derive_planning_hints({"status": "Running"}) == PlanningHintsV1(cadence="unknown")
+
+
+def test_engine_attaches_hints_and_caches_until_next_air_time() -> None:
+    next_air = datetime.now(timezone.utc) + timedelta(hours=2)
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path == "/3/tv/1396/watch/providers":
+            return httpx.Response(200, json={"results": {"US": {"flatrate": [{"provider_id": 8}]}}})
+        if request.url.path == "/3/tv/1396/external_ids":
+            return httpx.Response(200, json={"tvdb_id": 81189, "imdb_id": "tt0903747"})
+        if request.url.path == "/lookup/shows":
+            assert request.url.params.get("thetvdb") == "81189"
+            return httpx.Response(200, json={"id": 169})
+        assert request.url.path == "/shows/169"
+        assert request.url.params.get_list("embed[]") == ["episodes", "nextepisode", "previousepisode"]
+        return httpx.Response(
+            200,
+            json={
+                "status": "Running",
+                "_embedded": {
+                    "episodes": _episodes(1, [next_air - timedelta(days=7 * i) for i in (3, 2, 1)]),
+                    "nextepisode": {"airstamp": next_air.isoformat()},
+                },
+            },
+        )
+
+    now = [datetime.now(timezone.utc).timestamp()]
+    cache: ExpiringCache[int, PlanningHintsV1] = ExpiringCache(clock=lambda: now[0])
+    engine = PlanningHintsEngine(DefaultAvailabilityEngine(), cache)
+
+    async def assess() -> Any:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await engine.assess_tmdb_tv_watch_providers_v1(
+                series_id=1396, country="US", api_key="k", client=client
+            )
+
+    resp = asyncio.run(assess())
+    hints = resp.assessments[0].planning_hints
+    assert hints.cadence == "weekly"
+    assert hints.next_air_time == next_air
+    assert calls.count("/shows/169") == 1
+
+    # Before the next episode airs the schedule is served from cache.
+    asyncio.run(assess())
+    assert calls.count("/shows/169") == 1
+
+    # Once it has aired, the cached schedule is stale and refetched.
+    now[0] = next_air.timestamp() + 1
+    asyncio.run(assess())
+    assert calls.count("/shows/169") == 2
+
+
+def test_engine_without_tvmaze_match_returns_plain_assessments() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/watch/providers"):
+            return httpx.Response(200, json={"results": {"US": {"flatrate": [{"provider_id": 8}]}}})
+        if request.url.path.endswith("/external_ids"):
+            return httpx.Response(200, json={"tvdb_id": 1, "imdb_id": None})
+        return httpx.Response(404, json={})
+
+    engine = PlanningHintsEngine(DefaultAvailabilityEngine(), ExpiringCache())
+
+    async def assess() -> Any:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await engine.assess_tmdb_tv_watch_providers_v1(series_id=1, country="US", api_key="k", client=client)
+
+    resp = asyncio.run(assess())
+    assert resp.assessments[0].planning_hints is None
+
+
+def test_engine_drops_hints_on_malformed_or_late_lookups() -> None:
+    mode = ["not_json"]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/watch/providers"):
+            return httpx.Response(200, json={"results": {"US": {"flatrate": [{"provider_id": 8}]}}})
+        if request.url.path.endswith("/external_ids"):
+            if mode[0] == "not_json":
+                return httpx.Response(200, content=b"<html>maintenance</html>")
+            return httpx.Response(200, json={"tvdb_id": 1})
+        if request.url.path == "/lookup/shows":
+            return httpx.Response(200, json={"id": 7})
+        if mode[0] == "slow":
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"status": "Running", "_embedded": ["not", "an", "object"]})
+
+    engine = PlanningHintsEngine(DefaultAvailabilityEngine(), ExpiringCache(), deadline_seconds=0.05)
+
+    async def assess() -> Any:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await engine.assess_tmdb_tv_watch_providers_v1(series_id=1, country="US", api_key="k", client=client)
+
+    for mode[0] in ("not_json", "bad_embedded", "slow"):
+        resp = asyncio.run(assess())
+        assert [a.service_id for a in resp.assessments] == ["netflix"], mode[0]
+        assert resp.assessments[0].planning_hints is None, mode[0]
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from pathlib import Path
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import time
 
 from fastapi.testclient import TestClient
 from jsonschema import validate
 
+from psma_api.engines.planner_v1 import PlannerPolicy, plan_v1
 from psma_api.main import app
+from psma_api.models.planning import PlanRequestV1, PlanResponseV1
 
 
 def _repo_root() -> Path:
@@ -210,3 +213,134 @@ def test_planning_v1_emits_unsubscribe_when_inputs_present() -> None:
 
     # Inputs are sufficient; questions should be omitted (or empty).
     assert body.get("questions") in (None, [])
+
+
+def _assessment(title_id: str, service_id: str, **extra: object) -> dict:
+    return {
+        "title_id": title_id,
+        "country": "US",
+        "service_id": service_id,
+        "provider_category": "svod",
+        "availability_now": "true",
+        "confidence": "high",
+        "reason_codes": ["TMDB_WATCH_PROVIDER_PRESENT"],
+        "evidence": [{"source_id": "tmdb_watch_providers", "retrieved_at": "2026-01-01T00:00:00Z"}],
+        **extra,
+    }
+
+
+def _events(body: PlanResponseV1) -> list[tuple[str, str, int]]:
+    now = body.generated_at
+    return [(e.action, e.service_id, (e.effective_at - now).days) for e in body.events]
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_planning_v1_merges_window_intervals_and_splits_long_gaps() -> None:
+    request = PlanRequestV1.model_validate(
+        {
+            "country": "US",
+            "horizon_days": 120,
+            "inputs": [
+                {"key": "min_contract_days", "service_id": "hulu", "value": 7},
+                {"key": "estimated_watch_days", "service_id": "hulu", "value": 5},
+                {"key": "estimated_watch_days", "service_id": "hulu", "title_ids": ["tmdb:tv:2"], "value": 2},
+            ],
+            "assessments": [
+                # [0, 7) after the billing minimum.
+                _assessment("tmdb:tv:1", "hulu"),
+                # Opens on day 8 -> [8, 10): within the 1-day merge gap of day 7.
+                _assessment(
+                    "tmdb:tv:2", "hulu", availability_now="false", availability_window={"start": "2026-01-09T00:00:00Z"}
+                ),
+                # Opens on day 60 -> a separate subscription; the 5-day estimate is
+                # capped at the window end (day 61) + 1 day buffer, then extended
+                # to the 7-day billing minimum.
+                _assessment(
+                    "tmdb:tv:3",
+                    "hulu",
+                    availability_now="false",
+                    availability_window={"start": "2026-03-02T00:00:00Z", "end": "2026-03-03T00:00:00Z"},
+                ),
+                # Already gone: ignored.
+                _assessment("tmdb:tv:4", "hulu", availability_window={"end": "2025-12-01T00:00:00Z"}),
+            ],
+        }
+    )
+    body = plan_v1(request, now=NOW)
+
+    assert _events(body) == [
+        ("subscribe", "hulu", 0),
+        ("unsubscribe", "hulu", 10),
+        ("subscribe", "hulu", 60),
+        ("unsubscribe", "hulu", 67),
+    ]
+    assert body.events[0].title_ids == ["tmdb:tv:1", "tmdb:tv:2"]
+    assert body.events[2].title_ids == ["tmdb:tv:3"]
+    assert "subscribe_at_availability_window_start" in (body.events[2].assumptions or [])
+    assert "unsubscribe_buffer_applied" in (body.events[3].assumptions or [])
+    assert body.questions is None
+
+
+def test_planning_v1_bridges_gaps_cheaper_than_a_new_billing_period() -> None:
+    request = PlanRequestV1.model_validate(
+        {
+            "country": "US",
+            "horizon_days": 90,
+            "inputs": [
+                {"key": "min_contract_days", "service_id": "max", "value": 30},
+                {"key": "estimated_watch_days", "service_id": "max", "value": 3},
+            ],
+            "assessments": [
+                _assessment("tmdb:tv:1", "max"),
+                # Starts 10 days after the first billing period ends: re-subscribing
+                # would cost 30 days, bridging costs 13.
+                _assessment(
+                    "tmdb:tv:2", "max", availability_now="false", availability_window={"start": "2026-02-10T00:00:00Z"}
+                ),
+            ],
+        }
+    )
+    assert _events(plan_v1(request, now=NOW)) == [("subscribe", "max", 0), ("unsubscribe", "max", 43)]
+
+    narrow = plan_v1(request, now=NOW, policy=PlannerPolicy(merge_gap_days=0))
+    assert _events(narrow) == _events(plan_v1(request, now=NOW))
+
+    # With no billing minimum, two short subscriptions are fewer days.
+    request.inputs[0].value = 1
+    assert _events(plan_v1(request, now=NOW)) == [
+        ("subscribe", "max", 0),
+        ("unsubscribe", "max", 3),
+        ("subscribe", "max", 40),
+        ("unsubscribe", "max", 43),
+    ]
+
+
+def test_planning_v1_scales_to_tens_of_thousands_of_titles() -> None:
+    request = PlanRequestV1.model_validate(
+        {
+            "country": "US",
+            "horizon_days": 365,
+            "inputs": [
+                {"key": key, "service_id": f"service-{s}", "value": 30}
+                for s in range(20)
+                for key in ("min_contract_days", "estimated_watch_days")
+            ],
+            "assessments": [
+                _assessment(
+                    f"tmdb:tv:{i}",
+                    f"service-{i % 20}",
+                    availability_now="false",
+                    availability_window={"start": (NOW + timedelta(days=i % 300 + 1)).isoformat()},
+                )
+                for i in range(20_000)
+            ],
+        }
+    )
+    start = time.perf_counter()
+    body = plan_v1(request, now=NOW)
+    elapsed = time.perf_counter() - start
+
+    assert {e.service_id for e in body.events} == {f"service-{s}" for s in range(20)}
+    assert elapsed < 1.0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+import json
 
 import httpx
 from fastapi.testclient import TestClient
@@ -265,3 +266,82 @@ def test_tmdb_discover_tv_by_genre() -> None:
     finally:
         app.dependency_overrides.clear()
         settings.tmdb_api_key = prior
+
+
+def test_tmdb_discover_stream_crawls_pages_and_dedupes() -> None:
+    prior = settings.tmdb_api_key
+    settings.tmdb_api_key = "test-key"
+    pages_seen: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/3/discover/tv"
+        assert request.url.params.get("with_watch_providers") == "8"
+        page = int(request.url.params["page"])
+        pages_seen.append(page)
+        if page == 3:
+            return httpx.Response(500, json={"status_message": "boom"})
+        # Page 2 repeats show 2 from page 1 (pagination drift).
+        results = [{"id": page * 10}, {"id": 2}] if page <= 2 else [{"id": page * 10}]
+        return httpx.Response(200, json={"page": page, "total_pages": 10, "total_results": 200, "results": results})
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        client = TestClient(app)
+        resp = client.get(
+            "/providers/tmdb/discover/tv/stream",
+            params={"watch_provider_id": 8, "country": "US", "max_pages": 4},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+
+        assert lines[0]["type"] == "meta"
+        assert lines[0]["pages_requested"] == 4
+        assert lines[0]["attribution"]["required"] is True
+        items = sorted(line["data"]["id"] for line in lines if line["type"] == "item")
+        assert items == [2, 10, 20, 40]
+        errors = [line for line in lines if line["type"] == "error"]
+        assert errors == [{"type": "error", "page": 3, "message": "TMDB returned an error", "upstream_status": 500}]
+        assert lines[-1] == {"type": "summary", "pages_fetched": 3, "items": 4, "duplicates": 1, "errors": 1}
+        assert sorted(pages_seen) == [1, 2, 3, 4]
+    finally:
+        app.dependency_overrides.clear()
+        settings.tmdb_api_key = prior
+
+
+def test_tmdb_discover_stream_reports_non_json_pages() -> None:
+    prior = settings.tmdb_api_key
+    settings.tmdb_api_key = "test-key"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == 2:
+            return httpx.Response(200, content=b"<html>try again</html>", headers={"content-type": "text/html"})
+        return httpx.Response(200, json={"page": page, "total_pages": 3, "results": [{"id": page}]})
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        client = TestClient(app)
+        resp = client.get("/providers/tmdb/discover/tv/stream", params={"watch_provider_id": 8, "country": "US"})
+        assert resp.status_code == 200
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+
+        errors = [line for line in lines if line["type"] == "error"]
+        assert errors == [{"type": "error", "page": 2, "message": "TMDB returned invalid JSON", "upstream_status": 200}]
+        assert sorted(line["data"]["id"] for line in lines if line["type"] == "item") == [1, 3]
+        assert lines[-1] == {"type": "summary", "pages_fetched": 2, "items": 2, "duplicates": 0, "errors": 1}
+    finally:
+        app.dependency_overrides.clear()
+        settings.tmdb_api_key = prior
@@ -70,3 +70,36 @@ def test_tvmaze_get_show_with_embed() -> None:
         assert body["data"]["_embedded"]["episodes"] == []
     finally:
         app.dependency_overrides.clear()
+
+
+def test_tvmaze_get_show_raw_passthrough() -> None:
+    upstream = {"id": 1, "name": "Girls", "_embedded": {"episodes": [{"id": 10, "name": "Pilot"}]}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/shows/404":
+            return httpx.Response(404, json={"status": 404})
+        return httpx.Response(200, json=upstream)
+
+    transport = httpx.MockTransport(handler)
+
+    async def override_client() -> AsyncIterator[httpx.AsyncClient]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+
+    app.dependency_overrides[get_http_client] = override_client
+    try:
+        client = TestClient(app)
+        resp = client.get("/providers/tvmaze/shows/1", params={"embed": "episodes", "raw": "true"})
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["provider"] == "tvmaze"
+        assert body["request"] == {"show_id": 1, "embed": "episodes", "url": "https://api.tvmaze.com/shows/1"}
+        assert body["attribution"]["required"] is True
+        assert body["data"] == upstream
+        assert "retrieved_at" in body
+
+        resp = client.get("/providers/tvmaze/shows/404", params={"raw": "true"})
+        assert resp.status_code == 502
+        assert resp.json()["detail"]["upstream_status"] == 404
+    finally:
+        app.dependency_overrides.clear()
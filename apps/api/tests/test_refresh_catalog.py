@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+
+from psma_api.refresh_catalog import RefreshSummary, refresh_catalog
+from psma_api.snapshot_store import AvailabilitySnapshotStore
+
+
+def _run(store: AvailabilitySnapshotStore, payloads: dict[int, Any], *, resume: bool = True) -> tuple[RefreshSummary, list[dict]]:
+    events: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        series_id = int(request.url.path.split("/")[3])
+        if series_id not in payloads:
+            return httpx.Response(404, json={})
+        if isinstance(payloads[series_id], bytes):
+            return httpx.Response(200, content=payloads[series_id])
+        return httpx.Response(200, json={"id": series_id, "results": payloads[series_id]})
+
+    async def scenario() -> RefreshSummary:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await refresh_catalog(
+                series_ids=[1, 2, 3],
+                country="US",
+                store=store,
+                client=client,
+                api_key="k",
+                concurrency=2,
+                chunk_size=2,
+                resume=resume,
+                on_change=events.append,
+            )
+
+    return asyncio.run(scenario()), events
+
+
+def test_refresh_emits_only_changes_between_runs() -> None:
+    store = AvailabilitySnapshotStore(":memory:")
+    netflix = {"provider_id": 8, "provider_name": "Netflix"}
+    apple = {"provider_id": 350, "provider_name": "Apple TV+"}
+
+    summary, events = _run(
+        store,
+        {1: {"US": {"flatrate": [netflix]}}, 2: {"US": {"flatrate": [netflix, apple]}}},
+    )
+    assert (summary.series_ok, summary.series_failed, summary.added) == (2, 1, 3)
+    assert {e["change"] for e in events} == {"added"}
+
+    # Same data again: nothing to report (retrieved_at differs but is not content).
+    summary, events = _run(
+        store,
+        {1: {"US": {"flatrate": [netflix]}}, 2: {"US": {"flatrate": [netflix, apple]}}},
+        resume=False,
+    )
+    assert events == []
+
+    # Series 1 moves to ads-supported; series 2 loses Apple TV+.
+    summary, events = _run(
+        store,
+        {1: {"US": {"ads": [netflix]}}, 2: {"US": {"flatrate": [netflix]}}},
+        resume=False,
+    )
+    changes = sorted((e["change"], e["key"]["title_id"], e["key"]["service_id"]) for e in events)
+    assert changes == [("changed", "tmdb:tv:1", "netflix"), ("removed", "tmdb:tv:2", "apple-tv-plus")]
+    assert [a.service_id for a in store.load_series(2)] == ["netflix"]
+
+
+def test_refresh_resumes_unfinished_run() -> None:
+    store = AvailabilitySnapshotStore(":memory:")
+    run_id, done = store.start_or_resume_run(country="US", resume=True)
+    assert done == set()
+    store.apply_series(run_id=run_id, series_id=1, upserts=[], removed=[])
+
+    summary, _ = _run(store, {2: {}, 3: {}})
+    assert summary.run_id == run_id
+    assert summary.series_skipped == 1
+    assert summary.series_ok == 2
+
+
+def test_refresh_marks_undecodable_payloads_failed() -> None:
+    store = AvailabilitySnapshotStore(":memory:")
+    netflix = {"provider_id": 8, "provider_name": "Netflix"}
+
+    summary, events = _run(store, {1: b"<html>gateway error</html>", 2: {"US": {"flatrate": [netflix]}}})
+    assert (summary.series_ok, summary.series_failed) == (1, 2)
+    assert [e["series_id"] for e in events] == [2]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import httpx
+import pytest
+
+from psma_api.deps import build_http_client
+from psma_api.models.providers import Attribution, ProviderEnvelope
+from psma_api.models.planning import PlanEventV1, PlanResponseV1
+from psma_api.responses import ModelJSONResponse, send_upstream_stream
+from psma_api.settings import settings
+
+
+def test_model_json_response_matches_response_model_output() -> None:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    plan = PlanResponseV1(
+        generated_at=now,
+        country="US",
+        horizon_days=30,
+        events=[
+            PlanEventV1(action="subscribe", service_id="netflix", effective_at=now, reason_codes=["X"], title_ids=["t"])
+        ],
+    )
+    envelope = ProviderEnvelope(
+        provider="tvmaze",
+        retrieved_at=now,
+        attribution=Attribution(text="Data from TVmaze"),
+        data={"id": 1, "network": None},
+    )
+
+    app = FastAPI()
+
+    @app.get("/plan/validated", response_model=PlanResponseV1, response_model_exclude_none=True)
+    async def plan_validated() -> Any:
+        return plan
+
+    @app.get("/plan/fast", response_model=PlanResponseV1, response_model_exclude_none=True)
+    async def plan_fast() -> Any:
+        return ModelJSONResponse(plan, exclude_none=True)
+
+    @app.get("/envelope/validated", response_model=ProviderEnvelope)
+    async def envelope_validated() -> Any:
+        return envelope
+
+    @app.get("/envelope/fast", response_model=ProviderEnvelope)
+    async def envelope_fast() -> Any:
+        return ModelJSONResponse(envelope)
+
+    client = TestClient(app)
+    for name in ("plan", "envelope"):
+        validated = client.get(f"/{name}/validated")
+        fast = client.get(f"/{name}/fast")
+        assert fast.headers["content-type"] == "application/json"
+        assert fast.json() == validated.json()
+
+    # None inside envelope data is preserved; None model fields are dropped only when asked.
+    assert client.get("/envelope/fast").json()["data"] == {"id": 1, "network": None}
+    assert "questions" not in client.get("/plan/fast").json()
+
+
+def test_send_upstream_stream_is_not_buffered_by_the_client_stack(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "http_coalesce_requests", True)
+    monkeypatch.setattr(settings, "http_cache_enabled", True)
+    pulled: list[bytes] = []
+
+    async def upstream_body() -> AsyncIterator[bytes]:
+        for chunk in (b'{"id": 1,', b' "name": "Girls"}'):
+            pulled.append(chunk)
+            yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"cache-control": "max-age=600"}, content=upstream_body())
+
+    async def scenario() -> tuple[list[bytes], bytes]:
+        async with build_http_client(transport=httpx.MockTransport(handler)) as client:
+            resp = await send_upstream_stream(client, "https://api.tvmaze.com/shows/1", {})
+            try:
+                before = list(pulled)
+                body = b"".join([chunk async for chunk in resp.aiter_bytes()])
+            finally:
+                await resp.aclose()
+            return before, body
+
+    before, body = asyncio.run(scenario())
+    # Neither the coalescing nor the caching transport read the body before the caller did.
+    assert before == []
+    assert body == b'{"id": 1, "name": "Girls"}'
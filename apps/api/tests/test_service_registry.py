@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from psma_api import service_registry
+from psma_api.service_registry import (
+    ServiceRegistry,
+    ServiceRegistryReloader,
+    get_service_registry,
+    load_service_registry,
+    set_service_registry,
+    tmdb_provider_id_to_service,
+)
+from psma_api.settings import settings
+
+
+def _write(path: Path, services: list[dict], *, mtime_ns: int) -> None:
+    path.write_text(json.dumps({"version": 1, "services": services}), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def restore_registry():
+    prior = get_service_registry()
+    yield
+    set_service_registry(prior)
+
+
+def test_indexes(tmp_path: Path) -> None:
+    path = tmp_path / "registry.json"
+    _write(
+        path,
+        [
+            {"service_id": "netflix", "category": "svod", "external_ids": {"tmdb_watch_provider_id": [8, 1796]}},
+            {"service_id": "pluto", "category": "avod", "external_ids": {"justwatch_id": "plt"}},
+            {"service_id": "broken", "category": "nope"},
+            {"display_name": "no id"},
+        ],
+        mtime_ns=1_000_000_000,
+    )
+    registry = ServiceRegistry.from_file(path)
+
+    assert [e.service_id for e in registry.entries] == ["netflix", "pluto", "broken"]
+    assert registry.get("netflix").tmdb_watch_provider_ids == (8, 1796)
+    assert registry.by_external_id("tmdb_watch_provider_id", 1796).service_id == "netflix"
+    assert registry.by_external_id("justwatch_id", "plt").service_id == "pluto"
+    assert registry.by_external_id("missing", 1) is None
+    assert [e.service_id for e in registry.by_category("unknown")] == ["broken"]
+
+
+def test_legacy_accessors_use_active_registry(restore_registry: None) -> None:
+    assert tmdb_provider_id_to_service()[8].service_id == "netflix"
+    assert any(e.service_id == "youtube-tv" for e in load_service_registry())
+
+
+def test_lazy_load_and_reloader_honour_configured_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "registry.json"
+    _write(path, [{"service_id": "hulu", "category": "svod"}], mtime_ns=1_000_000_000)
+    monkeypatch.setattr(settings, "service_registry_path", str(path))
+    monkeypatch.setattr(service_registry, "_active", None)
+
+    assert [e.service_id for e in get_service_registry().entries] == ["hulu"]
+    assert ServiceRegistryReloader().path == path
+
+
+def test_reload_swaps_registry_only_when_file_changes(tmp_path: Path, restore_registry: None) -> None:
+    path = tmp_path / "registry.json"
+    _write(path, [{"service_id": "netflix", "category": "svod"}], mtime_ns=1_000_000_000)
+    reloader = ServiceRegistryReloader(path, poll_seconds=0)
+    first = reloader.load()
+
+    async def scenario() -> None:
+        assert await reloader.reload_if_changed() is False
+        assert get_service_registry() is first
+
+        _write(
+            path,
+            [{"service_id": "hulu", "category": "svod", "external_ids": {"tmdb_watch_provider_id": [15]}}],
+            mtime_ns=2_000_000_000,
+        )
+        assert await reloader.reload_if_changed() is True
+        assert tmdb_provider_id_to_service()[15].service_id == "hulu"
+
+        # A broken edit keeps serving the last good registry.
+        path.write_text("{not json", encoding="utf-8")
+        os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+        assert await reloader.reload_if_changed() is False
+        assert get_service_registry().get("hulu") is not None
+
+    asyncio.run(scenario())